@@ -8,12 +8,27 @@ Each module has its own payload structure and API integration:
 - gemini.py: Google Gemini API
 - lmstudio.py: LM Studio Local API (OpenAI-compatible)
 - openai.py: OpenAI API
+
+Submodules are loaded lazily (PEP 562): each one pulls in a heavy provider
+SDK, so importing all four eagerly costs hundreds of milliseconds and tens
+of MB of memory even when the user only ever uses one provider. The first
+attribute access imports the requested module and caches it in globals().
 """
 
-from . import claude
-from . import gemini
-from . import lmstudio
-from . import openai
+import importlib
+
+_SUBMODULES = {'claude', 'gemini', 'lmstudio', 'openai'}
+
+__all__ = sorted(_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = ['claude', 'gemini', 'lmstudio', 'openai']
 
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
@@ -25,6 +25,21 @@ from typing import Dict, List, Tuple
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# One client per API key, reused across requests: the SDK keeps a pooled
+# HTTP connection alive, so reuse skips a fresh TCP+TLS handshake per call
+_client_cache: Dict[str, anthropic.Anthropic] = {}
+
+
+def _get_client(api_key: str) -> anthropic.Anthropic:
+    """
+    Returns the cached client for this API key, creating it on first use.
+    Internal function - not called from outside this module.
+    """
+    client = _client_cache.get(api_key)
+    if client is None:
+        client = _client_cache[api_key] = anthropic.Anthropic(api_key=api_key)
+    return client
+
 # Hardcoded list of available Claude models
 AVAILABLE_MODELS = [
     "claude-sonnet-4-5-20250929",  # Claude Sonnet 4.5
@@ -81,8 +96,8 @@ def format_resume(
     if model_name not in AVAILABLE_MODELS:
         raise ValueError(f"Invalid model name: {model_name}. Must be one of {AVAILABLE_MODELS}")
     
-    # Initialize Anthropic client
-    client = anthropic.Anthropic(api_key=api_key)
+    # Reuse the pooled client for this API key
+    client = _get_client(api_key)
     
     # Construct user message with format template and extracted text
     user_message = _build_user_message(latex_format, extracted_text)
@@ -130,6 +145,69 @@ def format_resume(
         raise Exception(f"Unexpected error in Claude API call: {str(e)}") from e
 
 
+def format_resume_stream(
+    api_key: str,
+    model_name: str,
+    system_prompt: str,
+    latex_format: str,
+    extracted_text: str
+):
+    """
+    Streaming variant of format_resume: yields response text chunks as
+    they arrive instead of waiting for the full message.
+    
+    CALLED BY: main.py when the client asked for a streamed response
+    
+    YIELDS TO main.py:
+        - Text chunks of the LaTeX resume code, in order
+    
+    RAISES:
+        - Same exceptions as format_resume
+    """
+    logger.info(f"[AI REQUEST] Claude format_resume_stream() called with model: {model_name}")
+    
+    # Validate model name
+    if model_name not in AVAILABLE_MODELS:
+        raise ValueError(f"Invalid model name: {model_name}. Must be one of {AVAILABLE_MODELS}")
+    
+    # Reuse the pooled client for this API key
+    client = _get_client(api_key)
+    
+    # Construct user message with format template and extracted text
+    user_message = _build_user_message(latex_format, extracted_text)
+    
+    try:
+        logger.info(f"[AI REQUEST] Making streaming Claude API call to {model_name} with temperature {TEMPERATURE}")
+        with client.messages.stream(
+            model=model_name,
+            max_tokens=16000,
+            temperature=TEMPERATURE,
+            system=system_prompt,
+            messages=[
+                {
+                    "role": "user",
+                    "content": user_message
+                }
+            ]
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+        
+        logger.info(f"[AI RESPONSE] Claude streaming call to {model_name} completed")
+        
+    except anthropic.APIError as e:
+        logger.error(f"[AI ERROR] Claude API Error for {model_name}: {str(e)}")
+        raise Exception(f"Claude API Error: {str(e)}") from e
+    
+    except anthropic.AuthenticationError as e:
+        logger.error(f"[AI ERROR] Claude Authentication Error for {model_name}: {str(e)}")
+        raise Exception(f"Authentication Error: Invalid API key - {str(e)}") from e
+    
+    except anthropic.RateLimitError as e:
+        logger.error(f"[AI ERROR] Claude Rate Limit Error for {model_name}: {str(e)}")
+        raise Exception(f"Rate Limit Error: {str(e)}") from e
+
+
 def _build_user_message(latex_format: str, extracted_text: str) -> str:
     """
     Constructs the user message combining LaTeX format template and extracted resume text.
@@ -177,8 +255,8 @@ def test_api_key(api_key: str, model_name: str) -> Tuple[bool, str]:
         raise ValueError(f"Invalid model name: {model_name}. Must be one of {AVAILABLE_MODELS}")
     
     try:
-        # Initialize Anthropic client
-        client = anthropic.Anthropic(api_key=api_key)
+        # Reuse the pooled client for this API key
+        client = _get_client(api_key)
         
         # Make minimal test API call
         logger.info(f"[API TEST] Making test Claude API call to {model_name}")
@@ -123,6 +123,76 @@ def format_resume(
             raise Exception(f"Unexpected error in Gemini API call: {error_message}") from e
 
 
+def format_resume_stream(
+    api_key: str,
+    model_name: str,
+    system_prompt: str,
+    latex_format: str,
+    extracted_text: str
+):
+    """
+    Streaming variant of format_resume: yields response text chunks as
+    they arrive instead of waiting for the full response.
+    
+    CALLED BY: main.py when the client asked for a streamed response
+    
+    YIELDS TO main.py:
+        - Text chunks of the LaTeX resume code, in order
+    
+    RAISES:
+        - Same exceptions as format_resume
+    """
+    logger.info(f"[AI REQUEST] Gemini format_resume_stream() called with model: {model_name}")
+    
+    # Validate model name
+    if model_name not in AVAILABLE_MODELS:
+        raise ValueError(f"Invalid model name: {model_name}. Must be one of {AVAILABLE_MODELS}")
+    
+    # Configure API key
+    genai.configure(api_key=api_key)
+    
+    # Construct user message with format template and extracted text
+    user_message = _build_user_message(latex_format, extracted_text)
+    
+    try:
+        logger.info(f"[AI REQUEST] Making streaming Gemini API call to {model_name} with temperature {TEMPERATURE}")
+        # Initialize model with generation config
+        model = genai.GenerativeModel(
+            model_name=model_name,
+            generation_config={
+                "temperature": TEMPERATURE,
+            },
+            system_instruction=system_prompt
+        )
+        
+        # Generate content as a chunk stream
+        response = model.generate_content(user_message, stream=True)
+        
+        for chunk in response:
+            # Chunks without parts (e.g. safety metadata) carry no text
+            if chunk.parts:
+                yield chunk.text
+        
+        logger.info(f"[AI RESPONSE] Gemini streaming call to {model_name} completed")
+        
+    except Exception as e:
+        # Handle various Gemini exceptions
+        error_message = str(e)
+        
+        if "API_KEY_INVALID" in error_message or "invalid API key" in error_message.lower():
+            logger.error(f"[AI ERROR] Gemini Authentication Error for {model_name}: {error_message}")
+            raise Exception(f"Authentication Error: Invalid API key - {error_message}") from e
+        elif "quota" in error_message.lower() or "rate" in error_message.lower():
+            logger.error(f"[AI ERROR] Gemini Rate Limit Error for {model_name}: {error_message}")
+            raise Exception(f"Rate Limit Error: {error_message}") from e
+        elif "permission" in error_message.lower():
+            logger.error(f"[AI ERROR] Gemini Permission Error for {model_name}: {error_message}")
+            raise Exception(f"Permission Error: {error_message}") from e
+        else:
+            logger.error(f"[AI ERROR] Unexpected error in Gemini API call for {model_name}: {error_message}")
+            raise Exception(f"Unexpected error in Gemini API call: {error_message}") from e
+
+
 def _build_user_message(latex_format: str, extracted_text: str) -> str:
     """
     Constructs the user message combining LaTeX format template and extracted resume text.
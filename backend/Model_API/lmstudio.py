@@ -26,11 +26,32 @@ NOTE:
 
 from openai import OpenAI
 import logging
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# One client per (api_key, base_url, timeout) tuple: LM Studio calls go
+# through the OpenAI SDK, whose client keeps its HTTP connection pooled
+_client_cache: Dict[Tuple[str, str, float], OpenAI] = {}
+
+
+def _get_client(api_key: str, base_url: str, timeout: float) -> OpenAI:
+    """
+    Returns the cached client for these settings, creating it on first use.
+    Internal function - not called from outside this module.
+    """
+    cache_key = (api_key, base_url, timeout)
+    client = _client_cache.get(cache_key)
+    if client is None:
+        client = _client_cache[cache_key] = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=1,  # Only retry once
+            timeout=timeout
+        )
+    return client
+
 # API Configuration
 TEMPERATURE = 0.4
 DEFAULT_BASE_URL = "http://localhost:1234/v1"
@@ -51,13 +72,8 @@ def get_available_models(api_key: str = "lm-studio", base_url: str = DEFAULT_BAS
         - Exception: If LM Studio is not running or connection fails
     """
     try:
-        # Initialize client to connect to local LM Studio with single retry
-        client = OpenAI(
-            api_key=api_key, 
-            base_url=base_url,
-            max_retries=1,  # Only retry once
-            timeout=5.0     # 5 second timeout
-        )
+        # Reuse the pooled client (5 second timeout for the listing)
+        client = _get_client(api_key, base_url, 5.0)
         
         # Fetch available models from LM Studio
         models = client.models.list()
@@ -115,13 +131,8 @@ def format_resume(
     if not model_name or not model_name.strip():
         raise ValueError("Model name is required for LM Studio")
     
-    # Initialize OpenAI client to communicate with LM Studio local server with single retry
-    client = OpenAI(
-        api_key=api_key, 
-        base_url=base_url,
-        max_retries=1,  # Only retry once
-        timeout=90.0    # 90 second timeout for AI operations
-    )
+    # Reuse the pooled client (90 second timeout for AI operations)
+    client = _get_client(api_key, base_url, 90.0)
 
     # Prepare combined user prompt (template + resume text)
     user_message = _build_user_message(latex_format, extracted_text)
@@ -158,6 +169,73 @@ def format_resume(
             raise Exception(f"Unexpected error in LM Studio API call: {str(e)}") from e
 
 
+def format_resume_stream(
+    api_key: str,
+    model_name: str,
+    system_prompt: str,
+    latex_format: str,
+    extracted_text: str,
+    base_url: str = DEFAULT_BASE_URL
+):
+    """
+    Streaming variant of format_resume: yields response text chunks as
+    they arrive instead of waiting for the full completion.
+    
+    CALLED BY: main.py when the client asked for a streamed response
+    
+    YIELDS TO main.py:
+        - Text chunks of the LaTeX resume code, in order
+    
+    RAISES:
+        - Same exceptions as format_resume
+    """
+    logger.info(f"[AI REQUEST] LM Studio format_resume_stream() called with model: {model_name}, base_url: {base_url}")
+    
+    # Validate model name
+    if not model_name or not model_name.strip():
+        raise ValueError("Model name is required for LM Studio")
+    
+    # Reuse the pooled client (90 second timeout for AI operations)
+    client = _get_client(api_key, base_url, 90.0)
+    
+    # Prepare combined user prompt (template + resume text)
+    user_message = _build_user_message(latex_format, extracted_text)
+    
+    try:
+        logger.info(f"[AI REQUEST] Making streaming LM Studio API call to {model_name} with temperature {TEMPERATURE}")
+        stream = client.chat.completions.create(
+            model=model_name,
+            temperature=TEMPERATURE,
+            stream=True,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ]
+        )
+        
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+        
+        logger.info(f"[AI RESPONSE] LM Studio streaming call to {model_name} completed")
+        
+    except Exception as e:
+        error_type = type(e).__name__
+        
+        if "AuthenticationError" in error_type:
+            logger.error(f"[AI ERROR] LM Studio Authentication Error for {model_name}: {str(e)}")
+            raise Exception(f"Authentication Error: Invalid API key - {str(e)}") from e
+        elif "RateLimitError" in error_type:
+            logger.error(f"[AI ERROR] LM Studio Rate Limit Error for {model_name}: {str(e)}")
+            raise Exception(f"Rate Limit Error: {str(e)}") from e
+        elif "APIError" in error_type:
+            logger.error(f"[AI ERROR] LM Studio API Error for {model_name}: {str(e)}")
+            raise Exception(f"LM Studio API Error: {str(e)}") from e
+        else:
+            logger.error(f"[AI ERROR] Unexpected error in LM Studio API call for {model_name}: {str(e)}")
+            raise Exception(f"Unexpected error in LM Studio API call: {str(e)}") from e
+
+
 def _build_user_message(latex_format: str, extracted_text: str) -> str:
     """
     Constructs the user message combining LaTeX format template and extracted resume text.
@@ -204,13 +282,8 @@ def test_api_key(api_key: str, model_name: str, base_url: str = DEFAULT_BASE_URL
         raise ValueError("Model name is required for LM Studio")
     
     try:
-        # Initialize OpenAI client to communicate with LM Studio local server
-        client = OpenAI(
-            api_key=api_key, 
-            base_url=base_url,
-            max_retries=1,  # Only retry once
-            timeout=10.0    # 10 second timeout for test
-        )
+        # Reuse the pooled client (10 second timeout for the test)
+        client = _get_client(api_key, base_url, 10.0)
         
         # Make minimal test API call
         logger.info(f"[API TEST] Making test LM Studio API call to {model_name}")
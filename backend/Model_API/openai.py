@@ -20,11 +20,26 @@ ERROR HANDLING:
 
 from openai import OpenAI
 import logging
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# One client per API key, reused across requests: the SDK keeps a pooled
+# HTTP connection alive, so reuse skips a fresh TCP+TLS handshake per call
+_client_cache: Dict[str, OpenAI] = {}
+
+
+def _get_client(api_key: str) -> OpenAI:
+    """
+    Returns the cached client for this API key, creating it on first use.
+    Internal function - not called from outside this module.
+    """
+    client = _client_cache.get(api_key)
+    if client is None:
+        client = _client_cache[api_key] = OpenAI(api_key=api_key)
+    return client
+
 # Hardcoded list of available OpenAI models
 AVAILABLE_MODELS = [
     "gpt-5-2025-08-07",              # GPT-5 - Most advanced reasoning model
@@ -82,7 +97,7 @@ def format_resume(
         raise ValueError(f"Invalid model name: {model_name}. Must be one of {AVAILABLE_MODELS}")
     
     # Initialize OpenAI client
-    client = OpenAI(api_key=api_key)
+    client = _get_client(api_key)
     
     # Construct user message with format template and extracted text
     user_message = _build_user_message(latex_format, extracted_text)
@@ -129,6 +144,79 @@ def format_resume(
             raise Exception(f"Unexpected error in OpenAI API call: {str(e)}") from e
 
 
+def format_resume_stream(
+    api_key: str,
+    model_name: str,
+    system_prompt: str,
+    latex_format: str,
+    extracted_text: str
+):
+    """
+    Streaming variant of format_resume: yields response text chunks as
+    they arrive instead of waiting for the full completion.
+    
+    CALLED BY: main.py when the client asked for a streamed response
+    
+    YIELDS TO main.py:
+        - Text chunks of the LaTeX resume code, in order
+    
+    RAISES:
+        - Same exceptions as format_resume
+    """
+    logger.info(f"[AI REQUEST] OpenAI format_resume_stream() called with model: {model_name}")
+    
+    # Validate model name
+    if model_name not in AVAILABLE_MODELS:
+        raise ValueError(f"Invalid model name: {model_name}. Must be one of {AVAILABLE_MODELS}")
+    
+    # Initialize OpenAI client
+    client = _get_client(api_key)
+    
+    # Construct user message with format template and extracted text
+    user_message = _build_user_message(latex_format, extracted_text)
+    
+    try:
+        logger.info(f"[AI REQUEST] Making streaming OpenAI API call to {model_name} with temperature {TEMPERATURE}")
+        stream = client.chat.completions.create(
+            model=model_name,
+            temperature=TEMPERATURE,
+            stream=True,
+            messages=[
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": user_message
+                }
+            ]
+        )
+        
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+        
+        logger.info(f"[AI RESPONSE] OpenAI streaming call to {model_name} completed")
+        
+    except Exception as e:
+        # Handle various OpenAI exceptions
+        error_type = type(e).__name__
+        
+        if "AuthenticationError" in error_type:
+            logger.error(f"[AI ERROR] OpenAI Authentication Error for {model_name}: {str(e)}")
+            raise Exception(f"Authentication Error: Invalid API key - {str(e)}") from e
+        elif "RateLimitError" in error_type:
+            logger.error(f"[AI ERROR] OpenAI Rate Limit Error for {model_name}: {str(e)}")
+            raise Exception(f"Rate Limit Error: {str(e)}") from e
+        elif "APIError" in error_type:
+            logger.error(f"[AI ERROR] OpenAI API Error for {model_name}: {str(e)}")
+            raise Exception(f"OpenAI API Error: {str(e)}") from e
+        else:
+            logger.error(f"[AI ERROR] Unexpected error in OpenAI API call for {model_name}: {str(e)}")
+            raise Exception(f"Unexpected error in OpenAI API call: {str(e)}") from e
+
+
 def _build_user_message(latex_format: str, extracted_text: str) -> str:
     """
     Constructs the user message combining LaTeX format template and extracted resume text.
@@ -177,7 +265,7 @@ def test_api_key(api_key: str, model_name: str) -> Tuple[bool, str]:
     
     try:
         # Initialize OpenAI client
-        client = OpenAI(api_key=api_key)
+        client = _get_client(api_key)
         
         # Make minimal test API call
         logger.info(f"[API TEST] Making test OpenAI API call to {model_name}")
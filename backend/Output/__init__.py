@@ -2,10 +2,27 @@
 Output package for Resumax Application
 
 Handles LaTeX processing and PDF generation from formatted resume code.
+
+Submodules are loaded lazily (PEP 562) so that importing the package costs
+nothing until pdfgenerator or section_selector is actually used - relevant
+for cold starts where only one of them is needed. pdfgenerator.warmup()
+can be called at server startup to pre-verify the LaTeX installation.
 """
 
-from . import section_selector
-from . import pdfgenerator
+import importlib
+
+_SUBMODULES = {'section_selector', 'pdfgenerator'}
+
+__all__ = sorted(_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = ['section_selector', 'pdfgenerator']
 
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
@@ -29,15 +29,298 @@ REQUIREMENTS:
     - OR system-installed pdflatex in PATH (Windows: MiKTeX or TeX Live)
 """
 
+import functools
+import hashlib
 import subprocess
 import tempfile
 import shutil
 import os
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Tuple
 
+# pdflatex is CPU-bound and single-threaded; each generate_pdf call already
+# runs it as its own OS process, so concurrent requests from the threaded
+# server naturally use separate cores. This semaphore adds backpressure so a
+# burst of requests cannot spawn more pdflatex processes than there are cores.
+_compile_slots = threading.BoundedSemaphore(os.cpu_count() or 2)
 
+# Suppress console windows for subprocesses on Windows (0 elsewhere)
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Maximum number of error lines reported from a failed compilation log
+_MAX_ERROR_LINES = 5
+
+# Compile timeout scaling: base seconds plus ~1 s per 2 KB of source,
+# clamped to a sane window. A hung pdflatex on a tiny resume fails fast
+# (freeing its semaphore slot) while large documents keep headroom.
+_TIMEOUT_FLOOR_SECONDS = 5
+_TIMEOUT_CEILING_SECONDS = 60
+_TIMEOUT_BYTES_PER_SECOND = 2000
+
+
+def _compile_timeout(source_length: int) -> float:
+    """Compute the per-pass pdflatex timeout budget for a document size"""
+    return max(
+        _TIMEOUT_FLOOR_SECONDS,
+        min(
+            _TIMEOUT_CEILING_SECONDS,
+            _TIMEOUT_FLOOR_SECONDS + source_length / _TIMEOUT_BYTES_PER_SECOND
+        )
+    )
+
+# Memoized result of the pdflatex --version probe (process-wide invariant)
+_pdflatex_verified = False
+_verify_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _fast_tmp_dir() -> Optional[str]:
+    """
+    Get the fastest available directory for compilation scratch space.
+
+    pdflatex writes dozens of intermediate files (.aux, .log, .out, .pdf)
+    per compile; putting them on a RAM-backed filesystem avoids disk
+    writeback entirely. Honors RESUMAX_TMPFS, falls back to /dev/shm on
+    Linux when writable, and returns None (system default temp) otherwise.
+    """
+    candidates = []
+    configured = os.environ.get("RESUMAX_TMPFS")
+    if configured:
+        candidates.append(configured)
+    candidates.append("/dev/shm")
+
+    for candidate in candidates:
+        if os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return candidate
+
+    return None  # tempfile picks the system default
+
+# Persistent cache of compiled PDFs keyed by content hash.
+# Identical latex_code (e.g. a re-download or unrelated UI change) becomes a
+# single file read instead of a multi-second pdflatex run.
+# Disable by setting RESUMAX_PDF_CACHE=0 in the environment.
+_pdf_cache_dir = Path(tempfile.gettempdir()) / "resumax-pdf-cache"
+_PDF_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 days
+_pdflatex_version_hash_cache: Optional[str] = None
+
+# Precompiled preamble formats (mylatexformat) keyed by preamble hash.
+# Opt-in per document via the marker comment on the first line.
+_fmt_cache_dir = Path(tempfile.gettempdir()) / "resumax-fmt-cache"
+_FMT_PREAMBLE_MARKER = "%!RESUMAX_PREAMBLE"
+
+
+def _pdf_cache_enabled() -> bool:
+    """Check if the PDF output cache is enabled (default: enabled)"""
+    return os.environ.get("RESUMAX_PDF_CACHE", "1") != "0"
+
+
+def _pdflatex_version_hash() -> str:
+    """
+    Get a short hash of the pdflatex version string.
+    Memoized for process lifetime - the installation does not change at runtime.
+
+    Used as part of the cache key so cached PDFs are invalidated when the
+    LaTeX distribution changes. Returns an empty string if the version
+    cannot be determined (cache is then keyed on content only).
+    """
+    global _pdflatex_version_hash_cache
+    if _pdflatex_version_hash_cache is not None:
+        return _pdflatex_version_hash_cache
+
+    pdflatex_cmd, env = _get_pdflatex_command()
+    try:
+        result = subprocess.run(
+            [pdflatex_cmd, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            env=env,
+            creationflags=_CREATION_FLAGS
+        )
+        version_line = result.stdout.split('\n')[0] if result.stdout else ""
+        _pdflatex_version_hash_cache = hashlib.blake2b(
+            version_line.encode('utf-8'), digest_size=8
+        ).hexdigest()
+    except Exception:
+        _pdflatex_version_hash_cache = ""
+
+    return _pdflatex_version_hash_cache
+
+
+def _pdf_cache_key(latex_code) -> str:
+    """Compute the cache key for a LaTeX document (content hash + pdflatex version)"""
+    if isinstance(latex_code, (Path, os.PathLike)):
+        # File-backed source: hash in chunks without materializing it
+        digest = hashlib.blake2b(digest_size=16)
+        with open(latex_code, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+        version_hash = _pdflatex_version_hash()
+        return f"{content_hash}-{version_hash}" if version_hash else content_hash
+
+    data = latex_code if isinstance(latex_code, bytes) else latex_code.encode('utf-8')
+    content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+    version_hash = _pdflatex_version_hash()
+    return f"{content_hash}-{version_hash}" if version_hash else content_hash
+
+
+def _write_tex_file(tex_file: Path, latex_code) -> None:
+    """
+    Writes LaTeX source to disk with a single open/write/close.
+
+    Accepts str (encoded once here), pre-encoded bytes, or a path to an
+    existing file-backed source (copied without loading it into memory),
+    so callers never pay a redundant serialization round trip.
+    """
+    if isinstance(latex_code, (Path, os.PathLike)):
+        shutil.copyfile(os.fspath(latex_code), str(tex_file))
+        return
+
+    data = latex_code if isinstance(latex_code, bytes) else latex_code.encode('utf-8')
+    fd = os.open(str(tex_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _latex_source_text(latex_code) -> str:
+    """
+    Gets the LaTeX source as str for content inspection (format marker,
+    rerun heuristics), whatever form the caller passed it in.
+    """
+    if isinstance(latex_code, (Path, os.PathLike)):
+        return Path(latex_code).read_text(encoding='utf-8', errors='ignore')
+    if isinstance(latex_code, bytes):
+        return latex_code.decode('utf-8', errors='ignore')
+    return latex_code
+
+
+def _pdf_cache_fresh_path(cache_key: str) -> Optional[Path]:
+    """
+    Get the path of a fresh (within TTL) cache entry without reading it.
+
+    RETURNS:
+        - Path to the cached PDF if present and fresh, None otherwise
+    """
+    cached_pdf = _pdf_cache_dir / f"{cache_key}.pdf"
+    try:
+        if cached_pdf.exists():
+            age = time.time() - cached_pdf.stat().st_mtime
+            if age < _PDF_CACHE_TTL_SECONDS:
+                return cached_pdf
+    except OSError:
+        pass  # Treat unreadable cache entries as misses
+    return None
+
+
+def _pdf_cache_lookup(cache_key: str) -> Optional[bytes]:
+    """
+    Look up a compiled PDF in the cache.
+
+    RETURNS:
+        - PDF bytes if a fresh cache entry exists, None otherwise
+    """
+    cached_pdf = _pdf_cache_fresh_path(cache_key)
+    if cached_pdf is not None:
+        try:
+            return cached_pdf.read_bytes()
+        except OSError:
+            pass
+    return None
+
+
+def _ensure_format(latex_code: str) -> Optional[str]:
+    """
+    Ensures a precompiled LaTeX format (.fmt) exists for this document's preamble.
+
+    Loading the preamble (document class, fontenc, geometry, hyperref, ...)
+    is the bulk of pdflatex wall time for a one-page resume. mylatexformat
+    dumps the preamble into a .fmt once; later compiles load it in one shot
+    and only typeset the body. Opt-in: documents must start with the
+    %!RESUMAX_PREAMBLE marker so templates that are incompatible with
+    format dumping are unaffected.
+
+    RETURNS:
+        - Format jobname (without .fmt extension) if a usable format exists
+          or was built, None if format compilation is unavailable/failed
+    """
+    if not latex_code.startswith(_FMT_PREAMBLE_MARKER):
+        return None
+
+    # Key the format on the preamble only - body edits reuse the same .fmt
+    doc_start = latex_code.find(r'\begin{document}')
+    preamble = latex_code[:doc_start] if doc_start != -1 else latex_code
+    preamble_hash = hashlib.blake2b(preamble.encode('utf-8'), digest_size=8).hexdigest()
+    version_hash = _pdflatex_version_hash()
+    fmt_jobname = f"resumax-{preamble_hash}-{version_hash}" if version_hash else f"resumax-{preamble_hash}"
+    fmt_file = _fmt_cache_dir / f"{fmt_jobname}.fmt"
+
+    if fmt_file.exists():
+        return fmt_jobname
+
+    pdflatex_cmd, env = _get_pdflatex_command()
+    try:
+        _fmt_cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory() as fmt_temp:
+            fmt_temp_path = Path(fmt_temp)
+            source_file = fmt_temp_path / "resume.tex"
+            source_file.write_text(latex_code, encoding='utf-8')
+
+            result = subprocess.run(
+                [
+                    pdflatex_cmd,
+                    "-ini",
+                    "-interaction=nonstopmode",
+                    "-halt-on-error",
+                    f"-jobname={fmt_jobname}",
+                    "&pdflatex",
+                    "mylatexformat.ltx",
+                    source_file.name
+                ],
+                cwd=str(fmt_temp_path),
+                capture_output=True,
+                text=True,
+                timeout=60,
+                env=env,
+                creationflags=_CREATION_FLAGS
+            )
+
+            built_fmt = fmt_temp_path / f"{fmt_jobname}.fmt"
+            if result.returncode != 0 or not built_fmt.exists():
+                return None
+
+            # Atomic publish so concurrent builders never see a partial format
+            tmp_entry = _fmt_cache_dir / f"{fmt_jobname}.fmt.tmp{os.getpid()}"
+            shutil.copyfile(str(built_fmt), str(tmp_entry))
+            os.replace(str(tmp_entry), str(fmt_file))
+            return fmt_jobname
+    except Exception:
+        # Format precompilation is a pure optimization - fall back to a
+        # normal compile on any failure
+        return None
+
+
+def _pdf_cache_store(cache_key: str, pdf_file: Path) -> None:
+    """
+    Store a compiled PDF in the cache atomically.
+    Cache failures are non-fatal - the compiled PDF is still returned.
+    """
+    try:
+        _pdf_cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_entry = _pdf_cache_dir / f"{cache_key}.pdf.tmp{os.getpid()}"
+        shutil.copyfile(str(pdf_file), str(tmp_entry))
+        # Atomic rename so concurrent readers never see a partial file
+        os.replace(str(tmp_entry), str(_pdf_cache_dir / f"{cache_key}.pdf"))
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
 def _get_project_root() -> Path:
     """Get the directory where essentialpackage is located using working directory"""
     # Use working directory set by electron.cjs (installation root)
@@ -52,6 +335,7 @@ def _get_project_root() -> Path:
         return working_dir  # Development
 
 
+@functools.lru_cache(maxsize=1)
 def _get_tinytex_path() -> Optional[Path]:
     """
     Check if TinyTeX is bundled with the project.
@@ -68,11 +352,14 @@ def _get_tinytex_path() -> Optional[Path]:
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def _get_pdflatex_command() -> Tuple[str, Optional[dict]]:
     """
     Get the pdflatex command and environment variables to use.
     Prioritizes bundled TinyTeX over system installation.
-    
+    Memoized - the installation and env construction (a full os.environ
+    copy) never change during process lifetime.
+
     RETURNS:
         - Tuple of (pdflatex_path, env_dict)
         - pdflatex_path: str - Full path to pdflatex or just "pdflatex"
@@ -85,21 +372,134 @@ def _get_pdflatex_command() -> Tuple[str, Optional[dict]]:
         # Set up environment for TinyTeX
         project_root = _get_project_root()
         tinytex_root = project_root / "essentialpackage" / "TinyTeX"
-        
-        env = os.environ.copy()
-        # Add TinyTeX bin directory to PATH
         tinytex_bin = str(tinytex_root / "bin" / "windows")
-        env['PATH'] = f"{tinytex_bin};{env.get('PATH', '')}"
-        
-        # Set TEXMFROOT for TinyTeX
-        env['TEXMFROOT'] = str(tinytex_root)
-        
+
+        # Built in a single expression and memoized with the command via
+        # lru_cache - the full environ copy happens once per process, not
+        # once per subprocess call
+        env = {
+            **os.environ,
+            'PATH': f"{tinytex_bin}{os.pathsep}{os.environ.get('PATH', '')}",
+            'TEXMFROOT': str(tinytex_root),
+        }
+
         return (str(tinytex_path), env)
     
     # Fall back to system pdflatex
     return ("pdflatex", None)
 
 
+class _PdflatexDaemon:
+    """
+    Keeps a pre-warmed pdflatex process waiting for work.
+
+    pdflatex exits after \\end{document}, so a true multi-job session is not
+    possible - instead we launch the next process *before* a job arrives and
+    park it at the ** filename prompt with its format already loaded. When a
+    compile request comes in, the fork/exec/kpathsea startup cost (~200-400 ms)
+    has already been paid during idle time; we just feed the filename on stdin
+    and wait. A replacement process is spawned immediately after each job.
+
+    Enabled via RESUMAX_PDFLATEX_DAEMON=1 (off by default - keeps a pdflatex
+    child resident between requests).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._proc = None
+        self._scratch_dir: Optional[Path] = None
+        self._jobs = 0
+
+    def _spawn(self) -> None:
+        """Launch a pdflatex process parked at the ** prompt in a fresh scratch dir"""
+        pdflatex_cmd, env = _get_pdflatex_command()
+        self._scratch_dir = Path(tempfile.mkdtemp(prefix="resumax-daemon-", dir=_fast_tmp_dir()))
+        self._proc = subprocess.Popen(
+            [pdflatex_cmd, "-interaction=nonstopmode", "-halt-on-error"],
+            cwd=str(self._scratch_dir),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            creationflags=_CREATION_FLAGS
+        )
+
+    def _teardown(self) -> None:
+        """Kill the parked process and remove its scratch dir"""
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+                self._proc.wait(timeout=1)
+            except Exception:
+                pass
+            self._proc = None
+        if self._scratch_dir is not None:
+            shutil.rmtree(str(self._scratch_dir), ignore_errors=True)
+            self._scratch_dir = None
+
+    def compile(self, tex_file: Path, working_dir: Path, timeout: float = 30) -> int:
+        """
+        Run one compilation pass through the pre-warmed process.
+
+        PARAMETERS:
+            - tex_file: Path to the .tex source
+            - working_dir: Directory that receives resume.pdf / resume.log
+            - timeout: Seconds to wait for the pass to finish
+
+        RETURNS:
+            - pdflatex return code for the pass
+        """
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._teardown()
+                self._spawn()
+
+            proc, scratch = self._proc, self._scratch_dir
+            self._proc = None
+            self._scratch_dir = None
+
+            try:
+                shutil.copyfile(str(tex_file), str(scratch / "resume.tex"))
+                # Carry over the .aux from a previous pass of this job so
+                # the rerun pass actually resolves cross-references; each
+                # pass runs in a fresh scratch dir, so without this the
+                # two-pass logic would silently become a no-op
+                prior_aux = working_dir / "resume.aux"
+                if prior_aux.exists():
+                    shutil.copyfile(str(prior_aux), str(scratch / "resume.aux"))
+                proc.stdin.write(b"resume.tex\n")
+                proc.stdin.close()
+                returncode = proc.wait(timeout=timeout)
+
+                # Hand results back to the caller's working dir
+                for artifact in ("resume.pdf", "resume.log", "resume.aux"):
+                    produced = scratch / artifact
+                    if produced.exists():
+                        shutil.copyfile(str(produced), str(working_dir / artifact))
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait(timeout=1)
+                raise
+            finally:
+                shutil.rmtree(str(scratch), ignore_errors=True)
+                self._jobs += 1
+                # Eagerly pre-warm the next process so startup overlaps idle time
+                try:
+                    self._spawn()
+                except Exception:
+                    self._proc = None
+
+            return returncode
+
+
+_pdflatex_daemon = _PdflatexDaemon()
+
+
+def _daemon_enabled() -> bool:
+    """Check if the pre-warmed pdflatex daemon is enabled (default: disabled)"""
+    return os.environ.get("RESUMAX_PDFLATEX_DAEMON", "0") == "1"
+
+
 def generate_pdf(latex_code: str, output_filename: str = "resume.pdf") -> bytes:
     """
     Main function to compile LaTeX code to PDF.
@@ -107,7 +507,8 @@ def generate_pdf(latex_code: str, output_filename: str = "resume.pdf") -> bytes:
     CALLED BY: main.py when user requests PDF download
     
     RECEIVES FROM main.py:
-        - latex_code: Complete LaTeX document as string
+        - latex_code: Complete LaTeX document as string (pre-encoded bytes
+          or a path to a file-backed source are also accepted)
         - output_filename: Desired PDF filename (optional, default: "resume.pdf")
     
     RETURNS TO main.py:
@@ -117,44 +518,215 @@ def generate_pdf(latex_code: str, output_filename: str = "resume.pdf") -> bytes:
         - RuntimeError: If pdflatex is not installed or not in PATH
         - Exception: For LaTeX compilation errors or file system errors
     """
+    # Check the persistent output cache - identical code compiles to an
+    # identical PDF, so a hit skips pdflatex entirely
+    cache_key = None
+    if _pdf_cache_enabled():
+        cache_key = _pdf_cache_key(latex_code)
+        cached_bytes = _pdf_cache_lookup(cache_key)
+        if cached_bytes is not None:
+            return cached_bytes
+
+    # Create temporary directory for compilation. Cleanup runs in a finally
+    # with ignore_errors so a failed compile (or a Windows file-lock edge
+    # case where pdflatex still holds a handle) can never leak the temp tree
+    temp_dir = tempfile.mkdtemp(dir=_fast_tmp_dir())
+    try:
+        pdf_file = _compile_to_path(latex_code, Path(temp_dir))
+
+        # Store in the persistent cache before the temp directory is cleaned up
+        if cache_key is not None:
+            _pdf_cache_store(cache_key, pdf_file)
+
+        pdf_bytes = pdf_file.read_bytes()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return pdf_bytes
+
+
+def _compile_to_path(latex_code: str, temp_path: Path) -> Path:
+    """
+    Compiles LaTeX code to a PDF file inside a caller-managed temp directory.
+    Internal function - not called from outside this module.
+
+    Factored out of generate_pdf so callers that only need the PDF on disk
+    (save_pdf_to_file) can copy it directly to its destination without
+    round-tripping the whole file through Python heap memory.
+
+    PARAMETERS:
+        - latex_code: Complete LaTeX document as string
+        - temp_path: Existing directory for compilation artifacts; the caller
+          owns its lifetime
+
+    RETURNS:
+        - Path to the compiled PDF inside temp_path
+
+    RAISES:
+        - RuntimeError: If pdflatex is not installed
+        - ValueError: If latex_code is empty
+        - Exception: For LaTeX compilation errors
+    """
+    # Resolve the pdflatex command once and thread it through the call
+    # chain - avoids repeated resolution and allows injecting a command
+    pdflatex_cmd, env = _get_pdflatex_command()
+
+    # Verify pdflatex is installed
+    _verify_pdflatex_installed(pdflatex_cmd, env)
+
+    # Validate LaTeX code
+    if isinstance(latex_code, (Path, os.PathLike)):
+        source_path = Path(latex_code)
+        if not source_path.exists() or source_path.stat().st_size == 0:
+            raise ValueError("LaTeX code cannot be empty")
+    elif not latex_code or not latex_code.strip():
+        raise ValueError("LaTeX code cannot be empty")
+
+    # Write LaTeX code to .tex file
+    tex_file = temp_path / "resume.tex"
+    _write_tex_file(tex_file, latex_code)
+
+    # Compile LaTeX to PDF (bounded so bursts don't oversubscribe cores)
+    source_text = _latex_source_text(latex_code)
+    try:
+        with _compile_slots:
+            _compile_latex(tex_file, temp_path, fmt_name=_ensure_format(source_text),
+                           expect_rerun=_needs_two_passes(source_text),
+                           timeout=_compile_timeout(len(source_text)),
+                           pdflatex_cmd=pdflatex_cmd, env=env)
+    except Exception as e:
+        # Try to extract meaningful error from log file
+        log_file = temp_path / "resume.log"
+        if log_file.exists():
+            error_details = _parse_latex_errors(log_file)
+            if error_details:
+                raise Exception(f"LaTeX compilation failed:\n{error_details}") from e
+        raise Exception(f"LaTeX compilation failed: {str(e)}") from e
+
+    pdf_file = temp_path / "resume.pdf"
+    if not pdf_file.exists():
+        raise Exception("PDF file was not generated. Check LaTeX code for errors.")
+
+    return pdf_file
+
+
+async def generate_pdf_async(latex_code: str, output_filename: str = "resume.pdf") -> bytes:
+    """
+    Async variant of generate_pdf for event-loop based servers.
+
+    subprocess.run blocks the calling thread, which stalls an asyncio event
+    loop; this version awaits pdflatex via asyncio.create_subprocess_exec so
+    many compilations can be in flight concurrently on one loop.
+
+    RECEIVES / RETURNS / RAISES: same contract as generate_pdf.
+    """
     # Verify pdflatex is installed
     _verify_pdflatex_installed()
-    
+
     # Validate LaTeX code
     if not latex_code or not latex_code.strip():
         raise ValueError("LaTeX code cannot be empty")
-    
-    # Create temporary directory for compilation
-    with tempfile.TemporaryDirectory() as temp_dir:
+
+    # Persistent output cache (same as the sync path)
+    cache_key = None
+    if _pdf_cache_enabled():
+        cache_key = _pdf_cache_key(latex_code)
+        cached_bytes = _pdf_cache_lookup(cache_key)
+        if cached_bytes is not None:
+            return cached_bytes
+
+    with tempfile.TemporaryDirectory(dir=_fast_tmp_dir()) as temp_dir:
         temp_path = Path(temp_dir)
-        
-        # Write LaTeX code to .tex file
+
         tex_file = temp_path / "resume.tex"
-        tex_file.write_text(latex_code, encoding='utf-8')
-        
-        # Compile LaTeX to PDF
+        _write_tex_file(tex_file, latex_code)
+
         try:
-            _compile_latex(tex_file, temp_path)
+            await _compile_latex_async(tex_file, temp_path)
         except Exception as e:
-            # Try to extract meaningful error from log file
             log_file = temp_path / "resume.log"
             if log_file.exists():
                 error_details = _parse_latex_errors(log_file)
                 if error_details:
                     raise Exception(f"LaTeX compilation failed:\n{error_details}") from e
             raise Exception(f"LaTeX compilation failed: {str(e)}") from e
-        
-        # Read generated PDF
+
         pdf_file = temp_path / "resume.pdf"
         if not pdf_file.exists():
             raise Exception("PDF file was not generated. Check LaTeX code for errors.")
-        
+
+        if cache_key is not None:
+            _pdf_cache_store(cache_key, pdf_file)
+
         pdf_bytes = pdf_file.read_bytes()
-    
-    # Temporary directory is automatically cleaned up here
+
     return pdf_bytes
 
 
+async def _compile_latex_async(tex_file: Path, working_dir: Path) -> None:
+    """
+    Async counterpart of _compile_latex using asyncio subprocesses.
+    Internal function - not called from outside this module.
+
+    Runs up to two passes with the same converged-log short-circuit as the
+    sync path.
+    """
+    import asyncio
+
+    pdflatex_cmd, env = _get_pdflatex_command()
+    command = [
+        pdflatex_cmd,
+        "-interaction=nonstopmode",
+        "-halt-on-error",
+        "-output-directory", str(working_dir),
+        tex_file.name
+    ]
+
+    timeout = _compile_timeout(tex_file.stat().st_size)
+
+    async def run_pass(pass_name: str) -> None:
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=str(working_dir),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=env
+        )
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise Exception(f"LaTeX compilation timed out on {pass_name}")
+
+        if proc.returncode != 0:
+            raise Exception(f"pdflatex {pass_name} failed with return code {proc.returncode}")
+
+    await run_pass("first pass")
+
+    log_file = working_dir / "resume.log"
+    if log_file.exists():
+        log_text = log_file.read_text(encoding='utf-8', errors='ignore')
+        if not rerun_required(log_text):
+            return
+
+    await run_pass("second pass")
+
+
+def _copy_pdf_file(src: Path, dst: Path) -> None:
+    """
+    Copies a PDF file without buffering it in Python memory.
+    Uses os.sendfile (zero-copy on Linux) with shutil.copyfile fallback.
+    """
+    try:
+        size = src.stat().st_size
+        with open(src, 'rb') as src_f, open(dst, 'wb') as dst_f:
+            os.sendfile(dst_f.fileno(), src_f.fileno(), 0, size)
+    except (AttributeError, OSError):
+        # sendfile unavailable (Windows) or failed - plain buffered copy
+        shutil.copyfile(str(src), str(dst))
+
+
 def save_pdf_to_file(latex_code: str, output_path: str) -> Path:
     """
     Compiles LaTeX and saves PDF to specified file path.
@@ -171,31 +743,85 @@ def save_pdf_to_file(latex_code: str, output_path: str) -> Path:
     RAISES:
         - Exception: For compilation or file system errors
     """
-    # Generate PDF bytes
-    pdf_bytes = generate_pdf(latex_code)
-    
     # Convert output path to Path object
     output_file = Path(output_path)
-    
+
     # Ensure parent directory exists
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Write PDF to file
-    output_file.write_bytes(pdf_bytes)
-    
+
+    # Cache hit: copy straight from the cache entry to the destination
+    cache_key = None
+    if _pdf_cache_enabled():
+        cache_key = _pdf_cache_key(latex_code)
+        cached_pdf = _pdf_cache_fresh_path(cache_key)
+        if cached_pdf is not None:
+            _copy_pdf_file(cached_pdf, output_file)
+            return output_file
+
+    # Compile and copy file-to-file - avoids materializing the PDF bytes
+    # in memory just to write them back out. Guaranteed cleanup as in
+    # generate_pdf so failures never leak the temp tree
+    temp_dir = tempfile.mkdtemp(dir=_fast_tmp_dir())
+    try:
+        pdf_file = _compile_to_path(latex_code, Path(temp_dir))
+
+        if cache_key is not None:
+            _pdf_cache_store(cache_key, pdf_file)
+
+        _copy_pdf_file(pdf_file, output_file)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
     return output_file
 
 
-def _verify_pdflatex_installed() -> None:
+def warmup() -> None:
+    """
+    Pre-verifies the pdflatex installation so the first real request
+    doesn't pay the ~30 ms --version probe.
+
+    CALLED BY: main.py at server startup (optional)
+    """
+    _verify_pdflatex_installed()
+
+
+def _verify_pdflatex_installed(pdflatex_cmd: Optional[str] = None,
+                               env: Optional[dict] = None) -> None:
     """
     Verifies pdflatex is installed (bundled TinyTeX or system).
     Internal function - not called from outside this module.
-    
+
+    The --version probe spawns a subprocess (~20-50 ms), but the
+    installation is a process-wide invariant - verify once and remember.
+
+    PARAMETERS:
+        - pdflatex_cmd / env: Pre-resolved command and environment; looked
+          up via _get_pdflatex_command when not supplied
+
+    RAISES:
+        - RuntimeError: If pdflatex is not found
+    """
+    global _pdflatex_verified
+    if _pdflatex_verified:
+        return
+
+    with _verify_lock:
+        if _pdflatex_verified:
+            return
+        if pdflatex_cmd is None:
+            pdflatex_cmd, env = _get_pdflatex_command()
+        _run_pdflatex_probe(pdflatex_cmd, env)
+        _pdflatex_verified = True
+
+
+def _run_pdflatex_probe(pdflatex_cmd: str, env: Optional[dict]) -> None:
+    """
+    Runs the pdflatex --version probe. Internal - use
+    _verify_pdflatex_installed, which memoizes the result.
+
     RAISES:
         - RuntimeError: If pdflatex is not found
     """
-    pdflatex_cmd, env = _get_pdflatex_command()
-    
     try:
         result = subprocess.run(
             [pdflatex_cmd, "--version"],
@@ -203,7 +829,7 @@ def _verify_pdflatex_installed() -> None:
             text=True,
             timeout=5,
             env=env,
-            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+            creationflags=_CREATION_FLAGS
         )
         
         if result.returncode != 0:
@@ -227,20 +853,44 @@ def _verify_pdflatex_installed() -> None:
         raise RuntimeError(f"Failed to verify pdflatex installation: {str(e)}")
 
 
-def _compile_latex(tex_file: Path, working_dir: Path) -> None:
+def _needs_two_passes(latex_code: str) -> bool:
+    """
+    Heuristic for whether a document will need a second pdflatex pass.
+
+    A second pass is only required when the first pass produces forward
+    references that have to be resolved (TOC, \\ref, \\cite, lastpage).
+    Plain resume templates contain none of these.
+    """
+    return any(
+        marker in latex_code
+        for marker in (r'\tableofcontents', r'\ref{', r'\pageref', r'\cite', 'lastpage')
+    )
+
+
+def _compile_latex(tex_file: Path, working_dir: Path, fmt_name: Optional[str] = None,
+                   expect_rerun: bool = False, timeout: float = 30,
+                   pdflatex_cmd: Optional[str] = None, env: Optional[dict] = None) -> None:
     """
     Compiles LaTeX file to PDF using pdflatex (TinyTeX or system).
     Internal function - not called from outside this module.
-    
+
     PARAMETERS:
         - tex_file: Path to .tex file
         - working_dir: Working directory for compilation (temp directory)
-    
+        - fmt_name: Optional precompiled format jobname (see _ensure_format)
+        - expect_rerun: True when the document is known to need a second
+          pass; the first pass then runs in -draftmode, skipping PDF
+          shipout and font embedding for the output that would be discarded
+        - timeout: Per-pass timeout in seconds (see _compile_timeout)
+        - pdflatex_cmd / env: Pre-resolved command and environment; looked
+          up via _get_pdflatex_command when not supplied
+
     Runs pdflatex twice to resolve references and ensure proper compilation.
     """
     # Get the appropriate pdflatex command and environment
-    pdflatex_cmd, env = _get_pdflatex_command()
-    
+    if pdflatex_cmd is None:
+        pdflatex_cmd, env = _get_pdflatex_command()
+
     # pdflatex command with options for non-interactive mode
     # Use relative paths to avoid issues with spaces in Windows usernames
     tex_filename = tex_file.name  # Just the filename, not full path
@@ -251,44 +901,105 @@ def _compile_latex(tex_file: Path, working_dir: Path) -> None:
         "-output-directory", str(working_dir),
         tex_filename  # Use relative filename only
     ]
+
+    # Use the precompiled preamble format when available - pdflatex then
+    # loads the dumped preamble instead of re-parsing every package
+    if fmt_name is not None:
+        cached_fmt = _fmt_cache_dir / f"{fmt_name}.fmt"
+        try:
+            # Copy into the working dir so pdflatex finds it without
+            # needing TEXFORMATS adjustments
+            shutil.copyfile(str(cached_fmt), str(working_dir / cached_fmt.name))
+            command.insert(1, f"-fmt={fmt_name}")
+        except OSError:
+            pass  # Fall back to a normal compile
     
+    # Pre-warmed daemon path: the process is already running with its format
+    # loaded, so each pass skips fork/exec/startup (custom formats still go
+    # through the normal command line below)
+    use_daemon = _daemon_enabled() and fmt_name is None
+
+    # When a rerun is known to be needed, the first pass's PDF is thrown
+    # away - run it in draftmode so pdflatex skips shipout and font work
+    first_command = command
+    if expect_rerun and not use_daemon:
+        first_command = command[:1] + ["-draftmode"] + command[1:]
+
     # First compilation pass
     try:
-        result = subprocess.run(
-            command,
-            cwd=str(working_dir),
-            capture_output=True,
-            text=True,
-            timeout=30,
-            env=env,
-            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-        )
-        
-        if result.returncode != 0:
-            raise Exception(f"pdflatex first pass failed with return code {result.returncode}")
-    
+        if use_daemon:
+            returncode = _pdflatex_daemon.compile(tex_file, working_dir, timeout=timeout)
+        else:
+            # stdout/stderr are unused (errors come from resume.log) -
+            # DEVNULL avoids the pipe buffering and UTF-8 decode
+            result = subprocess.run(
+                first_command,
+                cwd=str(working_dir),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=timeout,
+                env=env,
+                creationflags=_CREATION_FLAGS
+            )
+            returncode = result.returncode
+
+        if returncode != 0:
+            raise Exception(f"pdflatex first pass failed with return code {returncode}")
+
     except subprocess.TimeoutExpired:
-        raise Exception("LaTeX compilation timed out (exceeded 30 seconds)")
+        raise Exception(f"LaTeX compilation timed out (exceeded {timeout:.0f} seconds)")
     
+    # Skip the second pass when the first pass already converged - resume
+    # documents rarely have references/TOC entries that need a rerun.
+    # A draftmode first pass produces no PDF, so it always needs pass two.
+    if not (expect_rerun and not use_daemon):
+        log_file = working_dir / "resume.log"
+        if log_file.exists():
+            log_text = log_file.read_text(encoding='utf-8', errors='ignore')
+            if not rerun_required(log_text):
+                return
+
     # Second compilation pass (for references, TOC, etc.)
     try:
-        result = subprocess.run(
-            command,
-            cwd=str(working_dir),
-            capture_output=True,
-            text=True,
-            timeout=30,
-            env=env,
-            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-        )
-        
-        if result.returncode != 0:
-            raise Exception(f"pdflatex second pass failed with return code {result.returncode}")
-    
+        if use_daemon:
+            returncode = _pdflatex_daemon.compile(tex_file, working_dir, timeout=timeout)
+        else:
+            result = subprocess.run(
+                command,
+                cwd=str(working_dir),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=timeout,
+                env=env,
+                creationflags=_CREATION_FLAGS
+            )
+            returncode = result.returncode
+
+        if returncode != 0:
+            raise Exception(f"pdflatex second pass failed with return code {returncode}")
+
     except subprocess.TimeoutExpired:
         raise Exception("LaTeX compilation timed out on second pass")
 
 
+def rerun_required(log_text: str) -> bool:
+    """
+    Checks a pdflatex .log for warnings that require another compilation pass.
+
+    PARAMETERS:
+        - log_text: Content of the .log file from the previous pass
+
+    RETURNS:
+        - True if pdflatex asked for a rerun (unresolved references, changed
+          labels, TOC updates), False if the document already converged
+    """
+    return (
+        "Rerun to get" in log_text
+        or "may have changed" in log_text
+        or "Rerun LaTeX" in log_text
+    )
+
+
 def _parse_latex_errors(log_file: Path) -> Optional[str]:
     """
     Parses LaTeX .log file to extract meaningful error messages.
@@ -302,45 +1013,37 @@ def _parse_latex_errors(log_file: Path) -> Optional[str]:
     """
     try:
         log_content = log_file.read_text(encoding='utf-8', errors='ignore')
-        
-        # Look for common error patterns
+
+        # Single pass over the log - test each line against all known error
+        # patterns and stop once enough errors are collected
         error_lines = []
-        
-        # Pattern 1: Lines starting with "! "
-        for line in log_content.split('\n'):
+        for line in log_content.splitlines():
+            # Pattern 1: Lines starting with "! "
             if line.startswith('! '):
                 error_lines.append(line[2:])  # Remove "! " prefix
-        
-        # Pattern 2: "Error:" messages
-        if 'Error:' in log_content:
-            for line in log_content.split('\n'):
-                if 'Error:' in line:
-                    error_lines.append(line.strip())
-        
-        # Pattern 3: Missing packages
-        if 'File' in log_content and 'not found' in log_content:
-            for line in log_content.split('\n'):
-                if 'not found' in line.lower():
-                    error_lines.append(line.strip())
-        
-        # Pattern 4: Document class and font size errors (specific to our issue)
-        if 'normalsize' in log_content or 'font size command' in log_content:
-            for line in log_content.split('\n'):
-                if 'normalsize' in line or 'font size command' in line:
-                    error_lines.append(line.strip())
-        
-        # Pattern 5: Document class errors
-        if 'documentclass' in log_content.lower():
-            for line in log_content.split('\n'):
-                if 'documentclass' in line.lower() and ('error' in line.lower() or '!' in line):
-                    error_lines.append(line.strip())
-        
+            # Pattern 2: "Error:" messages
+            elif 'Error:' in line:
+                error_lines.append(line.strip())
+            # Pattern 3: Missing packages
+            elif 'not found' in line.lower():
+                error_lines.append(line.strip())
+            # Pattern 4: Document class and font size errors (specific to our issue)
+            elif 'normalsize' in line or 'font size command' in line:
+                error_lines.append(line.strip())
+            # Pattern 5: Document class errors
+            elif 'documentclass' in line.lower() and ('error' in line.lower() or '!' in line):
+                error_lines.append(line.strip())
+            else:
+                continue
+
+            if len(error_lines) >= _MAX_ERROR_LINES:
+                break  # Early exit - only the first few errors are reported
+
         if error_lines:
-            # Return first few errors (up to 5)
-            return '\n'.join(error_lines[:5])
-        
+            return '\n'.join(error_lines)
+
         return None
-    
+
     except Exception:
         return None
 
@@ -371,13 +1074,18 @@ def check_latex_installation() -> dict:
             text=True,
             timeout=5,
             env=env,
-            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+            creationflags=_CREATION_FLAGS
         )
         
         if result.returncode == 0:
             # Extract version from output (first line usually contains version)
             version_line = result.stdout.split('\n')[0] if result.stdout else "Unknown version"
-            
+
+            # A successful diagnostic probe also satisfies the memoized
+            # verification used by generate_pdf
+            global _pdflatex_verified
+            _pdflatex_verified = True
+
             return {
                 "installed": True,
                 "version": version_line,
@@ -10,46 +10,65 @@ This module acts as a router/orchestrator that:
 Architecture: Parse → Split → Store → Reassemble
 """
 
+import bisect
+import copy
+import hashlib
+import os
 import re
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
-# Import format-specific parsers
-import sys
+# Parsers live in backend/Section_parsers and are loaded lazily per format
+# by _get_parser (their file names contain hyphens, so they are loaded from
+# file rather than imported by dotted path)
 backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir / 'Section_parsers'))
 
+# Optional Hyperscan backend: when the hyperscan package is installed, the
+# section-marker scan runs through its DFA engine (single linear pass, no
+# backtracking) with the re patterns kept for title capture and as the
+# fallback. Purely opportunistic - the module works identically without it
 try:
-    from Section_parsers import ATS_parser, modern_parser, cool_parser, two_coloumn_parser
+    import hyperscan as _hyperscan
 except ImportError:
-    # Fallback for different import paths
-    import importlib.util
-    
-    def load_parser(parser_name: str):
-        """Dynamically load parser module"""
-        parser_path = backend_dir / 'Section_parsers' / f'{parser_name}.py'
-        spec = importlib.util.spec_from_file_location(parser_name, parser_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-    
-    ATS_parser = load_parser('ATS-parser')
-    modern_parser = load_parser('modern-parser')
-    cool_parser = load_parser('cool-parser')
-    two_coloumn_parser = load_parser('two-coloumn-parser')
+    _hyperscan = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Format to parser mapping
-FORMAT_PARSER_MAP = {
-    'ATS': ATS_parser,
-    'Modern': modern_parser,
-    'cool': cool_parser,
-    'Two-Coloumn': two_coloumn_parser
+# Format to parser source file (module names contain hyphens, so they are
+# loaded from their files rather than imported by dotted path)
+_PARSER_PATHS = {
+    'ATS': 'ATS-parser',
+    'Modern': 'modern-parser',
+    'cool': 'cool-parser',
+    'Two-Coloumn': 'two-coloumn-parser'
 }
 
+
+@lru_cache(maxsize=None)
+def _get_parser(format_id: str):
+    """
+    Load (and memoize) the parser module for a format.
+
+    Each parser is only executed the first time its format is actually
+    requested, instead of all four loading at import time.
+
+    Raises:
+        KeyError: If format_id has no registered parser
+    """
+    import importlib.util
+
+    parser_path = backend_dir / 'Section_parsers' / f'{_PARSER_PATHS[format_id]}.py'
+    spec = importlib.util.spec_from_file_location(_PARSER_PATHS[format_id], parser_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
 # Format-specific section marker patterns
 # {title} placeholder will be replaced with actual section title
 SECTION_PATTERNS = {
@@ -59,6 +78,222 @@ SECTION_PATTERNS = {
     'cool': r'\\NewPart\s*\{\s*{title}\s*\}'
 }
 
+# Compiled once at import: each format's marker pattern with a generic title
+# capture, so one finditer pass locates every section instead of building and
+# searching a fresh regex per title on every parse
+SECTION_PATTERNS_COMPILED = {
+    fmt: re.compile(tmpl.replace('{title}', r'(?P<title>[^}]+?)'), re.IGNORECASE)
+    for fmt, tmpl in SECTION_PATTERNS.items()
+}
+
+# Static regexes compiled once at import - calling .search/.sub on the
+# compiled objects skips the re-module cache lookup and flag handling that
+# every re.search(pattern_string, ...) call pays
+# All three format markers in one alternation so detection is a single scan
+# of the document instead of one scan per format. Groups are checked in
+# priority order (ATS, cool, Modern) after the scan
+_RE_DETECT = re.compile(
+    r'(?P<ats>\\textbf\s*\{\s*\\large\s+[A-Z])'
+    r'|(?P<cool>\\NewPart\s*\{)'
+    r'|(?P<modern>\\section\s*\{)'
+)
+_RE_ENV_BEGIN = re.compile(r'\\begin\{([^}]+)\}(?:\{[^}]*\})?')
+_RE_END_DOCUMENT = re.compile(r'\\end\s*\{\s*document\s*\}')
+_RE_NORMALIZE = re.compile(r'[^a-z0-9]+')
+
+# Maps every non-alphanumeric ASCII code point to '_' for the fast
+# str.translate path in _normalize_section_key (non-ASCII titles fall back
+# to the regex, which also collapses the runs)
+_NORMALIZE_TABLE = {c: '_' for c in range(128) if not chr(c).isalnum()}
+_RE_HEADER_TRAIL = re.compile(r'(?:\n|\\\\)*')
+
+
+# Debug dump of mismatched-brace documents is opt-in (RESUMAX_DUMP_LATEX=1)
+# and runs on a single background thread so the request path never blocks
+# on disk writes
+_DEBUG_DUMP = os.environ.get('RESUMAX_DUMP_LATEX') == '1'
+_DUMP_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='latex-dump')
+
+
+def _dump_latex(filtered_latex: str, original_latex: str) -> None:
+    """Write the mismatched filtered/original LaTeX to temp files for debugging"""
+    try:
+        temp_dir = Path(__file__).parent.parent / 'temp'
+        temp_dir.mkdir(exist_ok=True)
+
+        debug_file = temp_dir / 'filtered_debug.tex'
+        debug_file.write_text(filtered_latex, encoding='utf-8')
+        logger.info("[FILTER] Saved filtered LaTeX to %s", debug_file)
+
+        if original_latex:
+            original_file = temp_dir / 'original_debug.tex'
+            original_file.write_text(original_latex, encoding='utf-8')
+            logger.info("[FILTER] Saved original LaTeX to %s", original_file)
+    except OSError as e:
+        logger.error("[FILTER] Failed to dump debug LaTeX: %s", e)
+
+
+# Parsed-output cache keyed by (document hash, format_id). The UI re-parses
+# the same document on every selection round-trip, so repeats cost one
+# blake2b pass over the input instead of the full regex/split pipeline.
+# Entries hold private copies; hits hand back a fresh copy so callers can
+# mutate their result without poisoning the cache
+_PARSE_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_PARSE_CACHE_MAX = 32
+_parse_cache_lock = threading.Lock()
+
+
+# Item boundary tokens used to locate the LaTeX command wrapping a
+# subsection's text (see _extract_subsection_items)
+_RE_ITEM_BOUNDARY = re.compile(r'\\textbf\{|\\item\b|\n')
+
+# How far back from a subsection's text to look for its wrapping command
+_ITEM_LOOKBACK_CHARS = 50
+
+
+def _last_boundaries_in_window(boundaries: List[Tuple[int, str]], starts: List[int],
+                               text_start: int, window_lo: int) -> Tuple[int, int, int]:
+    """
+    Find the last \\textbf{, \\item and newline boundary positions in the
+    window [window_lo, text_start), using the pre-tokenized boundary list.
+
+    Walks backward from the nearest boundary; stops at the first newline
+    since commands before it can never win the "after the last newline"
+    test. Returns (-1, -1, -1)-style sentinels like str.rfind.
+    """
+    last_textbf = last_item = last_newline = -1
+    idx = bisect.bisect_left(starts, text_start) - 1
+    while idx >= 0:
+        pos, token = boundaries[idx]
+        if pos < window_lo:
+            break
+        if token == '\n':
+            last_newline = pos
+            break  # Earlier boundaries are all before the last newline
+        elif token == '\\item':
+            if last_item == -1:
+                last_item = pos
+        else:  # '\textbf{'
+            if last_textbf == -1:
+                last_textbf = pos
+        idx -= 1
+
+    return last_textbf, last_item, last_newline
+
+
+@lru_cache(maxsize=4096)
+def _compile_flex(text: str) -> "re.Pattern":
+    """
+    Compile a whitespace-flexible, case-insensitive literal-text pattern.
+    Memoized - the same subsection texts are escaped and compiled repeatedly
+    across item probes and re-parses of the same resume.
+    """
+    return re.compile(re.escape(text).replace(r'\ ', r'\s+'), re.IGNORECASE)
+
+
+def _search_subsection_text(search_text: str, section_content: str, pos: int = 0,
+                            endpos: Optional[int] = None):
+    """
+    Find a subsection's text in the section with whitespace-flexible matching.
+
+    Tries the full text first, then falls back to just the first few words.
+    The optional pos/endpos bound the search (re.Pattern.search arguments)
+    without slicing a copy of the section.
+
+    Returns:
+        re.Match or None
+    """
+    if endpos is None:
+        endpos = len(section_content)
+
+    match = _compile_flex(search_text).search(section_content, pos, endpos)
+
+    if not match:
+        # Try just first few words if full text not found
+        first_words = ' '.join(search_text.split()[:3])
+        match = _compile_flex(first_words).search(section_content, pos, endpos)
+
+    return match
+
+
+@lru_cache(maxsize=None)
+def _hyperscan_db(format_id: str):
+    """
+    Build (and memoize) the Hyperscan database for a format's section
+    pattern. Returns None when hyperscan is unavailable or the pattern
+    cannot be compiled, in which case callers use the re path.
+    """
+    if _hyperscan is None:
+        return None
+    try:
+        expression = SECTION_PATTERNS[format_id].replace('{title}', '[^}]+?').encode('ascii')
+        db = _hyperscan.Database()
+        db.compile(
+            expressions=[expression],
+            ids=[0],
+            flags=[_hyperscan.HS_FLAG_CASELESS | _hyperscan.HS_FLAG_SOM_LEFTMOST]
+        )
+        return db
+    except Exception as e:
+        logger.debug("[SPLIT] Hyperscan compile failed for %s, using re: %s", format_id, e)
+        return None
+
+
+def _find_section_markers(latex_code: str, format_id: str):
+    """
+    Yield section-marker matches in document order.
+
+    With hyperscan installed (and ASCII input, so byte offsets equal string
+    offsets), candidate positions come from one DFA scan and each is
+    confirmed with the compiled re pattern to capture the title. Otherwise
+    falls back to the combined re finditer pass.
+    """
+    combined_pattern = SECTION_PATTERNS_COMPILED.get(format_id)
+    if combined_pattern is None:
+        return []
+
+    db = _hyperscan_db(format_id)
+    if db is not None and latex_code.isascii():
+        candidates = []
+
+        def _on_match(match_id, start, end, flags, context):
+            candidates.append(start)
+
+        try:
+            db.scan(latex_code.encode('ascii'), match_event_handler=_on_match)
+        except Exception as e:
+            logger.debug("[SPLIT] Hyperscan scan failed, using re: %s", e)
+        else:
+            matches = []
+            last_end = -1
+            for start in sorted(set(candidates)):
+                if start < last_end:
+                    continue  # Candidate inside the previous match
+                match = combined_pattern.match(latex_code, start)
+                if match:
+                    matches.append(match)
+                    last_end = match.end()
+            return matches
+
+    return combined_pattern.finditer(latex_code)
+
+
+@lru_cache(maxsize=32)
+def _compile_env_end(env_name: str) -> "re.Pattern":
+    """Compile (and memoize) the \\end{...} pattern for an environment name"""
+    return re.compile(rf'\\end\{{{re.escape(env_name)}\}}')
+
+
+@lru_cache(maxsize=256)
+def _compile_section_pattern(format_id: str, title: str) -> "re.Pattern":
+    """
+    Compile the exact-title section regex for one format/title pair.
+    Fallback for titles the generic combined scan cannot match (e.g. titles
+    containing '}'); memoized so repeated parses reuse the compiled pattern.
+    """
+    pattern_template = SECTION_PATTERNS.get(format_id, '')
+    return re.compile(pattern_template.replace('{title}', re.escape(title)), re.IGNORECASE)
+
 
 def parse_latex_sections(latex_code: str, template_id: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -87,13 +322,24 @@ def parse_latex_sections(latex_code: str, template_id: Optional[str] = None) ->
         # Determine format
         format_id = template_id or _detect_format(latex_code)
         
-        if format_id not in FORMAT_PARSER_MAP:
-            raise ValueError(f"Unknown format_id: {format_id}. Available formats: {list(FORMAT_PARSER_MAP.keys())}")
+        if format_id not in _PARSER_PATHS:
+            raise ValueError(f"Unknown format_id: {format_id}. Available formats: {list(_PARSER_PATHS.keys())}")
         
-        logger.info(f"[PARSE] Parsing LaTeX with format: {format_id}")
+        # Repeated parses of the same document are served from the cache
+        cache_key = (hashlib.blake2b(latex_code.encode('utf-8'), digest_size=16).digest(),
+                     format_id)
+        with _parse_cache_lock:
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None:
+                _PARSE_CACHE.move_to_end(cache_key)
+        if cached is not None:
+            logger.info("[PARSE] Returning cached parse for format: %s", format_id)
+            return copy.deepcopy(cached)
+
+        logger.info("[PARSE] Parsing LaTeX with format: %s", format_id)
         
-        # Get appropriate parser
-        parser = FORMAT_PARSER_MAP[format_id]
+        # Get appropriate parser (loaded lazily on first use of this format)
+        parser = _get_parser(format_id)
         
         # Parse LaTeX to get structure
         parser_output = parser.parse(latex_code)
@@ -101,7 +347,7 @@ def parse_latex_sections(latex_code: str, template_id: Optional[str] = None) ->
         if not parser_output or 'sections' not in parser_output:
             raise Exception(f"Parser returned invalid output for format {format_id}")
         
-        logger.info(f"[PARSE] Parser found {len(parser_output['sections'])} sections")
+        logger.info("[PARSE] Parser found %d sections", len(parser_output['sections']))
         
         # Split LaTeX into reusable blocks
         latex_blocks = _split_latex_into_blocks(latex_code, parser_output, format_id)
@@ -114,15 +360,20 @@ def parse_latex_sections(latex_code: str, template_id: Optional[str] = None) ->
             'original_latex': latex_code
         }
         
-        logger.info(f"[PARSE] Successfully split LaTeX into {len(latex_blocks.get('sections', {}))} section blocks")
+        logger.info("[PARSE] Successfully split LaTeX into %d section blocks", len(latex_blocks.get('sections', {})))
         
+        with _parse_cache_lock:
+            _PARSE_CACHE[cache_key] = copy.deepcopy(parsed_data)
+            if len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+                _PARSE_CACHE.popitem(last=False)
+
         return parsed_data
         
     except ValueError as e:
-        logger.error(f"[PARSE ERROR] Validation error: {e}")
+        logger.error("[PARSE ERROR] Validation error: %s", e)
         raise
     except Exception as e:
-        logger.error(f"[PARSE ERROR] Failed to parse LaTeX: {e}")
+        logger.error("[PARSE ERROR] Failed to parse LaTeX: %s", e)
         raise Exception(f"Failed to parse LaTeX sections: {str(e)}")
 
 
@@ -136,12 +387,17 @@ def _detect_format(latex_code: str) -> str:
     Returns:
         Format identifier string
     """
-    # Check for format-specific patterns
-    if re.search(r'\\textbf\s*\{\s*\\large\s+[A-Z]', latex_code):
-        return 'ATS'
-    elif re.search(r'\\NewPart\s*\{', latex_code):
+    # One combined pass over the document; an ATS marker anywhere wins, so
+    # stop as soon as one is seen, otherwise remember which markers appeared
+    seen = set()
+    for m in _RE_DETECT.finditer(latex_code):
+        if m.lastgroup == 'ats':
+            return 'ATS'
+        seen.add(m.lastgroup)
+
+    if 'cool' in seen:
         return 'cool'
-    elif re.search(r'\\section\s*\{', latex_code):
+    if 'modern' in seen:
         # Default to Modern if both use \section
         return 'Modern'
     
@@ -172,30 +428,53 @@ def _split_latex_into_blocks(latex_code: str, parser_output: Dict, format_id: st
             'closing': ''
         }
     
-    # Get section pattern template for this format
-    pattern_template = SECTION_PATTERNS.get(format_id, '')
-    
-    # Find positions of all sections
+    # Index parser sections by normalized title so combined-scan matches can
+    # be mapped back to their metadata
+    sections_by_key = {
+        _normalize_section_key(section['title']): section
+        for section in sections_data
+    }
+
+    # Find positions of all sections with a single pass of the combined
+    # per-format scan (matches come back in document order)
     section_positions = []
+    matched_keys = set()
+    for match in _find_section_markers(latex_code, format_id):
+        key = _normalize_section_key(match.group('title'))
+        section = sections_by_key.get(key)
+        if section is None or key in matched_keys:
+            continue
+        matched_keys.add(key)
+        section_positions.append({
+            'title': section['title'],
+            'start': match.start(),
+            'end': match.end(),
+            'subsections': section.get('subsections', [])
+        })
+
+    # Fallback: exact-title search for any section the combined scan missed
+    fallback_used = False
     for section in sections_data:
         title = section['title']
-        # Build regex for this specific section
-        pattern = pattern_template.replace('{title}', re.escape(title))
-        
-        match = re.search(pattern, latex_code, re.IGNORECASE)
+        if _normalize_section_key(title) in matched_keys:
+            continue
+        match = _compile_section_pattern(format_id, title).search(latex_code)
         if match:
+            fallback_used = True
             section_positions.append({
                 'title': title,
                 'start': match.start(),
                 'end': match.end(),
                 'subsections': section.get('subsections', [])
             })
-    
-    # Sort by position
-    section_positions.sort(key=lambda x: x['start'])
+
+    # Sort by position (only needed when fallback matches were appended -
+    # the finditer pass is already in document order)
+    if fallback_used:
+        section_positions.sort(key=lambda x: x['start'])
     
     if not section_positions:
-        logger.warning(f"[SPLIT] No section markers found for format {format_id}")
+        logger.warning("[SPLIT] No section markers found for format %s", format_id)
         return {
             'preamble': latex_code,
             'sections': {},
@@ -209,14 +488,14 @@ def _split_latex_into_blocks(latex_code: str, parser_output: Dict, format_id: st
     # Extract sections
     sections_dict = {}
     
-    for i, section_pos in enumerate(section_positions):
-        # Determine where this section ends
-        if i + 1 < len(section_positions):
-            section_end = section_positions[i + 1]['start']
-        else:
-            # Last section goes to end of document
-            section_end = len(latex_code)
-        
+    # Each section ends where the next one starts; the last runs to the end
+    # of the document (sentinel). Positions are already in document order,
+    # so pairing replaces the per-iteration index arithmetic
+    next_section_starts = [pos['start'] for pos in section_positions[1:]]
+    next_section_starts.append(len(latex_code))
+
+    for section_pos, section_end in zip(section_positions, next_section_starts):
+
         # Extract full section content
         section_content = latex_code[section_pos['start']:section_end]
         
@@ -229,17 +508,13 @@ def _split_latex_into_blocks(latex_code: str, parser_output: Dict, format_id: st
             env_end_pos = environment_wrapper['end_pos']
             if env_end_pos < len(section_content):
                 section_content = section_content[:env_end_pos]
-                logger.info(f"[SPLIT] Trimmed section '{section_pos['title']}' to end at environment closing tag")
+                logger.info("[SPLIT] Trimmed section '%s' to end at environment closing tag", section_pos['title'])
         
         # Extract section header (first line/marker)
         header_end = section_pos['end'] - section_pos['start']
-        # Extend to include newlines after header
-        while header_end < len(section_content) and section_content[header_end] in '\n\\':
-            header_end += 1
-            if section_content[header_end-1] == '\\' and header_end < len(section_content):
-                if section_content[header_end] == '\\':
-                    header_end += 1
-                    break
+        # Extend past trailing newlines and \\ line breaks in one C-level
+        # scan instead of a per-character Python loop
+        header_end = _RE_HEADER_TRAIL.match(section_content, header_end).end()
         
         section_header = section_content[:header_end]
         
@@ -259,22 +534,36 @@ def _split_latex_into_blocks(latex_code: str, parser_output: Dict, format_id: st
         
         # If has subsections, split into items
         if has_items:
-            items, environment_wrapper = _extract_subsection_items(section_content, subsections)
+            items, environment_wrapper = _extract_subsection_items(
+                latex_code, section_pos['start'],
+                section_pos['start'] + len(section_content), subsections
+            )
             sections_dict[section_key]['items'] = items
             if environment_wrapper:
                 sections_dict[section_key]['environment_wrapper'] = environment_wrapper
+                # Precompute the assembly-side strings once here so every
+                # filter call appends one header+open part and can decide
+                # the duplicate-close check without rescanning the content
+                sections_dict[section_key]['header_plus_open'] = (
+                    section_header + '\n' + environment_wrapper['open_command']
+                )
+                sections_dict[section_key]['append_close'] = (
+                    environment_wrapper['close_command'] not in section_content
+                )
         else:
             sections_dict[section_key]['items'] = {}
     
-    # Extract closing (check last section for \end{document})
-    last_section_content = list(sections_dict.values())[-1]['full_content'] if sections_dict else ''
+    # Extract closing (check last section for \end{document}). Dicts keep
+    # insertion order, so the last key comes from reversed() without copying
+    # the whole view into a list
+    last_key = next(reversed(sections_dict)) if sections_dict else None
+    last_section_content = sections_dict[last_key]['full_content'] if last_key is not None else ''
     
     # Find \end{document} in last section
-    end_doc_match = re.search(r'\\end\s*\{\s*document\s*\}', last_section_content)
+    end_doc_match = _RE_END_DOCUMENT.search(last_section_content)
     
     if end_doc_match:
         # Split last section and closing
-        last_key = list(sections_dict.keys())[-1]
         split_pos = end_doc_match.start()
         
         # Update last section to not include closing
@@ -284,14 +573,13 @@ def _split_latex_into_blocks(latex_code: str, parser_output: Dict, format_id: st
         closing_content = last_section_content[split_pos:]
         
         # Check for duplicate \end{document} and keep only the first one
-        end_doc_pattern = r'\\end\s*\{\s*document\s*\}'
-        end_doc_matches = list(re.finditer(end_doc_pattern, closing_content))
+        end_doc_matches = list(_RE_END_DOCUMENT.finditer(closing_content))
         
         if len(end_doc_matches) > 1:
             # Multiple \end{document} found, keep only the first one
             first_end_pos = end_doc_matches[0].end()
             closing = closing_content[:first_end_pos]
-            logger.warning(f"[SPLIT] Found {len(end_doc_matches)} \\end{{document}} tags, keeping only the first one")
+            logger.warning("[SPLIT] Found %d \\end{document} tags, keeping only the first one", len(end_doc_matches))
         else:
             closing = closing_content
     else:
@@ -304,14 +592,13 @@ def _split_latex_into_blocks(latex_code: str, parser_output: Dict, format_id: st
     
     # Final defensive check: ensure closing doesn't have duplicates
     if closing:
-        end_doc_pattern = r'\\end\s*\{\s*document\s*\}'
-        end_doc_matches = list(re.finditer(end_doc_pattern, closing))
+        end_doc_matches = list(_RE_END_DOCUMENT.finditer(closing))
         
         if len(end_doc_matches) > 1:
             # Multiple \end{document} found, keep only the first one
             first_end_pos = end_doc_matches[0].end()
             closing = closing[:first_end_pos]
-            logger.warning(f"[SPLIT] Final cleanup: Found {len(end_doc_matches)} \\end{{document}} tags in closing, keeping only the first one")
+            logger.warning("[SPLIT] Final cleanup: Found %d \\end{document} tags in closing, keeping only the first one", len(end_doc_matches))
     
     return {
         'preamble': preamble,
@@ -320,21 +607,28 @@ def _split_latex_into_blocks(latex_code: str, parser_output: Dict, format_id: st
     }
 
 
-def _detect_environment_wrapper(section_content: str) -> Optional[dict]:
+def _detect_environment_wrapper(section_content: str, pos: int = 0,
+                                endpos: Optional[int] = None) -> Optional[dict]:
     """
     Detect if section content has an environment wrapper (like \\begin{multicols}...\\end{multicols}).
     
     Args:
-        section_content: Full section LaTeX block
+        section_content: Full section LaTeX block (or the whole document
+            when pos/endpos bound the section - avoids slicing a copy)
+        pos: Offset at which the section starts
+        endpos: Offset at which the section ends (defaults to end of string)
     
     Returns:
         Environment wrapper info dict or None if no wrapper found
+        (positions are absolute within the string that was passed in)
     """
     # Known wrapper environments
     wrapper_environments = ['multicols', 'tabular', 'minipage', 'columns']
-    
-    env_pattern = r'\\begin\{([^}]+)\}(?:\{[^}]*\})?'
-    env_match = re.search(env_pattern, section_content)
+
+    if endpos is None:
+        endpos = len(section_content)
+
+    env_match = _RE_ENV_BEGIN.search(section_content, pos, endpos)
     
     if env_match:
         env_name = env_match.group(1)
@@ -345,8 +639,7 @@ def _detect_environment_wrapper(section_content: str) -> Optional[dict]:
             env_open_command = env_match.group(0)
             
             # Find matching \end{env_name}
-            end_pattern = rf'\\end\{{{re.escape(env_name)}\}}'
-            end_match = re.search(end_pattern, section_content)
+            end_match = _compile_env_end(env_name).search(section_content, pos, endpos)
             
             if end_match:
                 env_end = end_match.end()
@@ -363,13 +656,20 @@ def _detect_environment_wrapper(section_content: str) -> Optional[dict]:
     return None
 
 
-def _extract_subsection_items(section_content: str, subsections: List[str]) -> Tuple[Dict[str, str], dict]:
+def _extract_subsection_items(latex_code: str, sec_start: int, sec_end: int,
+                              subsections: List[str]) -> Tuple[Dict[str, str], dict]:
     """
-    Extract individual subsection items from section content.
+    Extract individual subsection items from a section of the document.
     Also detects and stores environment wrappers (like \\begin{multicols}...\\end{multicols}).
+
+    Operates on the full document via [sec_start, sec_end) offsets and the
+    pos/endpos arguments of compiled-pattern searches, so no intermediate
+    copy of the section is sliced - items are only materialized when stored.
     
     Args:
-        section_content: Full section LaTeX block
+        latex_code: Complete LaTeX document
+        sec_start: Offset where the section starts
+        sec_end: Offset where the section ends
         subsections: List of subsection titles/text from parser
     
     Returns:
@@ -382,94 +682,92 @@ def _extract_subsection_items(section_content: str, subsections: List[str]) -> T
     environment_wrapper = None
     
     # Detect environment wrapper using the helper function
-    environment_wrapper = _detect_environment_wrapper(section_content)
+    environment_wrapper = _detect_environment_wrapper(latex_code, sec_start, sec_end)
     
     if environment_wrapper:
-        logger.info(f"[SPLIT] Detected environment wrapper: {environment_wrapper['name']} ({environment_wrapper['open_command']} ... {environment_wrapper['close_command']})")
+        logger.info("[SPLIT] Detected environment wrapper: %s (%s ... %s)",
+                    environment_wrapper['name'], environment_wrapper['open_command'],
+                    environment_wrapper['close_command'])
     
-    # Strategy: Find each subsection text and look backward for LaTeX command
-    for i, subsection_text in enumerate(subsections):
+    # Tokenize all command boundaries once; each subsection then finds its
+    # wrapping command with a bisect instead of re-scanning a lookback slice
+    boundaries = [(m.start(), m.group()) for m in _RE_ITEM_BOUNDARY.finditer(latex_code, sec_start, sec_end)]
+    starts = [b[0] for b in boundaries]
+
+    # Locate every subsection's text once up front - adjacent matches then
+    # define item spans, instead of re-searching the section tail per item
+    located = []
+    for subsection_text in subsections:
         # Clean subsection text for searching (remove extra whitespace)
         search_text = ' '.join(subsection_text.split())
-        
-        # Find position in section content
-        # Use flexible regex to handle whitespace variations
-        pattern = re.escape(search_text).replace(r'\ ', r'\s+')
-        match = re.search(pattern, section_content, re.IGNORECASE)
-        
-        if not match:
-            # Try just first few words if full text not found
-            first_words = ' '.join(search_text.split()[:3])
-            pattern = re.escape(first_words).replace(r'\ ', r'\s+')
-            match = re.search(pattern, section_content, re.IGNORECASE)
-        
+        located.append((search_text, _search_subsection_text(search_text, latex_code, sec_start, sec_end)))
+
+    # Strategy: Use each located text and look backward for LaTeX command
+    for i, (search_text, match) in enumerate(located):
         if match:
             text_start = match.start()
             
             # Look backward from text_start to find the LaTeX command that wraps it
             # Common patterns: \textbf{TEXT}, \item TEXT, etc.
             item_start = text_start
-            
-            # Search backward for \textbf{ or \item or newline
-            lookback_limit = max(0, text_start - 50)  # Look back up to 50 chars
-            lookback_content = section_content[lookback_limit:text_start]
-            
-            # Find the last occurrence of common LaTeX commands
-            last_textbf = lookback_content.rfind('\\textbf{')
-            last_item = lookback_content.rfind('\\item')
-            last_newline = lookback_content.rfind('\n')
-            
+
+            # Search backward for \textbf{ or \item or newline (within the
+            # lookback window) via the pre-tokenized boundary index
+            lookback_limit = max(sec_start, text_start - _ITEM_LOOKBACK_CHARS)
+            last_textbf, last_item, last_newline = _last_boundaries_in_window(
+                boundaries, starts, text_start, lookback_limit
+            )
+
             # Take the closest command to our text
             if last_textbf != -1 and (last_newline == -1 or last_textbf > last_newline):
                 # Found \textbf{ before the text, include it
-                item_start = lookback_limit + last_textbf
+                item_start = last_textbf
             elif last_item != -1 and (last_newline == -1 or last_item > last_newline):
                 # Found \item before the text, include it
-                item_start = lookback_limit + last_item
+                item_start = last_item
             elif last_newline != -1:
                 # Start from after the newline
-                item_start = lookback_limit + last_newline + 1
+                item_start = last_newline + 1
             
             # Find where this item ends (start of next item or end of section)
             if i + 1 < len(subsections):
-                # Find next subsection
-                next_text = ' '.join(subsections[i + 1].split())
-                next_pattern = re.escape(next_text).replace(r'\ ', r'\s+')
-                # Search from current match end
-                search_start = match.end()
-                next_match = re.search(next_pattern, section_content[search_start:], re.IGNORECASE)
-                
+                # Use the pre-located next subsection; only re-anchor past the
+                # current match when duplicate text made it match too early
+                next_match = located[i + 1][1]
+                if next_match is not None and next_match.start() < match.end():
+                    next_match = _search_subsection_text(
+                        located[i + 1][0], latex_code, pos=match.end(), endpos=sec_end
+                    )
+
                 if next_match:
                     # Look backward from next match to find its LaTeX command
-                    next_text_pos = search_start + next_match.start()
-                    next_lookback_limit = max(item_start, next_text_pos - 50)
-                    next_lookback = section_content[next_lookback_limit:next_text_pos]
-                    
-                    next_last_textbf = next_lookback.rfind('\\textbf{')
-                    next_last_item = next_lookback.rfind('\\item')
-                    next_last_newline = next_lookback.rfind('\n')
-                    
+                    next_text_pos = next_match.start()
+                    next_lookback_limit = max(item_start, next_text_pos - _ITEM_LOOKBACK_CHARS)
+                    next_last_textbf, next_last_item, next_last_newline = _last_boundaries_in_window(
+                        boundaries, starts, next_text_pos, next_lookback_limit
+                    )
+
                     if next_last_textbf != -1 and (next_last_newline == -1 or next_last_textbf > next_last_newline):
-                        item_end = next_lookback_limit + next_last_textbf
+                        item_end = next_last_textbf
                     elif next_last_item != -1 and (next_last_newline == -1 or next_last_item > next_last_newline):
-                        item_end = next_lookback_limit + next_last_item
+                        item_end = next_last_item
                     else:
                         item_end = next_text_pos
                 else:
-                    item_end = len(section_content)
+                    item_end = sec_end
             else:
                 # Last item goes to end of section
-                item_end = len(section_content)
+                item_end = sec_end
             
-            # Extract item content
-            item_content = section_content[item_start:item_end]
+            # Extract item content - the only slice made for this item
+            item_content = latex_code[item_start:item_end]
             
             # Defensive check: Remove any \end{document} from item content
             # This can happen when the last item includes the document closing
             if '\\end{document}' in item_content:
                 end_doc_pos = item_content.find('\\end{document}')
                 item_content = item_content[:end_doc_pos].rstrip()
-                logger.info(f"[SPLIT] Removed \\end{{document}} from item_{i} in subsection extraction")
+                logger.info("[SPLIT] Removed \\end{document} from item_%d in subsection extraction", i)
             
             # For non-last items, add blank line for proper spacing between items
             # Strip trailing whitespace but add back blank line
@@ -482,26 +780,37 @@ def _extract_subsection_items(section_content: str, subsections: List[str]) -> T
             
             items[f'item_{i}'] = item_content
         else:
-            logger.warning(f"[SPLIT] Could not find subsection in content: {subsection_text[:50]}...")
+            logger.warning("[SPLIT] Could not find subsection in content: %s...", search_text[:50])
     
     return items, environment_wrapper
 
 
+@lru_cache(maxsize=1024)
 def _normalize_section_key(title: str) -> str:
     """
     Normalize section title to use as dictionary key.
-    
+    Memoized - the same titles recur across parse, metadata and every
+    filter regeneration, so repeats become a dict lookup.
+
     Args:
         title: Section title from parser
-    
+
     Returns:
         Normalized key string (lowercase, underscores)
     """
-    # Convert to lowercase and replace spaces/special chars with underscores
-    key = re.sub(r'[^a-z0-9]+', '_', title.lower())
+    # Convert to lowercase and replace spaces/special chars with underscores.
+    # ASCII titles (the typical case) go through str.translate, which for
+    # short strings beats the regex engine's per-call dispatch
+    lowered = title.lower()
+    if lowered.isascii():
+        key = lowered.translate(_NORMALIZE_TABLE)
+        # Collapse runs of underscores left by adjacent specials
+        while '__' in key:
+            key = key.replace('__', '_')
+    else:
+        key = _RE_NORMALIZE.sub('_', lowered)
     # Remove leading/trailing underscores
-    key = key.strip('_')
-    return key
+    return key.strip('_')
 
 
 def get_section_metadata(parsed_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
@@ -556,15 +865,35 @@ def get_section_metadata(parsed_data: Dict[str, Any]) -> Dict[str, Dict[str, Any
                     'label': label
                 }
         
-        logger.info(f"[METADATA] Generated metadata for {len(metadata)} sections")
+        logger.info("[METADATA] Generated metadata for %d sections", len(metadata))
         
         return metadata
         
     except Exception as e:
-        logger.error(f"[METADATA ERROR] Failed to generate metadata: {e}")
+        logger.error("[METADATA ERROR] Failed to generate metadata: %s", e)
         raise Exception(f"Failed to generate section metadata: {str(e)}")
 
 
+def _normalize_selections(selections: Dict[str, Any]) -> Dict[str, Tuple[bool, Optional[Tuple[int, ...]]]]:
+    """
+    Normalize frontend selections into uniform (enabled, items) tuples.
+
+    Simple boolean selections become (flag, None); complex dict selections
+    become (enabled, tuple_of_item_indices). One pass here means the
+    assembly loop is a plain tuple unpack with no per-section isinstance
+    checks or dict .get calls. Entries of unknown shape are dropped, which
+    matches the old loop falling through without adding anything.
+    """
+    normalized = {}
+    for key, selection in selections.items():
+        if isinstance(selection, bool):
+            normalized[key] = (selection, None)
+        elif isinstance(selection, dict):
+            normalized[key] = (selection.get('enabled', False),
+                               tuple(selection.get('items', ())))
+    return normalized
+
+
 def generate_filtered_latex(parsed_data: Dict[str, Any], selections: Dict[str, Any]) -> str:
     """
     Assemble final LaTeX from selected blocks (lego pieces).
@@ -589,19 +918,24 @@ def generate_filtered_latex(parsed_data: Dict[str, Any], selections: Dict[str, A
         if not latex_blocks:
             raise ValueError("Invalid parsed_data: missing latex_blocks")
         
-        logger.info(f"[FILTER] Generating filtered LaTeX - Selections: {selections}")
-        logger.info(f"[FILTER] Available sections: {list(latex_blocks.get('sections', {}).keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[FILTER] Generating filtered LaTeX - Selections: %s", selections)
+            logger.info("[FILTER] Available sections: %s", list(latex_blocks.get('sections', {}).keys()))
         
         # Save original LaTeX for comparison
         original_latex = parsed_data.get('original_latex', '')
-        if original_latex:
+        # Two full scans of the original document, purely diagnostic - skip
+        # them entirely when INFO logging is off
+        if original_latex and logger.isEnabledFor(logging.INFO):
             original_braces_open = original_latex.count('{')
             original_braces_close = original_latex.count('}')
-            logger.info(f"[FILTER] Original LaTeX braces - Open: {original_braces_open}, Close: {original_braces_close}, Diff: {original_braces_open - original_braces_close}")
+            logger.info("[FILTER] Original LaTeX braces - Open: %d, Close: %d, Diff: %d",
+                        original_braces_open, original_braces_close,
+                        original_braces_open - original_braces_close)
         
         # Start with preamble (always included)
         latex_parts = [latex_blocks.get('preamble', '')]
-        logger.info(f"[FILTER] Added preamble ({len(latex_parts[0])} chars)")
+        logger.info("[FILTER] Added preamble (%d chars)", len(latex_parts[0]))
         
         # Process each section in document order (not dict order)
         sections = latex_blocks.get('sections', {})
@@ -614,127 +948,119 @@ def generate_filtered_latex(parsed_data: Dict[str, Any], selections: Dict[str, A
             if section_key in sections:
                 ordered_keys.append(section_key)
         
-        logger.info(f"[FILTER] Processing sections in document order: {ordered_keys}")
+        logger.info("[FILTER] Processing sections in document order: %s", ordered_keys)
         
+        # Normalize selections once so the loop below is a tuple unpack per
+        # section instead of isinstance checks and nested dict gets
+        normalized_selections = _normalize_selections(selections)
+
         for section_key in ordered_keys:
             section_data = sections[section_key]
             # Check if this section is selected
-            selection = selections.get(section_key)
+            selection = normalized_selections.get(section_key)
             
-            logger.info(f"[FILTER] Processing section '{section_key}' - Selection: {selection}")
+            logger.info("[FILTER] Processing section '%s' - Selection: %s", section_key, selection)
             
             if selection is None:
                 # Section not in selections, skip
-                logger.debug(f"[FILTER] Section '{section_key}' not in selections, skipping")
+                logger.debug("[FILTER] Section '%s' not in selections, skipping", section_key)
                 continue
             
-            # Handle simple sections (boolean)
-            if isinstance(selection, bool):
-                if selection:
-                    # Include entire section
-                    content = section_data.get('full_content', '')
-                    logger.info(f"[FILTER] Adding simple section '{section_key}' ({len(content)} chars)")
-                    latex_parts.append(content)
+            enabled, selected_items = selection
+
+            if not enabled:
+                continue
+
+            # Simple section: include the whole block
+            if selected_items is None:
+                content = section_data.get('full_content', '')
+                logger.info("[FILTER] Adding simple section '%s' (%d chars)", section_key, len(content))
+                latex_parts.append(content)
                 continue
             
-            # Handle complex sections (dict with enabled + items)
-            if isinstance(selection, dict):
-                enabled = selection.get('enabled', False)
-                selected_items = selection.get('items', [])
-                
-                logger.info(f"[FILTER] Complex section '{section_key}' - enabled: {enabled}, items: {selected_items}")
-                
-                if not enabled:
-                    continue
-                
-                # Add section header
+            # Complex section: header (with environment opening when one
+            # was detected at split time) plus selected items
+            environment_wrapper = section_data.get('environment_wrapper')
+            has_wrapper = bool(environment_wrapper and selected_items)
+            if has_wrapper:
+                header = section_data['header_plus_open']
+            else:
                 header = section_data.get('section_header', '')
-                logger.info(f"[FILTER] Adding section header for '{section_key}' ({len(header)} chars)")
-                latex_parts.append(header)
-                
-                # Check for environment wrapper
-                environment_wrapper = section_data.get('environment_wrapper')
-                if environment_wrapper and selected_items:
-                    # Add environment opening command
-                    env_open = environment_wrapper['open_command']
-                    logger.info(f"[FILTER] Adding environment opening '{env_open}' for '{section_key}'")
-                    latex_parts.append(env_open)
-                
-                # Add selected items
-                items = section_data.get('items', {})
-                logger.info(f"[FILTER] Available items in '{section_key}': {list(items.keys())}")
-                for item_idx in selected_items:
-                    item_key = f'item_{item_idx}'
-                    if item_key in items:
-                        item_content = items[item_key]
-                        logger.info(f"[FILTER] Adding item '{item_key}' from '{section_key}' ({len(item_content)} chars)")
-                        latex_parts.append(item_content)
-                    else:
-                        logger.warning(f"[FILTER] Item '{item_key}' not found in section '{section_key}'")
+            logger.info("[FILTER] Adding section header for '%s' (%d chars)", section_key, len(header))
+            latex_parts.append(header)
+            
+            # Join selected items into one part instead of appending each
+            items = section_data.get('items', {})
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[FILTER] Available items in '%s': %s", section_key, list(items.keys()))
+            chosen_items = []
+            for item_idx in selected_items:
+                item_key = f'item_{item_idx}'
+                item_content = items.get(item_key)
+                if item_content is not None:
+                    logger.info("[FILTER] Adding item '%s' from '%s' (%d chars)",
+                                item_key, section_key, len(item_content))
+                    chosen_items.append(item_content)
+                else:
+                    logger.warning("[FILTER] Item '%s' not found in section '%s'", item_key, section_key)
+            if chosen_items:
+                latex_parts.append('\n'.join(chosen_items))
+            
+            # Add environment closing command if wrapper exists and items were added
+            if has_wrapper:
+                env_close = environment_wrapper['close_command']
                 
-                # Add environment closing command if wrapper exists and items were added
-                if environment_wrapper and selected_items:
-                    env_close = environment_wrapper['close_command']
-                    
-                    # Defensive check: Don't add closing tag if it's already in the section content
-                    # This prevents duplicate closing tags
-                    section_content = section_data.get('full_content', '')
-                    if env_close not in section_content:
-                        logger.info(f"[FILTER] Adding environment closing '{env_close}' for '{section_key}'")
-                        latex_parts.append(env_close)
-                    else:
-                        logger.info(f"[FILTER] Skipping duplicate environment closing '{env_close}' for '{section_key}' (already in content)")
+                # Skip the closing tag when the split step found it already
+                # inside the section content (prevents duplicates)
+                if section_data.get('append_close', True):
+                    logger.info("[FILTER] Adding environment closing '%s' for '%s'", env_close, section_key)
+                    latex_parts.append(env_close)
+                else:
+                    logger.info("[FILTER] Skipping duplicate environment closing '%s' for '%s' (already in content)",
+                            env_close, section_key)
         
         # Add closing (always included)
         closing = latex_blocks.get('closing', '')
         
         # Defensive check: Ensure only one \end{document} in closing
         if closing:
-            end_doc_pattern = r'\\end\s*\{\s*document\s*\}'
-            end_doc_matches = list(re.finditer(end_doc_pattern, closing))
+            end_doc_matches = list(_RE_END_DOCUMENT.finditer(closing))
             
             if len(end_doc_matches) > 1:
                 # Multiple \end{document} found, keep only the first one
                 first_end_pos = end_doc_matches[0].end()
                 closing = closing[:first_end_pos]
-                logger.warning(f"[FILTER] Found {len(end_doc_matches)} \\end{{document}} tags in closing, keeping only the first one")
+                logger.warning("[FILTER] Found %d \\end{document} tags in closing, keeping only the first one",
+                               len(end_doc_matches))
         
-        logger.info(f"[FILTER] Adding closing ({len(closing)} chars)")
+        logger.info("[FILTER] Adding closing (%d chars)", len(closing))
         latex_parts.append(closing)
         
+        # Check brace balance for debugging. Counted per part while each is
+        # still cache-hot rather than re-scanning the joined document twice
+        open_braces = 0
+        close_braces = 0
+        for part in latex_parts:
+            open_braces += part.count('{')
+            close_braces += part.count('}')
+
         # Concatenate all parts
         filtered_latex = '\n'.join(part for part in latex_parts if part)
-        
-        # Check brace balance for debugging
-        open_braces = filtered_latex.count('{')
-        close_braces = filtered_latex.count('}')
-        logger.info(f"[FILTER] Generated filtered LaTeX ({len(filtered_latex)} characters)")
-        logger.info(f"[FILTER] Brace count - Open: {open_braces}, Close: {close_braces}, Diff: {open_braces - close_braces}")
+        logger.info("[FILTER] Generated filtered LaTeX (%d characters)", len(filtered_latex))
+        logger.info("[FILTER] Brace count - Open: %d, Close: %d, Diff: %d",
+                    open_braces, close_braces, open_braces - close_braces)
         
         if open_braces != close_braces:
-            logger.warning(f"[FILTER] Brace mismatch detected! This will cause compilation errors.")
-            
-            # Save filtered and original latex to temp files for debugging
-            import os
-            temp_dir = Path(__file__).parent.parent / 'temp'
-            temp_dir.mkdir(exist_ok=True)
-            
-            # Save filtered
-            debug_file = temp_dir / 'filtered_debug.tex'
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(filtered_latex)
-            logger.info(f"[FILTER] Saved filtered LaTeX to {debug_file}")
+            logger.warning("[FILTER] Brace mismatch detected! This will cause compilation errors.")
             
-            # Save original for comparison
-            if original_latex:
-                original_file = temp_dir / 'original_debug.tex'
-                with open(original_file, 'w', encoding='utf-8') as f:
-                    f.write(original_latex)
-                logger.info(f"[FILTER] Saved original LaTeX to {original_file}")
+            # Save filtered and original latex for debugging - opt-in and
+            # off the request thread so callers never wait on disk I/O
+            if _DEBUG_DUMP:
+                _DUMP_EXECUTOR.submit(_dump_latex, filtered_latex, original_latex)
         
         return filtered_latex
         
     except Exception as e:
-        logger.error(f"[FILTER ERROR] Failed to generate filtered LaTeX: {e}")
+        logger.error("[FILTER ERROR] Failed to generate filtered LaTeX: %s", e)
         raise Exception(f"Failed to filter LaTeX sections: {str(e)}")
 
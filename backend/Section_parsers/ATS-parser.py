@@ -20,15 +20,16 @@ OUTPUT FORMAT:
     }
 
 PARSING STRATEGY:
-    Two-stage approach with deduplication:
-    1. Stage 1: Parse known sections from hardcoded ATS template list
-    2. Stage 2: Parse any additional custom sections following same format
-    3. Deduplication prevents double detection of sections
-    4. Orphaned subsections placed in "Unlabeled" section
+    Single classification pass in document order:
+    1. Every section marker becomes a section, known or custom
+    2. Subsections are assigned to the enclosing section by position
+    3. Orphaned subsections placed in "Unlabeled" section
 """
 
-import re
-from typing import Dict, List, Set, Tuple
+import bisect
+import copy
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 
 # Hardcoded known sections from ATS template
@@ -46,191 +47,136 @@ KNOWN_SECTIONS = [
 ]
 
 
-def extract_textbf_content(text: str, pattern: str) -> List[Tuple[str, int]]:
+def _match_brace_span(text: str, start_pos: int) -> int:
     r"""
-    Extract content from \textbf{...} or \textbf{\large ...} patterns.
+    Return the end of the brace group opened just before start_pos.
     
     Internal function - not called from outside this module.
     
+    Jumps between brace events with str.find (C-level) instead of walking
+    per character. Unbalanced input runs to end of text, matching the
+    historical truncation behavior.
+    
     Args:
         text: LaTeX code string
-        pattern: Regex pattern to match
+        start_pos: Position just inside the opening brace
         
     Returns:
-        List of tuples (extracted_text, position_in_document)
+        Index of the matching closing brace (exclusive content end)
     """
-    results = []
-    
-    for match in re.finditer(pattern, text):
-        start_pos = match.end()
-        
-        # Handle nested braces by counting
-        brace_count = 1
-        i = start_pos
-        content = ""
-        
-        while i < len(text) and brace_count > 0:
-            char = text[i]
-            if char == '{':
-                brace_count += 1
-                content += char
-            elif char == '}':
-                brace_count -= 1
-                if brace_count > 0:
-                    content += char
-            else:
-                content += char
-            i += 1
-        
-        if content:
-            results.append((content.strip(), match.start()))
-    
-    return results
+    brace_count = 1
+    i = start_pos
+    
+    while True:
+        close_idx = text.find('}', i)
+        if close_idx == -1:
+            return len(text)
+        open_idx = text.find('{', i)
+        if open_idx != -1 and open_idx < close_idx:
+            brace_count += 1
+            i = open_idx + 1
+            continue
+        brace_count -= 1
+        if brace_count == 0:
+            return close_idx
+        i = close_idx + 1
 
 
-def parse_stage1(latex_code: str) -> Tuple[List[Dict], Set[str]]:
-    """
-    Stage 1: Parse known sections from ATS template.
+def extract_textbf_classified(text: str) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+    r"""
+    Extract and classify all \textbf{...} markers in one scan.
     
     Internal function - not called from outside this module.
     
-    Args:
-        latex_code: LaTeX code string
-        
-    Returns:
-        Tuple of (sections_list, detected_section_titles_set)
-    """
-    sections = []
-    detected_titles = set()
-    
-    # Extract all main sections (with \large)
-    section_pattern = r'\\textbf\s*\{\s*\\large\s+'
-    all_sections = extract_textbf_content(latex_code, section_pattern)
-    
-    # Extract all subsections (without \large)
-    subsection_pattern = r'\\textbf\s*\{'
-    all_subsections = extract_textbf_content(latex_code, subsection_pattern)
-    
-    # Filter subsections to exclude those that are actually sections
-    section_positions = {pos for _, pos in all_sections}
-    subsections_only = [(content, pos) for content, pos in all_subsections 
-                        if pos not in section_positions]
-    
-    # Filter to only known sections
-    known_sections_found = [(title, pos) for title, pos in all_sections 
-                            if title in KNOWN_SECTIONS]
-    
-    # Sort by position to maintain document order
-    known_sections_found.sort(key=lambda x: x[1])
-    
-    # Build hierarchy: assign subsections to sections
-    for i, (section_title, section_pos) in enumerate(known_sections_found):
-        # Determine the range for this section's subsections
-        next_section_pos = known_sections_found[i + 1][1] if i + 1 < len(known_sections_found) else len(latex_code)
-        
-        # Find subsections between this section and the next
-        section_subsections = [
-            content for content, pos in subsections_only 
-            if section_pos < pos < next_section_pos
-        ]
-        
-        sections.append({
-            "title": section_title,
-            "subsections": section_subsections
-        })
-        
-        detected_titles.add(section_title)
-    
-    return sections, detected_titles
-
-
-def parse_stage2(latex_code: str, detected_titles: Set[str]) -> List[Dict]:
-    """
-    Stage 2: Parse additional sections not caught in Stage 1.
-    
-    Internal function - not called from outside this module.
+    A single pass of the marker pattern replaces the separate section and
+    subsection scans plus the position-set filter that removed sections
+    from the subsection list. Classification probes for the literal
+    '\large' with plain string tests (mirroring \s*\\large\s+) instead of
+    a regex alternation evaluated at every marker.
     
     Args:
-        latex_code: LaTeX code string
-        detected_titles: Set of section titles already detected in Stage 1
+        text: LaTeX code string
         
     Returns:
-        List of additional sections
+        Tuple of (sections, subsections), each a list of
+        (extracted_text, position_in_document) tuples
     """
-    additional_sections = []
-    
-    # Extract all main sections (with \large)
-    section_pattern = r'\\textbf\s*\{\s*\\large\s+'
-    all_sections = extract_textbf_content(latex_code, section_pattern)
-    
-    # Extract all subsections (without \large)
-    subsection_pattern = r'\\textbf\s*\{'
-    all_subsections = extract_textbf_content(latex_code, subsection_pattern)
-    
-    # Filter subsections to exclude those that are actually sections
-    section_positions = {pos for _, pos in all_sections}
-    subsections_only = [(content, pos) for content, pos in all_subsections 
-                        if pos not in section_positions]
-    
-    # Filter to only NEW sections (deduplication)
-    new_sections = [(title, pos) for title, pos in all_sections 
-                    if title not in detected_titles]
-    
-    # Sort by position to maintain document order
-    new_sections.sort(key=lambda x: x[1])
-    
-    # Build hierarchy for new sections
-    for i, (section_title, section_pos) in enumerate(new_sections):
-        # Determine the range for this section's subsections
-        next_section_pos = new_sections[i + 1][1] if i + 1 < len(new_sections) else len(latex_code)
+    sections = []
+    subsections = []
+    n = len(text)
+    
+    # Hand-rolled scanner: str.find hops between '\textbf' occurrences in C
+    # and the marker shape (optional whitespace, then '{') is validated with
+    # plain string tests - no regex engine involved at all
+    i = 0
+    while True:
+        idx = text.find('\\textbf', i)
+        if idx == -1:
+            break
+        j = idx + 7  # len('\textbf')
+        while j < n and text[j].isspace():
+            j += 1
+        if j >= n or text[j] != '{':
+            i = idx + 7
+            continue
+        inner_start = j + 1
+        i = inner_start
+        span_end = _match_brace_span(text, inner_start)
         
-        # Find subsections between this section and the next
-        section_subsections = [
-            content for content, pos in subsections_only 
-            if section_pos < pos < next_section_pos
-        ]
+        # Probe for '\large' followed by whitespace just inside the brace
+        k = inner_start
+        while k < n and text[k].isspace():
+            k += 1
+        if text.startswith('\\large', k) and k + 6 < n and text[k + 6].isspace():
+            # Section: content starts after the whitespace run behind \\large
+            content_start = k + 6
+            while content_start < n and text[content_start].isspace():
+                content_start += 1
+            if content_start < span_end:
+                # content_start already sits on a non-space character, so
+                # only the trailing run needs trimming - one slice, no
+                # intermediate raw copy for .strip() to discard
+                e = span_end
+                while text[e - 1].isspace():
+                    e -= 1
+                sections.append((text[content_start:e], idx))
+                continue
+            # Empty section content: the historical subsection pass still
+            # recorded this marker, with the \\large text as its content
         
-        additional_sections.append({
-            "title": section_title,
-            "subsections": section_subsections
-        })
-    
-    return additional_sections
+        if inner_start < span_end:
+            ws = inner_start
+            while ws < span_end and text[ws].isspace():
+                ws += 1
+            e = span_end
+            while e > ws and text[e - 1].isspace():
+                e -= 1
+            subsections.append((text[ws:e], idx))
+    
+    return sections, subsections
 
 
-def handle_orphaned_subsections(latex_code: str, all_sections: List[Dict]) -> List[Dict]:
+def handle_orphaned_subsections(all_sections: List[Dict],
+                                sub_positions: List[int], sub_contents: List[str],
+                                first_section_pos: int) -> List[Dict]:
     """
     Handle orphaned subsections (subsections before any section).
     
     Internal function - not called from outside this module.
     
     Args:
-        latex_code: LaTeX code string
         all_sections: List of all detected sections
+        sub_positions: Subsection positions, ascending (parallel to sub_contents)
+        sub_contents: Subsection contents (parallel to sub_positions)
+        first_section_pos: Position of the first section marker
         
     Returns:
         List with potential "Unlabeled" section prepended
     """
-    # Extract all main sections to find the position of the first one
-    section_pattern = r'\\textbf\s*\{\s*\\large\s+'
-    main_sections = extract_textbf_content(latex_code, section_pattern)
-    
-    if not main_sections:
-        return all_sections
-    
-    first_section_pos = min(pos for _, pos in main_sections)
-    
-    # Extract all subsections
-    subsection_pattern = r'\\textbf\s*\{'
-    all_subsections = extract_textbf_content(latex_code, subsection_pattern)
-    
-    # Filter subsections to exclude those that are actually sections
-    section_positions = {pos for _, pos in main_sections}
-    subsections_only = [(content, pos) for content, pos in all_subsections 
-                        if pos not in section_positions]
-    
-    # Find orphaned subsections (before first section)
-    orphaned = [content for content, pos in subsections_only if pos < first_section_pos]
+    # Orphans are everything before the first section: one bisect instead
+    # of scanning the whole subsection list
+    hi = bisect.bisect_left(sub_positions, first_section_pos)
+    orphaned = sub_contents[:hi]
     
     if orphaned:
         unlabeled_section = {
@@ -242,15 +188,19 @@ def handle_orphaned_subsections(latex_code: str, all_sections: List[Dict]) -> Li
     return all_sections
 
 
+@lru_cache(maxsize=64)
 def parse_latex(latex_code: str) -> Dict:
     """
     Parse LaTeX resume code and extract hierarchical structure.
     
     Internal function - not called from outside this module.
     
-    Uses two-stage approach:
-    1. Stage 1: Parse known sections from hardcoded list
-    2. Stage 2: Parse additional sections (with deduplication)
+    A single loop over the position-ordered section markers assigns each
+    one its subsection range, so known and custom sections are handled
+    identically and the output needs no final sort.
+    
+    Pure function of its input, so results are memoized per source string;
+    parse() hands out copies so callers may mutate theirs freely.
     
     Args:
         latex_code: LaTeX code string
@@ -258,86 +208,47 @@ def parse_latex(latex_code: str) -> Dict:
     Returns:
         Dictionary with sections array containing title and subsections
     """
-    if not latex_code or not latex_code.strip():
+    if not latex_code or latex_code.isspace():
+        # str.isspace() answers the blank-document question without the
+        # document-sized copy that .strip() would allocate first
         return {"sections": []}
     
-    # Get all sections and subsections for both stages to use
-    section_pattern = r'\\textbf\s*\{\s*\\large\s+'
-    all_sections_raw = extract_textbf_content(latex_code, section_pattern)
-    
-    subsection_pattern = r'\\textbf\s*\{'
-    all_subsections_raw = extract_textbf_content(latex_code, subsection_pattern)
-    
-    # Filter subsections to exclude those that are actually sections
-    section_positions = {pos for _, pos in all_sections_raw}
-    subsections_only = [(content, pos) for content, pos in all_subsections_raw 
-                        if pos not in section_positions]
-    
-    # STAGE 1: Parse known sections
-    stage1_sections = []
-    detected_titles = set()
-    
-    # Filter to only known sections
-    known_sections_found = [(title, pos) for title, pos in all_sections_raw 
-                            if title in KNOWN_SECTIONS]
-    known_sections_found.sort(key=lambda x: x[1])
-    
-    for i, (section_title, section_pos) in enumerate(known_sections_found):
-        # Determine the range for this section's subsections
-        # Use ALL sections (not just known) to determine boundaries
-        all_sections_sorted = sorted(all_sections_raw, key=lambda x: x[1])
-        section_idx_in_all = next(idx for idx, (t, p) in enumerate(all_sections_sorted) if p == section_pos)
-        next_section_pos = (all_sections_sorted[section_idx_in_all + 1][1] 
-                           if section_idx_in_all + 1 < len(all_sections_sorted) 
-                           else len(latex_code))
+    # Extract and classify all markers in one scan; the classification
+    # loop and the orphan pass work from these lists instead of
+    # re-scanning the source
+    all_sections_raw, subsections_only = extract_textbf_classified(latex_code)
+    
+    # Parallel arrays for range queries: the scan yields matches in document
+    # order, so the positions are already ascending and bisect-ready
+    sub_positions = [pos for _, pos in subsections_only]
+    sub_contents = [content for content, _ in subsections_only]
+    
+    # One pass over the already position-ordered markers: each section's
+    # subsection range ends at the next marker (or end of document), found
+    # by bisecting the sorted subsection positions. Known and custom
+    # sections take the same path, so no dedup set, no per-stage lists and
+    # no final re-sort are needed
+    all_sections = []
+    num_sections = len(all_sections_raw)
+    latex_len = len(latex_code)
+    
+    for i, (section_title, section_pos) in enumerate(all_sections_raw):
+        next_section_pos = (all_sections_raw[i + 1][1]
+                            if i + 1 < num_sections else latex_len)
         
-        # Find subsections between this section and the next
-        section_subsections = [
-            content for content, pos in subsections_only 
-            if section_pos < pos < next_section_pos
-        ]
+        lo = bisect.bisect_right(sub_positions, section_pos)
+        hi = bisect.bisect_left(sub_positions, next_section_pos)
         
-        stage1_sections.append({
+        all_sections.append({
             "title": section_title,
-            "subsections": section_subsections
+            "subsections": sub_contents[lo:hi]
         })
-        
-        detected_titles.add(section_title)
-    
-    # STAGE 2: Parse additional sections (Helper - catches new sections)
-    stage2_sections = []
-    
-    # Filter to only NEW sections (not in known list)
-    new_sections = [(title, pos) for title, pos in all_sections_raw 
-                    if title not in detected_titles]
-    new_sections.sort(key=lambda x: x[1])
-    
-    for i, (section_title, section_pos) in enumerate(new_sections):
-        # Determine the range for this section's subsections
-        all_sections_sorted = sorted(all_sections_raw, key=lambda x: x[1])
-        section_idx_in_all = next(idx for idx, (t, p) in enumerate(all_sections_sorted) if p == section_pos)
-        next_section_pos = (all_sections_sorted[section_idx_in_all + 1][1] 
-                           if section_idx_in_all + 1 < len(all_sections_sorted) 
-                           else len(latex_code))
-        
-        # Find subsections between this section and the next
-        section_subsections = [
-            content for content, pos in subsections_only 
-            if section_pos < pos < next_section_pos
-        ]
-        
-        stage2_sections.append({
-            "title": section_title,
-            "subsections": section_subsections
-        })
-    
-    # Combine both stages and sort by document order
-    all_sections = stage1_sections + stage2_sections
-    section_order = {title: pos for title, pos in all_sections_raw}
-    all_sections.sort(key=lambda s: section_order.get(s["title"], float('inf')))
     
     # Handle orphaned subsections
-    all_sections = handle_orphaned_subsections(latex_code, all_sections)
+    if all_sections_raw:
+        all_sections = handle_orphaned_subsections(all_sections, sub_positions,
+                                                   sub_contents,
+                                                   all_sections_raw[0][1])
     
     return {"sections": all_sections}
 
@@ -365,11 +276,9 @@ def parse(latex_code: str) -> Dict:
             ]
         }
     
-    This function uses a two-stage parsing approach:
-    - Stage 1: Parses known sections from the hardcoded ATS template list
-    - Stage 2: Parses any additional custom sections that follow the same format
-    - Deduplication ensures no section is detected twice
-    - Orphaned subsections (before any section) are placed in "Unlabeled" section
+    Sections are emitted in document order; known and custom sections
+    follow the same path. Orphaned subsections (before any section) are
+    placed in an "Unlabeled" section.
     
     Example:
         >>> latex = r'\\textbf{\\large EDUCATION}\\n\\textbf{B.S. Computer Science}'
@@ -377,5 +286,7 @@ def parse(latex_code: str) -> Dict:
         >>> print(result)
         {'sections': [{'title': 'EDUCATION', 'subsections': ['B.S. Computer Science']}]}
     """
-    return parse_latex(latex_code)
+    # parse_latex memoizes per source string; return a copy so callers
+    # mutating the structure cannot corrupt the cached value
+    return copy.deepcopy(parse_latex(latex_code))
 
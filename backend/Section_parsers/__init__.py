@@ -11,11 +11,38 @@ Available parsers:
 - modern_parser: Parses Modern format (\section{Section})
 - cool_parser: Parses Cool/Anti-CV format (\NewPart{Section})
 - two_coloumn_parser: Parses Two-Column format (\section{Section})
+
+The parser files have hyphenated names (not valid Python identifiers), so
+they cannot be imported by dotted path. This module maps the underscore
+aliases above to their files and loads each one lazily (PEP 562) on first
+attribute access - importing the package executes nothing.
 """
 
-# Note: Parsers are loaded dynamically by section_selector.py
-# because module names contain hyphens (not valid Python identifiers)
+import importlib.util
+from pathlib import Path
+
+# Attribute alias -> source file stem (hyphenated)
+_PARSER_FILES = {
+    'ATS_parser': 'ATS-parser',
+    'modern_parser': 'modern-parser',
+    'cool_parser': 'cool-parser',
+    'two_coloumn_parser': 'two-coloumn-parser'
+}
 
-__all__ = []  # Parsers imported dynamically, not exposed at package level
+__all__ = sorted(_PARSER_FILES)
 __version__ = '1.0.0'
 
+
+def __getattr__(name):
+    if name in _PARSER_FILES:
+        parser_path = Path(__file__).parent / f'{_PARSER_FILES[name]}.py'
+        spec = importlib.util.spec_from_file_location(_PARSER_FILES[name], parser_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PARSER_FILES))
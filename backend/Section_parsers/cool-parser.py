@@ -20,15 +20,17 @@ OUTPUT FORMAT:
     }
 
 PARSING STRATEGY:
-    Two-stage approach with deduplication:
-    1. Stage 1: Parse known sections from hardcoded cool template list
-    2. Stage 2: Parse any additional custom sections following same format
-    3. Deduplication prevents double detection of sections
-    4. Orphaned subsections placed in "Unlabeled" section
+    Single classification pass in document order:
+    1. Every \NewPart marker becomes a section, known or custom
+    2. Skills sections collect \SkillsEntry commands, others \item entries
+    3. Orphaned subsections placed in "Unlabeled" section
 """
 
+import bisect
+import copy
 import re
-from typing import Dict, List, Set, Tuple
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 
 # Hardcoded known sections from cool template
@@ -40,47 +42,101 @@ KNOWN_SECTIONS = [
     "Achievements and Interests"
 ]
 
+# Compiled once at import: section/item/skills markers and the whitespace
+# normalizer. Calling the compiled objects directly skips the re-module
+# cache lookup that every re.finditer(pattern_string, ...) call pays
+_ITEM_RE = re.compile(r'\\item\s*\[[^\]]*\]\s*')
+_BOUNDARY_RE = re.compile(r'\\item\s*\[|\\end\s*\{itemize\}|\\NewPart\s*\{')
+_WS_RE = re.compile(r'\s+')
 
-def extract_newpart_sections(text: str) -> List[Tuple[str, int]]:
+
+def _match_brace_span(text: str, start_pos: int) -> int:
     r"""
-    Extract sections from \NewPart{SECTION_NAME} patterns.
+    Return the end of the brace group opened just before start_pos.
     
     Internal function - not called from outside this module.
     
+    Jumps between brace events with str.find (C-level) instead of walking
+    per character. Returns len(text) when the group is never closed.
+    
     Args:
         text: LaTeX code string
+        start_pos: Position just inside the opening brace
         
     Returns:
-        List of tuples (section_name, position_in_document)
+        Index of the matching closing brace (exclusive content end)
     """
-    results = []
-    pattern = r'\\NewPart\s*\{'
+    brace_count = 1
+    i = start_pos
+    
+    while True:
+        close_idx = text.find('}', i)
+        if close_idx == -1:
+            return len(text)
+        open_idx = text.find('{', i)
+        if open_idx != -1 and open_idx < close_idx:
+            brace_count += 1
+            i = open_idx + 1
+            continue
+        brace_count -= 1
+        if brace_count == 0:
+            return close_idx
+        i = close_idx + 1
+
+
+def _iter_newpart_sections(text: str):
+    r"""
+    Yield (section_name, position) for each \NewPart{SECTION_NAME} pattern.
     
-    for match in re.finditer(pattern, text):
-        start_pos = match.end()
-        
-        # Handle nested braces by counting
-        brace_count = 1
-        i = start_pos
-        content = ""
-        
-        while i < len(text) and brace_count > 0:
-            char = text[i]
-            if char == '{':
-                brace_count += 1
-                content += char
-            elif char == '}':
-                brace_count -= 1
-                if brace_count > 0:
-                    content += char
-            else:
-                content += char
-            i += 1
+    Internal function - not called from outside this module.
+    
+    Generator so the caller can consume it with list(), which fills the
+    list through CPython's geometric-growth fast path instead of a
+    method-lookup-per-append loop. The marker itself is located with a
+    hand-rolled str.find scan (optional whitespace, then '{') rather than
+    the regex engine.
+    """
+    n = len(text)
+    scan = 0
+    while True:
+        idx = text.find('\\NewPart', scan)
+        if idx == -1:
+            return
+        j = idx + 8  # len('\NewPart')
+        while j < n and text[j].isspace():
+            j += 1
+        if j >= n or text[j] != '{':
+            scan = idx + 8
+            continue
+        start_pos = j + 1
+        scan = start_pos
+        content_end = _match_brace_span(text, start_pos)
         
-        if content:
-            results.append((content.strip(), match.start()))
+        if start_pos < content_end:
+            # Trim by index instead of slicing the raw span and calling
+            # .strip() on it - one slice, no throwaway allocation
+            ws = start_pos
+            while ws < content_end and text[ws].isspace():
+                ws += 1
+            e = content_end
+            while e > ws and text[e - 1].isspace():
+                e -= 1
+            yield (text[ws:e], idx)
+
+
+def extract_newpart_sections(text: str) -> List[Tuple[str, int]]:
+    r"""
+    Extract sections from \NewPart{SECTION_NAME} patterns.
+    
+    Internal function - not called from outside this module.
     
-    return results
+    Args:
+        text: LaTeX code string
+        
+    Returns:
+        List of tuples (section_name, position_in_document)
+    """
+    return list(_iter_newpart_sections(text))
 
 
 def extract_item_subsections(text: str, start_pos: int, end_pos: int) -> List[str]:
@@ -99,39 +155,25 @@ def extract_item_subsections(text: str, start_pos: int, end_pos: int) -> List[st
     """
     subsections = []
     
-    # Pattern to match \item[...] followed by content
-    # Matches: \item[anything] followed by text until next \item, \end{itemize}, or \NewPart
-    pattern = r'\\item\s*\[[^\]]*\]\s*'
-    
     section_text = text[start_pos:end_pos]
     
-    for match in re.finditer(pattern, section_text):
+    # Tokenize every possible content boundary (next \item, \end{itemize},
+    # \NewPart) in one pass; each item then finds its end with a bisect
+    # instead of three regex searches over the remaining tail
+    boundaries = [m.start() for m in _BOUNDARY_RE.finditer(section_text)]
+    
+    for match in _ITEM_RE.finditer(section_text):
         content_start = match.end()
         
-        # Find the end of this item's content
-        # Look for next \item, \end{itemize}, or end of section
-        next_item = re.search(r'\\item\s*\[', section_text[content_start:])
-        end_itemize = re.search(r'\\end\s*\{itemize\}', section_text[content_start:])
-        new_part = re.search(r'\\NewPart\s*\{', section_text[content_start:])
-        
-        # Find the nearest boundary
-        boundaries = []
-        if next_item:
-            boundaries.append(next_item.start())
-        if end_itemize:
-            boundaries.append(end_itemize.start())
-        if new_part:
-            boundaries.append(new_part.start())
+        # First boundary at or after the content start ends this item;
+        # otherwise it runs to the end of the section
+        idx = bisect.bisect_left(boundaries, content_start)
+        content_end = boundaries[idx] if idx < len(boundaries) else len(section_text)
         
-        if boundaries:
-            content_end = min(boundaries)
-        else:
-            content_end = len(section_text) - content_start
-        
-        content = section_text[content_start:content_start + content_end].strip()
+        content = section_text[content_start:content_end].strip()
         
         # Clean up whitespace and newlines
-        content = re.sub(r'\s+', ' ', content)
+        content = _WS_RE.sub(' ', content)
         
         if content:
             subsections.append(content)
@@ -153,31 +195,61 @@ def extract_skills_entries(text: str, start_pos: int, end_pos: int) -> List[str]
     Returns:
         List of formatted skills as "Category: Description"
     """
-    skills = []
     section_text = text[start_pos:end_pos]
-    
-    # Pattern to match \SkillsEntry{Category}{Description}
-    pattern = r'\\SkillsEntry\s*\{([^}]+)\}\s*\{([^}]+)\}'
-    
-    for match in re.finditer(pattern, section_text):
-        category = match.group(1).strip()
-        description = match.group(2).strip()
+    n = len(section_text)
+    entries = []
+    
+    # Hand-rolled scanner mirroring the marker scan: str.find locates each
+    # \SkillsEntry, then two shared brace walks pick out the category and
+    # description groups - no regex engine involved. Nested braces inside
+    # either group are tolerated (the old [^}]+ pattern rejected them);
+    # malformed entries are skipped
+    idx = 0
+    while True:
+        idx = section_text.find('\\SkillsEntry', idx)
+        if idx == -1:
+            break
+        j = idx + 12  # len('\SkillsEntry')
+        idx = j
+        while j < n and section_text[j].isspace():
+            j += 1
+        if j >= n or section_text[j] != '{':
+            continue
+        cat_start = j + 1
+        cat_end = _match_brace_span(section_text, cat_start)
+        if cat_end >= n or cat_end == cat_start:
+            continue
+        
+        j = cat_end + 1
+        while j < n and section_text[j].isspace():
+            j += 1
+        if j >= n or section_text[j] != '{':
+            continue
+        desc_start = j + 1
+        desc_end = _match_brace_span(section_text, desc_start)
+        if desc_end >= n or desc_end == desc_start:
+            continue
         
         # Format as "Category: Description"
-        skills.append(f"{category}: {description}")
+        entries.append(f"{section_text[cat_start:cat_end].strip()}: "
+                       f"{section_text[desc_start:desc_end].strip()}")
     
-    return skills
+    return entries
 
 
+@lru_cache(maxsize=64)
 def parse_latex(latex_code: str) -> Dict:
     """
     Parse LaTeX resume code and extract hierarchical structure.
     
     Internal function - not called from outside this module.
     
-    Uses two-stage approach:
-    1. Stage 1: Parse known sections from hardcoded list
-    2. Stage 2: Parse additional sections (with deduplication)
+    A single loop over the position-ordered section markers extracts each
+    one's content range, so known and custom sections are handled
+    identically and the output needs no final sort.
+    
+    Pure function of its input, so results are memoized per source string;
+    parse() hands out copies so callers may mutate theirs freely.
     
     Args:
         latex_code: LaTeX code string
@@ -185,34 +257,30 @@ def parse_latex(latex_code: str) -> Dict:
     Returns:
         Dictionary with sections array containing title and subsections
     """
-    if not latex_code or not latex_code.strip():
+    if not latex_code or latex_code.isspace():
+        # str.isspace() answers the blank-document question without the
+        # document-sized copy that .strip() would allocate first
         return {"sections": []}
     
-    # Extract all sections
+    # Extract all sections; the scanner yields them in document order, so
+    # no position sort is needed
     all_sections_raw = extract_newpart_sections(latex_code)
     
     if not all_sections_raw:
         return {"sections": []}
     
-    # Sort sections by position to maintain document order
-    all_sections_raw.sort(key=lambda x: x[1])
-    
-    # STAGE 1: Parse known sections
-    stage1_sections = []
-    detected_titles = set()
-    
-    # Filter to only known sections
-    known_sections_found = [(title, pos) for title, pos in all_sections_raw 
-                            if title in KNOWN_SECTIONS]
-    
-    for i, (section_title, section_pos) in enumerate(known_sections_found):
-        # Determine the range for this section's content
-        # Use ALL sections (not just known) to determine boundaries
-        all_sections_sorted = sorted(all_sections_raw, key=lambda x: x[1])
-        section_idx_in_all = next(idx for idx, (t, p) in enumerate(all_sections_sorted) if p == section_pos)
-        next_section_pos = (all_sections_sorted[section_idx_in_all + 1][1] 
-                           if section_idx_in_all + 1 < len(all_sections_sorted) 
-                           else len(latex_code))
+    # One pass over the position-ordered markers: each section's content
+    # range ends at the next marker (or end of document). Known and custom
+    # sections take the same path - only Skills keeps its dedicated
+    # extractor - so no dedup set, no per-stage lists and no final re-sort
+    # are needed
+    all_sections = []
+    num_sections = len(all_sections_raw)
+    latex_len = len(latex_code)
+    
+    for i, (section_title, section_pos) in enumerate(all_sections_raw):
+        next_section_pos = (all_sections_raw[i + 1][1]
+                            if i + 1 < num_sections else latex_len)
         
         # Special handling for Skills section
         if section_title == "Skills":
@@ -221,54 +289,21 @@ def parse_latex(latex_code: str) -> Dict:
             # Extract subsections from \item[...] patterns
             section_subsections = extract_item_subsections(latex_code, section_pos, next_section_pos)
         
-        stage1_sections.append({
-            "title": section_title,
-            "subsections": section_subsections
-        })
-        
-        detected_titles.add(section_title)
-    
-    # STAGE 2: Parse additional sections (Helper - catches new sections)
-    stage2_sections = []
-    
-    # Filter to only NEW sections (not in known list)
-    new_sections = [(title, pos) for title, pos in all_sections_raw 
-                    if title not in detected_titles]
-    
-    for i, (section_title, section_pos) in enumerate(new_sections):
-        # Determine the range for this section's content
-        all_sections_sorted = sorted(all_sections_raw, key=lambda x: x[1])
-        section_idx_in_all = next(idx for idx, (t, p) in enumerate(all_sections_sorted) if p == section_pos)
-        next_section_pos = (all_sections_sorted[section_idx_in_all + 1][1] 
-                           if section_idx_in_all + 1 < len(all_sections_sorted) 
-                           else len(latex_code))
-        
-        # Extract subsections from \item[...] patterns
-        section_subsections = extract_item_subsections(latex_code, section_pos, next_section_pos)
-        
-        stage2_sections.append({
+        all_sections.append({
             "title": section_title,
             "subsections": section_subsections
         })
     
-    # Combine both stages and sort by document order
-    all_sections = stage1_sections + stage2_sections
-    section_order = {title: pos for title, pos in all_sections_raw}
-    all_sections.sort(key=lambda s: section_order.get(s["title"], float('inf')))
-    
     # Handle orphaned subsections (items before first section)
-    if all_sections_raw:
-        first_section_pos = min(pos for _, pos in all_sections_raw)
-        
-        # Check for orphaned items
-        orphaned_items = extract_item_subsections(latex_code, 0, first_section_pos)
-        
-        if orphaned_items:
-            unlabeled_section = {
-                "title": "Unlabeled",
-                "subsections": orphaned_items
-            }
-            all_sections = [unlabeled_section] + all_sections
+    first_section_pos = all_sections_raw[0][1]
+    orphaned_items = extract_item_subsections(latex_code, 0, first_section_pos)
+    
+    if orphaned_items:
+        unlabeled_section = {
+            "title": "Unlabeled",
+            "subsections": orphaned_items
+        }
+        all_sections = [unlabeled_section] + all_sections
     
     return {"sections": all_sections}
 
@@ -296,11 +331,10 @@ def parse(latex_code: str) -> Dict:
             ]
         }
     
-    This function uses a two-stage parsing approach:
-    - Stage 1: Parses known sections from the hardcoded cool template list
-    - Stage 2: Parses any additional custom sections that follow the same format
-    - Deduplication ensures no section is detected twice
-    - Orphaned subsections (before any section) are placed in "Unlabeled" section
+    Sections are emitted in document order; known and custom sections
+    follow the same path, with \SkillsEntry extraction reserved for the
+    Skills section. Orphaned subsections (before any section) are placed
+    in an "Unlabeled" section.
     
     Example:
         >>> latex = r'\\NewPart{Key}\\n\\begin{itemize}\\n\\item[x] Test\\n\\end{itemize}'
@@ -308,5 +342,7 @@ def parse(latex_code: str) -> Dict:
         >>> print(result)
         {'sections': [{'title': 'Key', 'subsections': ['Test']}]}
     """
-    return parse_latex(latex_code)
+    # parse_latex memoizes per source string; return a copy so callers
+    # mutating the structure cannot corrupt the cached value
+    return copy.deepcopy(parse_latex(latex_code))
 
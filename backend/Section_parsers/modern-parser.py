@@ -20,13 +20,13 @@ OUTPUT FORMAT:
     }
 
 PARSING STRATEGY:
-    Two-stage approach with deduplication:
-    1. Stage 1: Parse known sections from hardcoded Modern template list
-    2. Stage 2: Parse any additional custom sections following same format
-    3. Deduplication prevents double detection of sections
-    4. Orphaned subsections placed in "Unlabeled" section
+    Single classification pass in document order:
+    1. Every \section marker becomes a section, known or custom
+    2. \textbf headers are assigned to the enclosing section by position
+    3. Orphaned subsections placed in "Unlabeled" section
 """
 
+import bisect
 import re
 from typing import Dict, List, Set, Tuple
 
@@ -43,108 +43,112 @@ KNOWN_SECTIONS = [
     "Achievements"
 ]
 
+# Frozen sets for O(1) membership tests; the list above stays for ordered
+# iteration. The no-subsection pair was previously a list literal rebuilt
+# on every section marker
+_KNOWN_SECTIONS_SET = frozenset(KNOWN_SECTIONS)
+_NO_SUBSECTION_SET = frozenset({"Professional Summary", "Achievements"})
 
-def extract_section_titles(text: str) -> List[Tuple[str, int]]:
+# Compiled once at import: section/subsection markers and the \item context
+# probe. Calling the compiled objects directly skips the re-module cache
+# lookup that every re.finditer(pattern_string, ...) call pays - the \item
+# probe in particular used to be recompiled for every \textbf match
+_COMBINED_RE = re.compile(r'\\(section|textbf)\s*\{')
+_ITEM_TRAIL_RE = re.compile(r'\\item\s*$')
+
+
+def _match_brace_span(text: str, start_pos: int) -> int:
     r"""
-    Extract sections from \section{SECTION_NAME} patterns.
+    Return the end of the brace group opened just before start_pos.
     
     Internal function - not called from outside this module.
     
+    Jumps between brace events with str.find (C-level) instead of walking
+    one character at a time and rebuilding the content with += per
+    character. Unbalanced input runs to end of text, matching the
+    historical truncation behavior.
+    
     Args:
         text: LaTeX code string
+        start_pos: Position just inside the opening brace
         
     Returns:
-        List of tuples (section_name, position_in_document)
+        Index of the matching closing brace (exclusive content end)
     """
-    results = []
-    pattern = r'\\section\s*\{'
-    
-    for match in re.finditer(pattern, text):
-        start_pos = match.end()
-        
-        # Handle nested braces by counting
-        brace_count = 1
-        i = start_pos
-        content = ""
-        
-        while i < len(text) and brace_count > 0:
-            char = text[i]
-            if char == '{':
-                brace_count += 1
-                content += char
-            elif char == '}':
-                brace_count -= 1
-                if brace_count > 0:
-                    content += char
-            else:
-                content += char
-            i += 1
-        
-        if content:
-            results.append((content.strip(), match.start()))
+    brace_count = 1
+    i = start_pos
     
-    return results
+    while True:
+        close_idx = text.find('}', i)
+        if close_idx == -1:
+            return len(text)
+        open_idx = text.find('{', i)
+        if open_idx != -1 and open_idx < close_idx:
+            brace_count += 1
+            i = open_idx + 1
+            continue
+        brace_count -= 1
+        if brace_count == 0:
+            return close_idx
+        i = close_idx + 1
 
 
-def extract_textbf_subsections(text: str, start_pos: int, end_pos: int) -> List[str]:
+def extract_markers_classified(text: str) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
     r"""
-    Extract subsections from \textbf{...} patterns within a range.
-    
-    Only extracts bold text that appears to be headers (not within itemize).
+    Extract and classify all \section and \textbf markers in one sweep.
     
     Internal function - not called from outside this module.
     
+    A single pass of the combined marker pattern replaces the separate
+    section scan plus one \textbf re-scan per section slice. Dispatch is
+    on the captured command name; bold headers are filtered inline:
+    
+    - bold text inside sections that typically have no subsections
+      (Professional Summary, Achievements) is dropped
+    - bold text directly preceded by \item is itemize content, not a
+      header, and is dropped; the context window never reaches back past
+      the owning section marker
+    
     Args:
         text: LaTeX code string
-        start_pos: Start position to search from
-        end_pos: End position to search to
         
     Returns:
-        List of subsection text content
+        Tuple of (sections, subsections), each a list of
+        (extracted_text, position_in_document) tuples
     """
+    sections = []
     subsections = []
-    section_text = text[start_pos:end_pos]
+    section_base = 0
+    collecting = True
     
-    # Pattern to match \textbf{...}
-    pattern = r'\\textbf\s*\{'
-    
-    for match in re.finditer(pattern, section_text):
-        content_start = match.end()
-        
-        # Handle nested braces by counting
-        brace_count = 1
-        i = content_start
-        content = ""
+    for match in _COMBINED_RE.finditer(text):
+        start_pos = match.end()
         
-        while i < len(section_text) and brace_count > 0:
-            char = section_text[i]
-            if char == '{':
-                brace_count += 1
-                content += char
-            elif char == '}':
-                brace_count -= 1
-                if brace_count > 0:
-                    content += char
-            else:
-                content += char
-            i += 1
+        # Handle nested braces by counting; single slice, no per-char work
+        content = text[start_pos:_match_brace_span(text, start_pos)]
         
-        if content:
-            # Clean up the content
-            content = content.strip()
-            
+        if match.group(1) == 'section':
+            if content:
+                title = content.strip()
+                sections.append((title, match.start()))
+                section_base = match.start()
+                # Special handling for sections that typically don't have
+                # \textbf headers as subsections
+                collecting = title not in _NO_SUBSECTION_SET
+        elif content and collecting:
             # Filter out bold text that's likely inside itemize items
-            # Headers typically appear before itemize environments or on their own lines
-            # Check context before the \textbf
-            context_start = max(0, match.start() - 50)
-            context = section_text[context_start:match.start()]
+            # Headers typically appear before itemize environments or on
+            # their own lines - probe the context before the \textbf
+            # in place with pos/endpos instead of slicing it out ($
+            # anchors to endpos, so the trailing-\item test is unchanged)
+            context_start = max(section_base, match.start() - 50)
             
             # Skip if this bold text appears right after \item
-            if not re.search(r'\\item\s*$', context):
+            if not _ITEM_TRAIL_RE.search(text, context_start, match.start()):
                 # This is likely a header, not itemize content
-                subsections.append(content)
+                subsections.append((content.strip(), match.start()))
     
-    return subsections
+    return sections, subsections
 
 
 def parse_latex(latex_code: str) -> Dict:
@@ -153,9 +157,9 @@ def parse_latex(latex_code: str) -> Dict:
     
     Internal function - not called from outside this module.
     
-    Uses two-stage approach:
-    1. Stage 1: Parse known sections from hardcoded list
-    2. Stage 2: Parse additional sections (with deduplication)
+    A single loop over the position-ordered section markers assigns each
+    one its subsection range, so known and custom sections are handled
+    identically and the output needs no final sort.
     
     Args:
         latex_code: LaTeX code string
@@ -166,8 +170,9 @@ def parse_latex(latex_code: str) -> Dict:
     if not latex_code or not latex_code.strip():
         return {"sections": []}
     
-    # Extract all sections
-    all_sections_raw = extract_section_titles(latex_code)
+    # Extract and classify all markers in one sweep; the stage loops and
+    # the orphan pass work from these lists instead of re-scanning slices
+    all_sections_raw, subsections_found = extract_markers_classified(latex_code)
     
     if not all_sections_raw:
         return {"sections": []}
@@ -175,80 +180,47 @@ def parse_latex(latex_code: str) -> Dict:
     # Sort sections by position to maintain document order
     all_sections_raw.sort(key=lambda x: x[1])
     
-    # STAGE 1: Parse known sections
-    stage1_sections = []
-    detected_titles = set()
-    
-    # Filter to only known sections
-    known_sections_found = [(title, pos) for title, pos in all_sections_raw 
-                            if title in KNOWN_SECTIONS]
+    # Parallel arrays for range queries: the sweep yields matches in
+    # document order, so the positions are already ascending
+    sub_positions = [pos for _, pos in subsections_found]
+    sub_contents = [content for content, _ in subsections_found]
     
-    for i, (section_title, section_pos) in enumerate(known_sections_found):
-        # Determine the range for this section's content
-        # Use ALL sections (not just known) to determine boundaries
-        all_sections_sorted = sorted(all_sections_raw, key=lambda x: x[1])
-        section_idx_in_all = next(idx for idx, (t, p) in enumerate(all_sections_sorted) if p == section_pos)
-        next_section_pos = (all_sections_sorted[section_idx_in_all + 1][1] 
-                           if section_idx_in_all + 1 < len(all_sections_sorted) 
-                           else len(latex_code))
-        
-        # Special handling for sections that typically have no subsections
-        if section_title in ["Professional Summary", "Achievements"]:
-            # These sections typically don't have \textbf headers as subsections
-            section_subsections = []
-        else:
-            # Extract subsections from \textbf{...} patterns
-            section_subsections = extract_textbf_subsections(latex_code, section_pos, next_section_pos)
-        
-        stage1_sections.append({
-            "title": section_title,
-            "subsections": section_subsections
-        })
-        
-        detected_titles.add(section_title)
+    # One pass over the position-ordered markers: each section's
+    # subsection range ends at the next marker (or end of document),
+    # found by bisecting the sorted subsection positions. Known and
+    # custom sections take the same path, so no dedup set, no per-stage
+    # lists and no final re-sort are needed
+    all_sections = []
+    num_sections = len(all_sections_raw)
+    latex_len = len(latex_code)
     
-    # STAGE 2: Parse additional sections (Helper - catches new sections)
-    stage2_sections = []
+    # Handle orphaned subsections (bold text before first section) up
+    # front, so the result list is written once in final order instead of
+    # being rebuilt by a prepend concatenation afterwards
+    first_section_pos = all_sections_raw[0][1]
+    hi = bisect.bisect_left(sub_positions, first_section_pos)
     
-    # Filter to only NEW sections (not in known list)
-    new_sections = [(title, pos) for title, pos in all_sections_raw 
-                    if title not in detected_titles]
+    if hi:
+        all_sections.append({
+            "title": "Unlabeled",
+            "subsections": sub_contents[:hi]
+        })
     
-    for i, (section_title, section_pos) in enumerate(new_sections):
-        # Determine the range for this section's content
-        all_sections_sorted = sorted(all_sections_raw, key=lambda x: x[1])
-        section_idx_in_all = next(idx for idx, (t, p) in enumerate(all_sections_sorted) if p == section_pos)
-        next_section_pos = (all_sections_sorted[section_idx_in_all + 1][1] 
-                           if section_idx_in_all + 1 < len(all_sections_sorted) 
-                           else len(latex_code))
+    for i, (section_title, section_pos) in enumerate(all_sections_raw):
+        next_section_pos = (all_sections_raw[i + 1][1]
+                            if i + 1 < num_sections else latex_len)
         
-        # Extract subsections from \textbf{...} patterns
-        section_subsections = extract_textbf_subsections(latex_code, section_pos, next_section_pos)
+        # Subsections strictly between this section and the next; the
+        # sweep already dropped non-header bold text, so a range query
+        # over the precollected list replaces the per-section re-scan
+        lo = bisect.bisect_right(sub_positions, section_pos)
+        hi = bisect.bisect_left(sub_positions, next_section_pos)
         
-        stage2_sections.append({
+        all_sections.append({
             "title": section_title,
-            "subsections": section_subsections
+            "subsections": sub_contents[lo:hi]
         })
     
-    # Combine both stages and sort by document order
-    all_sections = stage1_sections + stage2_sections
-    section_order = {title: pos for title, pos in all_sections_raw}
-    all_sections.sort(key=lambda s: section_order.get(s["title"], float('inf')))
-    
-    # Handle orphaned subsections (bold text before first section)
-    if all_sections_raw:
-        first_section_pos = min(pos for _, pos in all_sections_raw)
-        
-        # Check for orphaned bold text
-        orphaned_subsections = extract_textbf_subsections(latex_code, 0, first_section_pos)
-        
-        if orphaned_subsections:
-            unlabeled_section = {
-                "title": "Unlabeled",
-                "subsections": orphaned_subsections
-            }
-            all_sections = [unlabeled_section] + all_sections
-    
     return {"sections": all_sections}
 
 
@@ -275,11 +247,9 @@ def parse(latex_code: str) -> Dict:
             ]
         }
     
-    This function uses a two-stage parsing approach:
-    - Stage 1: Parses known sections from the hardcoded Modern template list
-    - Stage 2: Parses any additional custom sections that follow the same format
-    - Deduplication ensures no section is detected twice
-    - Orphaned subsections (before any section) are placed in "Unlabeled" section
+    Sections are emitted in document order; known and custom sections
+    follow the same path. Orphaned subsections (before any section) are
+    placed in an "Unlabeled" section.
     
     Example:
         >>> latex = r'\\section{Education}\\n\\textbf{B.S. Computer Science}'
@@ -22,16 +22,37 @@ ERROR HANDLING:
 
 from pathlib import Path
 from typing import List
+import io
+import shutil
+import subprocess
+import tempfile
+import xml.etree.ElementTree as ElementTree
+import zipfile
 import docx
 import pypandoc
 
 # Import PDF handler for delegation
-from .pdf_handler import extract_text_from_pdf
+from .pdf_handler import extract_text_from_pdf, extract_text_from_pdf_bytes
 
 
 # Supported file extensions
 SUPPORTED_FORMATS = [".txt", ".docx", ".doc", ".pdf"]
 
+# OOXML element tags used by the streaming DOCX reader
+_DOCX_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_W_P = f'{{{_DOCX_NS}}}p'
+_W_PPR = f'{{{_DOCX_NS}}}pPr'
+_W_T = f'{{{_DOCX_NS}}}t'
+_W_TAB = f'{{{_DOCX_NS}}}tab'
+_W_BR = f'{{{_DOCX_NS}}}br'
+_W_CR = f'{{{_DOCX_NS}}}cr'
+_W_TBL = f'{{{_DOCX_NS}}}tbl'
+
+# Direct .doc reader, probed once at import (a PATH scan, no subprocess).
+# pandoc shells out to a helper and serializes through docx on the way to
+# plain text; antiword reads the legacy format in a single subprocess
+_ANTIWORD_PATH = shutil.which('antiword')
+
 
 def get_supported_formats() -> List[str]:
     """
@@ -99,6 +120,76 @@ def extract_text_from_file(file_path: str) -> str:
         raise Exception(f"Failed to extract text from {path.name}: {str(e)}") from e
 
 
+def extract_text_from_bytes(data: bytes, filename: str) -> str:
+    """
+    Extract plain text from an uploaded document held in memory.
+    
+    CALLED BY: main.py with the upload's raw bytes, skipping the
+    temp-file write/read round-trip for formats whose readers accept
+    in-memory input (.pdf, .txt, .docx). Legacy .doc files still pass
+    through a temporary file because antiword/pandoc need a real path.
+    
+    RECEIVES FROM main.py:
+        - data: Raw document bytes
+        - filename: Original filename, used for format detection
+    
+    RETURNS TO main.py:
+        - Extracted plain text content as string
+    
+    RAISES:
+        - ValueError: If file format is not supported
+        - Exception: For any extraction errors
+    """
+    file_extension = _validate_file_format(Path(filename))
+    
+    try:
+        if file_extension == ".txt":
+            return _decode_txt_bytes(data)
+        
+        elif file_extension == ".pdf":
+            return extract_text_from_pdf_bytes(data)
+        
+        elif file_extension == ".docx":
+            # Both the streaming reader and python-docx accept file-like
+            # objects, so the package is read straight from memory
+            return _extract_from_docx(io.BytesIO(data))
+        
+        else:
+            # .doc extraction shells out to tools that want a path;
+            # spill to a temp file
+            return _extract_via_temp_file(data, file_extension)
+    
+    except Exception as e:
+        # Re-raise with context if not already a custom exception
+        if isinstance(e, ValueError):
+            raise
+        raise Exception(f"Failed to extract text from {filename}: {str(e)}") from e
+
+
+def _extract_via_temp_file(data: bytes, file_extension: str) -> str:
+    """
+    Writes in-memory bytes to a temp file and extracts from the path.
+    Internal function - not called from outside this module.
+
+    delete=False because the extractors (and antiword/pandoc behind
+    them) reopen the file by path, which on Windows requires the handle
+    to be closed first; the finally clause removes it instead.
+    """
+    with tempfile.NamedTemporaryFile(
+        prefix='resumax_', suffix=file_extension, delete=False
+    ) as temp_file:
+        temp_file.write(data)
+        temp_path = Path(temp_file.name)
+
+    try:
+        return _extract_from_doc(temp_path)
+    finally:
+        try:
+            temp_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
 def _validate_file_format(path: Path) -> str:
     """
     Validates file format is supported.
@@ -129,18 +220,25 @@ def _extract_from_txt(path: Path) -> str:
     Handles multiple encodings for Windows compatibility:
     - Tries UTF-8 first (standard)
     - Falls back to cp1252 (Windows default)
+    
+    The bytes are read once and decoded in memory, so the cp1252
+    fallback no longer re-reads the file from disk.
+    """
+    return _decode_txt_bytes(path.read_bytes())
+
+
+def _decode_txt_bytes(data: bytes) -> str:
+    """
+    Decodes raw text-file bytes with the UTF-8/cp1252 fallback.
+    Internal function - not called from outside this module.
     """
     # Try UTF-8 first
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            text = f.read()
+        text = data.decode('utf-8')
     except UnicodeDecodeError:
-        # Fallback to Windows encoding
-        try:
-            with open(path, 'r', encoding='cp1252') as f:
-                text = f.read()
-        except Exception as e:
-            raise Exception(f"Failed to read text file with UTF-8 or cp1252 encoding: {str(e)}") from e
+        # Fallback to Windows encoding; cp1252 with replacement cannot
+        # fail, so no third error path is needed
+        text = data.decode('cp1252', errors='replace')
     
     # Validate extracted content
     if not text or len(text.strip()) == 0:
@@ -149,19 +247,86 @@ def _extract_from_txt(path: Path) -> str:
     return text.strip()
 
 
-def _extract_from_docx(path: Path) -> str:
+def _stream_docx_text(source) -> str:
+    """
+    Streams paragraph text straight out of word/document.xml.
+    Internal function - not called from outside this module.
+    
+    source is a Path or a binary file-like object (zipfile takes both).
+    
+    Walks the OOXML with a single iterparse pass instead of letting
+    python-docx build the full element tree plus a Paragraph/Run wrapper
+    object per paragraph. Matches python-docx's body text: w:t runs are
+    concatenated, run-level tabs and breaks map to '\t'/'\n', and
+    paragraphs inside tables are excluded (doc.paragraphs skips them).
+    
+    RAISES:
+        - Exception: For malformed packages or XML (caller falls back)
+    """
+    paragraphs = []
+    runs = []
+    in_props = False
+    table_depth = 0
+    
+    with zipfile.ZipFile(source) as archive, archive.open('word/document.xml') as doc_xml:
+        for event, element in ElementTree.iterparse(doc_xml, events=('start', 'end')):
+            tag = element.tag
+            if event == 'start':
+                if tag == _W_PPR:
+                    in_props = True
+                elif tag == _W_TBL:
+                    table_depth += 1
+                continue
+            
+            if tag == _W_T:
+                if element.text and not in_props and table_depth == 0:
+                    runs.append(element.text)
+            elif tag == _W_TAB:
+                # Tab elements inside paragraph properties are tab-stop
+                # definitions, not content
+                if not in_props and table_depth == 0:
+                    runs.append('\t')
+            elif tag == _W_BR or tag == _W_CR:
+                if not in_props and table_depth == 0:
+                    runs.append('\n')
+            elif tag == _W_PPR:
+                in_props = False
+            elif tag == _W_TBL:
+                table_depth -= 1
+            elif tag == _W_P:
+                if table_depth == 0:
+                    paragraphs.append(''.join(runs))
+                runs.clear()
+            element.clear()
+    
+    return '\n'.join(paragraphs)
+
+
+def _extract_from_docx(source) -> str:
     """
     Extracts text from .docx files (Office Open XML format).
     Internal function - not called from outside this module.
     
-    Uses python-docx library to parse document structure and extract text.
+    source is a Path or a binary file-like object; both readers below
+    accept either, so in-memory uploads never touch disk.
+    
+    Streams the document XML directly for speed; python-docx remains as
+    the fallback reader for packages the streaming pass cannot handle.
     """
     try:
-        doc = docx.Document(path)
-        
-        # Extract text from all paragraphs
-        paragraphs = [para.text for para in doc.paragraphs]
-        text = '\n'.join(paragraphs)
+        try:
+            text = _stream_docx_text(source)
+        except Exception:
+            # Malformed package or unexpected XML: python-docx is more
+            # forgiving, let it try before giving up
+            if hasattr(source, 'seek'):
+                # The streaming attempt may have advanced the stream
+                source.seek(0)
+            doc = docx.Document(source)
+            
+            # Extract text from all paragraphs without materializing an
+            # intermediate list of them first
+            text = '\n'.join(para.text for para in doc.paragraphs)
         
         # Validate extracted content
         if not text or len(text.strip()) == 0:
@@ -180,16 +345,26 @@ def _extract_from_doc(path: Path) -> str:
     Extracts text from .doc files (Legacy Word format).
     Internal function - not called from outside this module.
     
-    Uses pypandoc to convert .doc to plain text.
-    Requires pandoc to be installed on the system.
+    Uses antiword directly when available (one subprocess, no
+    intermediate conversion); otherwise converts via pypandoc, which
+    requires pandoc to be installed on the system.
     """
     try:
-        # Convert .doc to plain text using pypandoc
-        text = pypandoc.convert_file(
-            str(path),
-            'plain',
-            format='doc'
-        )
+        if _ANTIWORD_PATH:
+            # Extract plain text with antiword ('-w 0' disables line wrap)
+            text = subprocess.run(
+                [_ANTIWORD_PATH, "-w", "0", str(path)],
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout
+        else:
+            # Convert .doc to plain text using pypandoc
+            text = pypandoc.convert_file(
+                str(path),
+                'plain',
+                format='doc'
+            )
         
         # Validate extracted content
         if not text or len(text.strip()) == 0:
@@ -13,18 +13,35 @@ import sys
 import uuid
 import logging
 import logging.handlers
+import re
 import threading
 import time
 import base64
+import hashlib
+import json
+import queue
 import signal
 import atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from collections import OrderedDict
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Tuple
 import io
 
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file, stream_with_context
 from flask_cors import CORS
-from dotenv import load_dotenv
+from werkzeug.exceptions import RequestEntityTooLarge
+from dotenv import load_dotenv, dotenv_values
+
+# Optional C JSON encoder: /api/init and /api/parse-sections serialize
+# many small strings, where orjson clearly beats stdlib json. Fall back
+# silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add backend directory to Python path for imports
 backend_dir = Path(__file__).parent
@@ -36,6 +53,7 @@ from Model_API import claude, gemini, lmstudio, openai
 from Upload import upload_handler
 from Output import pdfgenerator
 from Output import section_selector
+from Output.latex_preprocessor import preprocess_latex
 
 
 # Path Resolution Utilities
@@ -73,15 +91,32 @@ env_path = get_writable_path('.env')
 load_dotenv(env_path)
 
 # Environment Configuration Utilities
+
+# Config cache keyed by .env mtime: requests re-read the file only after
+# it actually changes instead of hitting the filesystem every time
+_env_cache: Dict[str, Any] = {'mtime': 0.0, 'config': None}
+
 def load_env_config() -> Dict[str, str]:
-    """Load configuration from .env file"""
-    config = {
-        'provider': os.getenv('RESUMAX_PROVIDER', ''),
-        'model': os.getenv('RESUMAX_MODEL', ''),
-        'apiKey': os.getenv('RESUMAX_API_KEY', '')
-    }
-    logger.info(f"[CONFIG] Loaded configuration from .env: provider={config['provider']}, model={config['model']}")
-    return config
+    """Load configuration from .env file, cached until the file changes"""
+    try:
+        mtime = env_path.stat().st_mtime
+    except OSError:
+        mtime = 0.0
+    
+    if _env_cache['config'] is None or mtime != _env_cache['mtime']:
+        # dotenv_values reads the file without mutating os.environ, so a
+        # stale process environment can never mask an edited .env
+        values = dotenv_values(env_path)
+        _env_cache['config'] = {
+            'provider': values.get('RESUMAX_PROVIDER') or '',
+            'model': values.get('RESUMAX_MODEL') or '',
+            'apiKey': values.get('RESUMAX_API_KEY') or ''
+        }
+        _env_cache['mtime'] = mtime
+        logger.debug("[CONFIG] Loaded configuration from .env: provider=%s, model=%s",
+                     _env_cache['config']['provider'], _env_cache['config']['model'])
+    
+    return dict(_env_cache['config'])
 
 def save_env_config(provider: str, model: str, api_key: str) -> Tuple[bool, str]:
     """Save configuration to .env file with validation"""
@@ -105,11 +140,20 @@ RESUMAX_API_KEY={api_key}
 """
         
         # Write to .env file
-        with open(env_path, 'w', encoding='utf-8') as f:
-            f.write(env_content)
+        env_path.write_text(env_content, encoding='utf-8')
+        
+        # We just wrote these three keys - set them directly instead of
+        # re-opening and re-parsing the file we authored
+        os.environ.update({
+            'RESUMAX_PROVIDER': provider,
+            'RESUMAX_MODEL': model,
+            'RESUMAX_API_KEY': api_key
+        })
+        _env_cache['config'] = None
         
-        # Reload environment variables
-        load_dotenv(env_path, override=True)
+        # Provider/LaTeX status caches may reflect the old configuration
+        _fetch_providers.cache_clear()
+        _check_latex_installation.cache_clear()
         
         logger.info(f"[CONFIG] Configuration saved to .env: provider={provider}, model={model}")
         return True, "Configuration saved successfully"
@@ -138,6 +182,24 @@ def validate_config_complete(config: Dict[str, str]) -> Tuple[bool, str]:
 app = Flask(__name__)
 CORS(app)  # Enable CORS for Electron communication
 
+# Reject oversized uploads at the WSGI layer, before the body is
+# buffered in memory (or spooled to disk)
+app.config['MAX_CONTENT_LENGTH'] = 20 * 1024 * 1024  # 20MB
+
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+    
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson"""
+        
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode('utf-8')
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+    
+    app.json = OrjsonProvider(app)
+
 # Configure logging with enhanced format for AI requests
 logging.basicConfig(
     level=logging.INFO,
@@ -159,18 +221,30 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        # Colorized levelnames built once instead of an f-string per record
+        self._colored_levelnames = {
+            level: f"{color}{level}{self.RESET}"
+            for level, color in self.COLORS.items()
+        }
+    
     def format(self, record):
         # Add color to levelname
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.RESET}"
-        
-        # Add special formatting for AI logs
-        if '[AI REQUEST]' in record.getMessage():
-            record.msg = f"\n>> {record.msg}"
-        elif '[AI RESPONSE]' in record.getMessage():
-            record.msg = f"\n<< {record.msg}"
-        elif '[AI ERROR]' in record.getMessage():
-            record.msg = f"\n!! {record.msg}"
+        record.levelname = self._colored_levelnames.get(record.levelname, record.levelname)
+        
+        # Add special formatting for AI logs. Checking record.msg avoids
+        # the %-args formatting getMessage() performs, and the common
+        # '[AI ' prefix test skips the three tag searches on every other
+        # record
+        msg = record.msg
+        if isinstance(msg, str) and '[AI ' in msg:
+            if '[AI REQUEST]' in msg:
+                record.msg = f"\n>> {msg}"
+            elif '[AI RESPONSE]' in msg:
+                record.msg = f"\n<< {msg}"
+            elif '[AI ERROR]' in msg:
+                record.msg = f"\n!! {msg}"
         
         return super().format(record)
 
@@ -193,16 +267,40 @@ def setup_logging():
         file_handler = logging.handlers.RotatingFileHandler(
             log_file, 
             maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
+            backupCount=5,
+            delay=True,  # don't open the file until the first record
+            encoding='utf-8'
         )
         file_handler.setFormatter(logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         ))
         
-        root_logger.addHandler(file_handler)
+        # Buffer records in memory and flush in batches: one write syscall
+        # per 1024 records (or 30 seconds) instead of one per log line.
+        # ERROR and above flush immediately so crashes are never buffered
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        
+        root_logger.addHandler(memory_handler)
         root_logger.setLevel(logging.INFO)
         
+        def flush_worker():
+            """Flush buffered log records every 30 seconds"""
+            while True:
+                time.sleep(30)
+                memory_handler.flush()
+        
+        flush_thread = threading.Thread(target=flush_worker, daemon=True)
+        flush_thread.start()
+        
+        # Make sure buffered records reach the file on clean shutdown
+        atexit.register(memory_handler.flush)
+        
         logger.info("Production logging initialized - writing to file")
         
     else:
@@ -221,20 +319,112 @@ def setup_logging():
 # Initialize logging
 setup_logging()
 
-# Global in-memory file storage with timestamps
-file_storage: Dict[str, Dict[str, Any]] = {}
+class FileStore:
+    """LRU-bounded in-memory store for uploaded files.
+    
+    Uploads are read exactly once (by /api/process), so entries are popped
+    on consume; anything abandoned is evicted oldest-first once the item
+    or byte cap is exceeded, which bounds resident memory without a
+    timestamp sweep.
+    """
+    
+    def __init__(self, max_items: int = 32, max_bytes: int = 256 * 1024 * 1024):
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+    
+    def put(self, session_id: str, entry: Dict[str, Any]) -> None:
+        """Store an upload, evicting the oldest entries past the caps"""
+        with self._lock:
+            old_entry = self._entries.pop(session_id, None)
+            if old_entry is not None:
+                self._total_bytes -= old_entry['size']
+            
+            self._entries[session_id] = entry
+            self._total_bytes += entry['size']
+            
+            while self._entries and (len(self._entries) > self._max_items
+                                     or self._total_bytes > self._max_bytes):
+                evicted_id, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted['size']
+                logger.info("Evicted oldest upload to stay under limits: %s", evicted_id)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def consume(self, session_id: str) -> Dict[str, Any]:
+        """Pop and return an upload; raises KeyError for unknown sessions"""
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+            if entry is None:
+                raise KeyError(f"Session not found: {session_id}")
+            self._total_bytes -= entry['size']
+            return entry
+
+
+# Global in-memory file storage, bounded by entry count and total bytes
+file_storage = FileStore()
 
 # Session timeout in seconds (1 hour)
 SESSION_TIMEOUT = 3600
 
+# Compiled once: a well-formed \documentclass declaration, checked on
+# every AI response before it is returned
+_DOCCLASS_RE = re.compile(r'\\documentclass(?:\[[^\]]*\])?\{[^}]+\}')
+
+# Background compile jobs: pdflatex runs for seconds, so compile requests
+# are submitted to a worker pool and polled by job id instead of pinning
+# a request thread for the whole compilation
+compile_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+compile_jobs: Dict[str, Dict[str, Any]] = {}  # job_id -> {'future', 'timestamp'}
+
+# Provider model lists come from four independent network calls; a small
+# dedicated pool lets them run concurrently instead of back to back
+provider_executor = ThreadPoolExecutor(max_workers=4)
+
+# Resume processing jobs follow the same submit-and-poll pattern: the
+# LLM round-trip parks a thread on network I/O for seconds, so it runs
+# on its own pool (wider than the CPU-bound compile pool) instead of
+# holding a server thread per in-flight request
+process_executor = ThreadPoolExecutor(max_workers=8)
+process_jobs: Dict[str, Dict[str, Any]] = {}  # job_id -> {'future', 'timestamp', 'provider', 'model'}
+batch_jobs: Dict[str, Dict[str, Any]] = {}  # batch_id -> {'items', 'timestamp', 'provider', 'model'}
+
+# Debug-log writes go through a queue to a single writer thread, so the
+# response path never blocks on disk for a file nobody is waiting on
+_debug_log_queue: 'queue.Queue[Tuple[Path, str]]' = queue.Queue()
+
+def _debug_log_writer():
+    """Drains queued (path, content) debug-log writes in the background"""
+    while True:
+        log_file_path, content = _debug_log_queue.get()
+        try:
+            with open(log_file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            logger.info("[AI LOG] Saved AI response to: %s", log_file_path)
+        except Exception as log_error:
+            logger.warning("[AI LOG WARNING] Failed to save AI response log: %s", log_error)
+        finally:
+            _debug_log_queue.task_done()
+
+_debug_log_thread = threading.Thread(target=_debug_log_writer, daemon=True)
+_debug_log_thread.start()
+
 # Global flag for graceful shutdown
 shutdown_requested = False
 
+# Wakes the cleanup worker early - set on shutdown and when the upload
+# store grows past its soft cap, instead of waiting out the 5-minute poll
+_cleanup_event = threading.Event()
+
 def signal_handler(signum, frame):
     """Handle termination signals gracefully"""
     global shutdown_requested
     logger.info(f"Received signal {signum}, initiating graceful shutdown...")
     shutdown_requested = True
+    _cleanup_event.set()
     
     # Give Flask time to finish current requests
     time.sleep(1)
@@ -246,14 +436,21 @@ def signal_handler(signum, frame):
 def cleanup_on_exit():
     """Cleanup function called on exit"""
     logger.info("Cleaning up on exit...")
-    # Clean up any temporary files
+    # Clean up any temporary files; scandir hands back DirEntry objects
+    # with cached type info, so this is one syscall per file
     temp_dir = backend_dir / 'temp'
-    if temp_dir.exists():
-        for file in temp_dir.glob('*'):
-            try:
-                file.unlink()
-            except:
-                pass
+    try:
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        logger.warning(f"Failed to remove temp file {entry.name}: {e}")
+    except FileNotFoundError:
+        pass
 
 # Register signal handlers
 signal.signal(signal.SIGTERM, signal_handler)
@@ -311,7 +508,7 @@ def load_latex_template(template_id: str) -> str:
     
     # Check cache first
     if template_id in _template_cache:
-        logger.info(f"LaTeX template loaded from cache: {template_id}")
+        logger.info("LaTeX template loaded from cache: %s", template_id)
         return _template_cache[template_id]
     
     template_path = backend_dir / 'Latex_formats' / f'{template_id}.tex'
@@ -325,74 +522,200 @@ def load_latex_template(template_id: str) -> str:
         
         # Cache the template
         _template_cache[template_id] = template_content
-        logger.info(f"LaTeX template loaded and cached: {template_id} ({len(template_content)} characters)")
+        logger.info("LaTeX template loaded and cached: %s (%d characters)", template_id, len(template_content))
         return template_content
     except Exception as e:
         logger.error(f"Failed to load template {template_id}: {e}")
         raise Exception(f"Failed to load template {template_id}: {e}")
 
 
-def get_provider_module(provider_name: str):
-    """Map provider name to module"""
-    provider_map = {
-        'OpenAI': openai,
-        'Anthropic': claude,
-        'Gemini': gemini,
-        'LM Studio': lmstudio
-    }
+# Templates list cache keyed by the directory mtime: the metadata dicts
+# are rebuilt only when a .tex file is added or removed
+_templates_list_cache: Dict[str, Any] = {'mtime': 0.0, 'templates': None}
+
+
+def _build_templates_list() -> List[Dict[str, str]]:
+    """Build (or reuse) the template metadata list from Latex_formats"""
+    templates_dir = backend_dir / 'Latex_formats'
+    
+    try:
+        mtime = templates_dir.stat().st_mtime
+    except OSError:
+        mtime = 0.0
     
-    if provider_name not in provider_map:
-        raise ValueError(f"Unknown provider: {provider_name}")
+    if _templates_list_cache['templates'] is not None and mtime == _templates_list_cache['mtime']:
+        return _templates_list_cache['templates']
     
-    return provider_map[provider_name]
+    templates = []
+    
+    # Scan for .tex files
+    for tex_file in templates_dir.glob('*.tex'):
+        template_id = tex_file.stem
+        
+        # Get metadata or use defaults; setdefault stores the default so
+        # each unknown template's fallback dict is built exactly once
+        metadata = TEMPLATE_METADATA.setdefault(template_id, {
+            'name': f'{template_id} Template',
+            'description': f'Professional resume template: {template_id}',
+            'category': 'Professional'
+        })
+        
+        templates.append({
+            'id': template_id,
+            'name': metadata['name'],
+            'description': metadata['description'],
+            'previewPdf': f'{template_id}.pdf',
+            'format': 'latex',
+            'category': metadata['category']
+        })
+    
+    _templates_list_cache['templates'] = templates
+    _templates_list_cache['mtime'] = mtime
+    return templates
 
 
-def save_file_to_memory(file, session_id: str) -> None:
-    """Store file in memory with metadata and timestamp"""
-    file_bytes = file.read()
-    file_storage[session_id] = {
-        'filename': file.filename,
-        'content_type': file.content_type,
-        'size': len(file_bytes),
-        'data': file_bytes,
-        'timestamp': time.time()
+def _prewarm_caches():
+    """Load the system prompt and every template into cache at startup"""
+    try:
+        load_system_prompt()
+    except Exception as e:
+        logger.warning(f"Prewarm: failed to load system prompt: {e}")
+    
+    for tex_file in (backend_dir / 'Latex_formats').glob('*.tex'):
+        try:
+            load_latex_template(tex_file.stem)
+        except Exception as e:
+            logger.warning(f"Prewarm: failed to load template {tex_file.stem}: {e}")
+
+
+def _ttl_cache(ttl: float):
+    """Cache a zero-argument function's result for ttl seconds.
+    
+    lru_cache cannot expire entries by age, so endpoints that poll
+    slow-to-compute but slow-to-change data (provider model lists, the
+    pdflatex probe) use this instead. The wrapper exposes cache_clear()
+    for explicit invalidation.
+    """
+    def decorator(func):
+        state = {'ts': 0.0, 'value': None}
+        
+        @wraps(func)
+        def wrapper():
+            now = time.time()
+            if state['value'] is None or now - state['ts'] >= ttl:
+                state['value'] = func()
+                state['ts'] = now
+            return state['value']
+        
+        def cache_clear():
+            state['value'] = None
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+@_ttl_cache(ttl=60)
+def _fetch_providers() -> Dict[str, List[str]]:
+    """Fetch model lists from all providers concurrently"""
+    futures = {
+        'OpenAI': provider_executor.submit(openai.get_available_models),
+        'Anthropic': provider_executor.submit(claude.get_available_models),
+        'Gemini': provider_executor.submit(gemini.get_available_models),
+        'LM Studio': provider_executor.submit(lmstudio.get_available_models)
     }
-    logger.info(f"File saved to memory: {file.filename} ({len(file_bytes)} bytes)")
+    
+    providers = {}
+    for name, future in futures.items():
+        try:
+            providers[name] = future.result()
+        except Exception as e:
+            # LM Studio is a local server and is routinely not running;
+            # any provider failure degrades to an empty model list
+            logger.warning("%s not available: %s", name, e)
+            providers[name] = []
+    
+    return providers
+
 
+@_ttl_cache(ttl=300)
+def _check_latex_installation() -> Dict[str, Any]:
+    """Probe the LaTeX installation, cached - it shells out to pdflatex"""
+    return pdfgenerator.check_latex_installation()
 
-def get_file_from_memory(session_id: str) -> Dict[str, Any]:
-    """Retrieve file from memory"""
-    if session_id not in file_storage:
-        raise KeyError(f"Session not found: {session_id}")
+
+# Provider modules never change at runtime: build the lookup once and
+# freeze it instead of constructing a dict per call
+_PROVIDER_MAP = MappingProxyType({
+    'OpenAI': openai,
+    'Anthropic': claude,
+    'Gemini': gemini,
+    'LM Studio': lmstudio
+})
+
+
+def get_provider_module(provider_name: str):
+    """Map provider name to module"""
+    try:
+        return _PROVIDER_MAP[provider_name]
+    except KeyError:
+        raise ValueError(f"Unknown provider: {provider_name}") from None
+
+
+def save_bytes_to_memory(data: bytes, filename: str, content_type: str, session_id: str) -> None:
+    """Store already-read upload bytes in memory with metadata"""
+    file_storage.put(session_id, {
+        'filename': filename,
+        'content_type': content_type,
+        'size': len(data),
+        'data': data
+    })
+    logger.info("File saved to memory: %s (%d bytes)", filename, len(data))
     
-    return file_storage[session_id]
+    # Many live uploads usually means stale temp files too - sweep early
+    if len(file_storage) > 16:
+        _cleanup_event.set()
 
 
 def cleanup_expired_sessions():
-    """Remove expired sessions and temporary files"""
+    """Remove expired compile jobs and temporary files"""
     current_time = time.time()
-    expired_sessions = []
     
-    for session_id, file_data in file_storage.items():
-        if current_time - file_data.get('timestamp', 0) > SESSION_TIMEOUT:
-            expired_sessions.append(session_id)
+    # Drop finished batches whose results were never collected
+    expired_batches = [batch_id for batch_id, batch in batch_jobs.items()
+                       if current_time - batch['timestamp'] > SESSION_TIMEOUT
+                       and all(item['future'] is None or item['future'].done()
+                               for item in batch['items'].values())]
+    for batch_id in expired_batches:
+        del batch_jobs[batch_id]
+        logger.info(f"Cleaned up uncollected batch job: {batch_id}")
     
-    for session_id in expired_sessions:
-        del file_storage[session_id]
-        logger.info(f"Cleaned up expired session: {session_id}")
+    # Drop finished jobs whose result was never collected
+    for jobs in (compile_jobs, process_jobs):
+        expired_jobs = [job_id for job_id, job in jobs.items()
+                        if job['future'].done()
+                        and current_time - job['timestamp'] > SESSION_TIMEOUT]
+        for job_id in expired_jobs:
+            del jobs[job_id]
+            logger.info(f"Cleaned up uncollected job: {job_id}")
     
-    # Clean up temporary files
+    # Clean up temporary files older than 1 hour; DirEntry.stat() reuses
+    # the metadata scandir already fetched instead of a fresh stat call
     temp_dir = backend_dir / 'temp'
-    if temp_dir.exists():
-        for temp_file in temp_dir.glob('*'):
-            if temp_file.is_file():
+    try:
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
                 try:
-                    # Check if file is older than 1 hour
-                    if current_time - temp_file.stat().st_mtime > SESSION_TIMEOUT:
-                        temp_file.unlink()
-                        logger.info(f"Cleaned up temporary file: {temp_file.name}")
-                except Exception as e:
-                    logger.warning(f"Failed to clean up temp file {temp_file.name}: {e}")
+                    if (entry.is_file(follow_symlinks=False)
+                            and current_time - entry.stat().st_mtime > SESSION_TIMEOUT):
+                        os.unlink(entry.path)
+                        logger.info(f"Cleaned up temporary file: {entry.name}")
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Failed to clean up temp file {entry.name}: {e}")
+    except FileNotFoundError:
+        pass
 
 
 def cleanup_worker():
@@ -400,7 +723,10 @@ def cleanup_worker():
     while True:
         try:
             cleanup_expired_sessions()
-            time.sleep(300)  # Run cleanup every 5 minutes
+            # Event-driven wait: sweeps run every 5 minutes, immediately on
+            # upload pressure, and don't outlive a shutdown request
+            _cleanup_event.wait(timeout=300)
+            _cleanup_event.clear()
         except Exception as e:
             logger.error(f"Error in cleanup worker: {e}")
             time.sleep(60)  # Wait 1 minute before retrying
@@ -440,9 +766,9 @@ def test_api_key():
         
         # Validate required fields
         required_fields = ['provider', 'model', 'apiKey']
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return create_error_response('validation_error', f'Missing required field: {field}', field=field)
+        missing = [field for field in required_fields if not data.get(field)]
+        if missing:
+            return create_error_response('validation_error', f'Missing required field: {missing[0]}', field=missing[0])
         
         provider = data['provider']
         model = data['model']
@@ -493,9 +819,9 @@ def save_config():
         
         # Validate required fields
         required_fields = ['provider', 'model', 'apiKey']
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return create_error_response('validation_error', f'Missing required field: {field}', field=field)
+        missing = [field for field in required_fields if not data.get(field)]
+        if missing:
+            return create_error_response('validation_error', f'Missing required field: {missing[0]}', field=missing[0])
         
         provider = data['provider']
         model = data['model']
@@ -540,7 +866,7 @@ def load_config():
 def latex_status():
     """Check LaTeX installation status"""
     try:
-        status = pdfgenerator.check_latex_installation()
+        status = _check_latex_installation()
         logger.info(f"LaTeX status check: {status['source']} - {status['version']}")
         return jsonify({
             'success': True,
@@ -555,19 +881,7 @@ def latex_status():
 def get_providers():
     """Return list of all available AI providers with their models"""
     try:
-        providers = {}
-        
-        # Get models from each provider
-        providers['OpenAI'] = openai.get_available_models()
-        providers['Anthropic'] = claude.get_available_models()
-        providers['Gemini'] = gemini.get_available_models()
-        
-        # LM Studio models (may fail if not running)
-        try:
-            providers['LM Studio'] = lmstudio.get_available_models()
-        except Exception as e:
-            logger.warning(f"LM Studio not available: {e}")
-            providers['LM Studio'] = []
+        providers = _fetch_providers()
         
         logger.info("Providers endpoint called successfully")
         return jsonify(providers)
@@ -582,50 +896,17 @@ def get_init_data():
     """Return both providers and templates in a single request for faster app initialization"""
     try:
         # Get providers data
-        providers = {}
-        providers['OpenAI'] = openai.get_available_models()
-        providers['Anthropic'] = claude.get_available_models()
-        providers['Gemini'] = gemini.get_available_models()
-        
-        # LM Studio models (may fail if not running)
-        try:
-            providers['LM Studio'] = lmstudio.get_available_models()
-        except Exception as e:
-            logger.warning(f"LM Studio not available: {e}")
-            providers['LM Studio'] = []
+        providers = _fetch_providers()
         
         # Get templates data
-        templates_dir = backend_dir / 'Latex_formats'
-        templates = []
-        
-        # Scan for .tex files
-        for tex_file in templates_dir.glob('*.tex'):
-            template_id = tex_file.stem
-            
-            # Get metadata or use defaults
-            metadata = TEMPLATE_METADATA.get(template_id, {
-                'name': f'{template_id} Template',
-                'description': f'Professional resume template: {template_id}',
-                'category': 'Professional'
-            })
-            
-            template = {
-                'id': template_id,
-                'name': metadata['name'],
-                'description': metadata['description'],
-                'previewPdf': f'{template_id}.pdf',
-                'format': 'latex',
-                'category': metadata['category']
-            }
-            
-            templates.append(template)
+        templates = _build_templates_list()
         
         init_data = {
             'providers': providers,
             'templates': templates
         }
         
-        logger.info(f"Init endpoint called successfully: {len(providers)} providers, {len(templates)} templates")
+        logger.info("Init endpoint called successfully: %d providers, %d templates", len(providers), len(templates))
         return jsonify(init_data)
         
     except Exception as e:
@@ -637,32 +918,9 @@ def get_init_data():
 def get_templates():
     """Return list of all available LaTeX templates with metadata"""
     try:
-        templates_dir = backend_dir / 'Latex_formats'
-        templates = []
+        templates = _build_templates_list()
         
-        # Scan for .tex files
-        for tex_file in templates_dir.glob('*.tex'):
-            template_id = tex_file.stem
-            
-            # Get metadata or use defaults
-            metadata = TEMPLATE_METADATA.get(template_id, {
-                'name': f'{template_id} Template',
-                'description': f'Professional resume template: {template_id}',
-                'category': 'Professional'
-            })
-            
-            template = {
-                'id': template_id,
-                'name': metadata['name'],
-                'description': metadata['description'],
-                'previewPdf': f'{template_id}.pdf',
-                'format': 'latex',
-                'category': metadata['category']
-            }
-            
-            templates.append(template)
-        
-        logger.info(f"Templates endpoint called successfully: {len(templates)} templates found")
+        logger.info("Templates endpoint called successfully: %d templates found", len(templates))
         return jsonify(templates)
         
     except Exception as e:
@@ -670,20 +928,38 @@ def get_templates():
         return create_error_response('api_error', f"Failed to fetch templates: {str(e)}", status_code=500)
 
 
+# Preview PDFs cached in memory keyed by template_id -> (mtime, bytes);
+# the renderer reloads the same handful of previews repeatedly
+_pdf_preview_cache: Dict[str, Tuple[float, bytes]] = {}
+
+
 @app.route('/api/templates/<template_id>/preview', methods=['GET'])
 def get_template_preview(template_id: str):
     """Serve PDF preview for selected template"""
     try:
         preview_path = backend_dir / 'Latex_formats' / f'{template_id}.pdf'
         
-        if not preview_path.exists():
+        try:
+            stat = preview_path.stat()
+        except OSError:
             logger.warning(f"Preview PDF not found: {template_id}.pdf")
             return create_error_response('file_error', f"Preview PDF not found for template: {template_id}", status_code=404)
         
+        cached = _pdf_preview_cache.get(template_id)
+        if cached is None or cached[0] != stat.st_mtime:
+            cached = (stat.st_mtime, preview_path.read_bytes())
+            _pdf_preview_cache[template_id] = cached
+        
+        # Conditional headers let repeat loads answer 304 with no body;
+        # max_age keeps the renderer from asking at all for a day
         return send_file(
-            str(preview_path),
+            io.BytesIO(cached[1]),
             mimetype='application/pdf',
-            as_attachment=False
+            as_attachment=False,
+            conditional=True,
+            etag=f"{stat.st_mtime}-{stat.st_size}",
+            last_modified=stat.st_mtime,
+            max_age=86400
         )
         
     except Exception as e:
@@ -714,21 +990,14 @@ def upload_file():
                 field='file'
             )
         
-        # Validate file size (20MB max)
-        file.seek(0, 2)  # Seek to end
-        file_size = file.tell()
-        file.seek(0)  # Reset to beginning
-        
-        if file_size > 20 * 1024 * 1024:  # 20MB
-            return create_error_response(
-                'validation_error',
-                'File size exceeds 20MB limit. Please upload a smaller file',
-                field='file'
-            )
+        # MAX_CONTENT_LENGTH already rejected anything over 20MB before
+        # the body was read, so a single read is all that's left
+        data = file.stream.read()
+        file_size = len(data)
         
         # Generate session ID and save file
         session_id = str(uuid.uuid4())
-        save_file_to_memory(file, session_id)
+        save_bytes_to_memory(data, file.filename, file.content_type, session_id)
         
         logger.info(f"File uploaded successfully: {file.filename} (session: {session_id})")
         return jsonify({
@@ -743,9 +1012,33 @@ def upload_file():
         return create_error_response('file_error', f"Upload failed: {str(e)}", status_code=500)
 
 
+def _run_compile_job(latex_code: str) -> bytes:
+    """Compile LaTeX on a worker thread, logging duration"""
+    compile_start_time = time.time()
+    pdf_bytes = pdfgenerator.generate_pdf(latex_code)
+    compile_duration = time.time() - compile_start_time
+    logger.info(f"[COMPILE] LaTeX compilation successful - PDF size: {len(pdf_bytes)} bytes - Duration: {compile_duration:.2f}s")
+    return pdf_bytes
+
+
+def _compile_error_response(error_message: str):
+    """Map a compile failure message to the standard error response"""
+    if 'pdflatex is not installed' in error_message:
+        logger.error("[COMPILE ERROR] pdflatex not installed")
+        return create_error_response('system_error', 
+            'LaTeX is not installed. Please install MiKTeX or TeX Live and ensure pdflatex is in your system PATH.', 
+            status_code=503)
+    elif 'LaTeX compilation failed' in error_message:
+        logger.error(f"[COMPILE ERROR] LaTeX compilation failed: {error_message}")
+        return create_error_response('compilation_error', error_message, status_code=422)
+    else:
+        logger.error(f"[COMPILE ERROR] Unexpected error: {error_message}")
+        return create_error_response('compilation_error', f'Compilation failed: {error_message}', status_code=500)
+
+
 @app.route('/api/compile-latex', methods=['POST'])
 def compile_latex():
-    """Compile LaTeX code to PDF and return as base64"""
+    """Submit LaTeX code for background compilation, returning a job id"""
     try:
         data = request.get_json()
         
@@ -761,49 +1054,74 @@ def compile_latex():
         # Log compilation request
         logger.info(f"[COMPILE] LaTeX compilation requested - Code length: {len(latex_code)} characters")
         
-        # Track compilation time
-        compile_start_time = time.time()
+        # Submit to the compile pool and return immediately; the client
+        # polls /api/compile-latex/<job_id> for the PDF
+        job_id = str(uuid.uuid4())
+        compile_jobs[job_id] = {
+            'future': compile_executor.submit(_run_compile_job, latex_code),
+            'timestamp': time.time()
+        }
+        
+        return jsonify({
+            'jobId': job_id,
+            'message': 'LaTeX compilation started'
+        }), 202
+        
+    except Exception as e:
+        logger.error(f"Error in compile-latex endpoint: {e}")
+        return create_error_response('api_error', f"Compilation request failed: {str(e)}", status_code=500)
+
+
+@app.route('/api/compile-latex/<job_id>', methods=['GET'])
+def get_compile_result(job_id: str):
+    """Poll a compile job; returns the PDF directly once it is done"""
+    try:
+        job = compile_jobs.get(job_id)
+        
+        if job is None:
+            return create_error_response('validation_error', 'Unknown or expired compile job', field='jobId', status_code=404)
+        
+        future = job['future']
+        if not future.done():
+            return jsonify({'status': 'pending'}), 202
+        
+        # Job finished: hand out the result exactly once
+        del compile_jobs[job_id]
         
         try:
-            # Generate PDF using pdfgenerator
-            pdf_bytes = pdfgenerator.generate_pdf(latex_code)
-            
-            # Convert PDF bytes to base64
-            pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
-            
-            compile_duration = time.time() - compile_start_time
-            logger.info(f"[COMPILE] LaTeX compilation successful - PDF size: {len(pdf_bytes)} bytes - Duration: {compile_duration:.2f}s")
-            
+            pdf_bytes = future.result()
+        except Exception as e:
+            return _compile_error_response(str(e))
+        
+        # Compatibility escape hatch for clients that still want the old
+        # JSON shape; the default path never pays the encode
+        if request.args.get('encoding') == 'base64':
             return jsonify({
-                'pdfData': pdf_base64,
+                'pdfData': base64.b64encode(pdf_bytes).decode('utf-8'),
                 'message': 'LaTeX compiled successfully'
             })
-            
-        except Exception as e:
-            compile_duration = time.time() - compile_start_time
-            error_message = str(e)
-            
-            # Check for specific error types
-            if 'pdflatex is not installed' in error_message:
-                logger.error(f"[COMPILE ERROR] pdflatex not installed - Duration: {compile_duration:.2f}s")
-                return create_error_response('system_error', 
-                    'LaTeX is not installed. Please install MiKTeX or TeX Live and ensure pdflatex is in your system PATH.', 
-                    status_code=503)
-            elif 'LaTeX compilation failed' in error_message:
-                logger.error(f"[COMPILE ERROR] LaTeX compilation failed: {error_message} - Duration: {compile_duration:.2f}s")
-                return create_error_response('compilation_error', error_message, status_code=422)
-            else:
-                logger.error(f"[COMPILE ERROR] Unexpected error: {error_message} - Duration: {compile_duration:.2f}s")
-                return create_error_response('compilation_error', f'Compilation failed: {error_message}', status_code=500)
+        
+        # Stream the PDF as-is - no base64 blow-up over the wire
+        return send_file(
+            io.BytesIO(pdf_bytes),
+            mimetype='application/pdf',
+            as_attachment=False,
+            download_name='resume.pdf'
+        )
         
     except Exception as e:
-        logger.error(f"Error in compile-latex endpoint: {e}")
-        return create_error_response('api_error', f"Compilation request failed: {str(e)}", status_code=500)
+        logger.error(f"Error in compile-latex result endpoint: {e}")
+        return create_error_response('api_error', f"Compilation result request failed: {str(e)}", status_code=500)
 
 
 @app.route('/api/preprocess-latex', methods=['POST'])
 def preprocess_latex_endpoint():
-    """Preprocess raw LaTeX code to fix common issues"""
+    """Preprocess raw LaTeX code to fix common issues
+
+    Deliberately synchronous, unlike compile-latex: preprocessing is
+    pure in-process string work that finishes in milliseconds, so the
+    submit-and-poll round-trip would cost more than it saves.
+    """
     try:
         data = request.get_json()
         
@@ -824,7 +1142,6 @@ def preprocess_latex_endpoint():
         
         try:
             # Preprocess LaTeX using latex_preprocessor
-            from Output.latex_preprocessor import preprocess_latex
             processed_latex = preprocess_latex(latex_code)
             
             preprocess_duration = time.time() - preprocess_start_time
@@ -897,26 +1214,34 @@ def filter_latex():
         data = request.get_json()
         
         # Validate required fields
+        # Presence-only check here: empty selections are legitimate
         required_fields = ['parsedData', 'selections']
-        for field in required_fields:
-            if field not in data:
-                return create_error_response('validation_error', f'Missing required field: {field}', field=field)
+        missing = [field for field in required_fields if field not in data]
+        if missing:
+            return create_error_response('validation_error', f'Missing required field: {missing[0]}', field=missing[0])
         
         parsed_data = data['parsedData']
         selections = data['selections']
-        
+
+        # Bind the nested dicts once instead of re-walking the lookup
+        # chain per log line
+        latex_blocks = parsed_data.get('latex_blocks', {})
+        sections = latex_blocks.get('sections', {})
+
         # Log filtering request
-        logger.info(f"[FILTER] LaTeX filtering requested - {len(selections)} section selections")
-        logger.info(f"[FILTER] Parsed data keys: {list(parsed_data.keys())}")
-        logger.info(f"[FILTER] Latex_blocks keys: {list(parsed_data.get('latex_blocks', {}).keys())}")
-        logger.info(f"[FILTER] Sections in latex_blocks: {list(parsed_data.get('latex_blocks', {}).get('sections', {}).keys())}")
-        logger.info(f"[FILTER] Selections: {selections}")
+        # Lazy %-style args: the view objects only render when INFO is
+        # actually emitted, and %s formats dict_keys without list() copies
+        logger.info("[FILTER] LaTeX filtering requested - %d section selections", len(selections))
+        logger.info("[FILTER] Parsed data keys: %s", parsed_data.keys())
+        logger.info("[FILTER] Latex_blocks keys: %s", latex_blocks.keys())
+        logger.info("[FILTER] Sections in latex_blocks: %s", sections.keys())
+        logger.info("[FILTER] Selections: %s", selections)
         
         try:
             # Generate filtered LaTeX
             filtered_latex = section_selector.generate_filtered_latex(parsed_data, selections)
             
-            logger.info(f"[FILTER] LaTeX filtering successful - Filtered code length: {len(filtered_latex)} characters")
+            logger.info("[FILTER] LaTeX filtering successful - Filtered code length: %d characters", len(filtered_latex))
             
             return jsonify({
                 'filteredLatex': filtered_latex,
@@ -933,17 +1258,188 @@ def filter_latex():
         return create_error_response('api_error', f"LaTeX filtering request failed: {str(e)}", status_code=500)
 
 
+# LLM responses keyed by a hash of everything that shapes the output:
+# extracted text, system prompt, template and model. A repeat request -
+# the same resume re-uploaded, or a retry after a client hiccup - is
+# answered from here without another multi-second, billed generation.
+# Bounded LRU like the upload store; entries also age out after a day
+# so prompt-file edits with an unchanged hash input can't linger forever
+_AI_CACHE_MAX_ITEMS = 32
+_AI_CACHE_TTL = 86400
+_ai_response_cache: 'OrderedDict[str, Tuple[float, str]]' = OrderedDict()
+_ai_response_cache_lock = threading.Lock()
+
+
+def _ai_response_cache_key(extracted_text: str, system_prompt: str,
+                           latex_template: str, model: str) -> str:
+    """Hash the inputs that determine an AI response into a cache key"""
+    hasher = hashlib.sha256()
+    for part in (extracted_text, system_prompt, latex_template, model):
+        hasher.update(part.encode('utf-8'))
+        hasher.update(b'\x00')
+    return hasher.hexdigest()
+
+
+def _ai_response_cache_get(cache_key: str) -> Optional[str]:
+    """Returns the cached LaTeX for this key, or None on miss/expiry"""
+    with _ai_response_cache_lock:
+        entry = _ai_response_cache.get(cache_key)
+        if entry is None:
+            return None
+        timestamp, latex_code = entry
+        if time.time() - timestamp > _AI_CACHE_TTL:
+            del _ai_response_cache[cache_key]
+            return None
+        _ai_response_cache.move_to_end(cache_key)
+        return latex_code
+
+
+def _ai_response_cache_put(cache_key: str, latex_code: str) -> None:
+    """Stores a fresh AI response, evicting the oldest entry when full"""
+    with _ai_response_cache_lock:
+        _ai_response_cache[cache_key] = (time.time(), latex_code)
+        _ai_response_cache.move_to_end(cache_key)
+        while len(_ai_response_cache) > _AI_CACHE_MAX_ITEMS:
+            _ai_response_cache.popitem(last=False)
+
+
+def _run_process_job(session_id: str, provider: str, model: str, api_key: str,
+                     template_id: str, file_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the extract/AI/preprocess pipeline on a worker thread"""
+    # Track total processing time
+    total_start_time = time.time()
+    
+    # Log AI request initiation with detailed info
+    logger.info("[AI REQUEST] Processing resume - Provider: %s, Model: %s, Template: %s, Session: %s..., File: %s (%d bytes)",
+                provider, model, template_id, session_id[:8], file_data['filename'], file_data['size'])
+    
+    # Extract text straight from the in-memory upload - no temp file
+    # write/read round-trip
+    logger.info("Extracting text from: %s", file_data['filename'])
+    extracted_text = upload_handler.extract_text_from_bytes(file_data['data'], file_data['filename'])
+    logger.info("[AI REQUEST] Text extraction completed - %d characters extracted from resume", len(extracted_text))
+    
+    # Load system prompt and template
+    system_prompt = load_system_prompt()
+    latex_template = load_latex_template(template_id)
+    
+    # Re-uploading the same resume with the same prompt, template and
+    # model is deterministic enough to serve from cache instead of
+    # paying for another generation
+    cache_key = _ai_response_cache_key(extracted_text, system_prompt, latex_template, model)
+    latex_code = _ai_response_cache_get(cache_key)
+
+    if latex_code is not None:
+        logger.info("[AI RESPONSE] Serving cached LaTeX code for %s/%s - Length: %d characters", provider, model, len(latex_code))
+    else:
+        # Get provider module and format resume
+        provider_module = get_provider_module(provider)
+        logger.info("[AI REQUEST] Calling %s API with model %s", provider, model)
+
+        # Track AI request timing
+        ai_start_time = time.time()
+        latex_code = provider_module.format_resume(
+            api_key=api_key,
+            model_name=model,
+            system_prompt=system_prompt,
+            latex_format=latex_template,
+            extracted_text=extracted_text
+        )
+        ai_duration = time.time() - ai_start_time
+
+        # Log successful AI response with timing
+        logger.info("[AI RESPONSE] Successfully received LaTeX code from %s/%s - Length: %d characters - Duration: %.2fs",
+                    provider, model, len(latex_code), ai_duration)
+
+        _ai_response_cache_put(cache_key, latex_code)
+    
+    processed_latex_code = _finalize_ai_response(latex_code, session_id)
+    
+    # Log final success summary
+    total_duration = time.time() - total_start_time
+    logger.info("[AI RESPONSE] Resume processing completed successfully - Total time: %.2fs", total_duration)
+    logger.info("Resume processed successfully")
+    return {
+        'rawLatexCode': latex_code,
+        'processedLatexCode': processed_latex_code,
+        'message': 'Resume processed successfully'
+    }
+
+
+def _finalize_ai_response(latex_code: str, session_id: str) -> Optional[str]:
+    """Log, preprocess and validate a finished AI response.
+    
+    Returns the preprocessed LaTeX, or None when preprocessing failed
+    (the raw response is still usable); raises when the response has no
+    valid document class.
+    """
+    # Hand the AI response off to the debug-log writer thread; the write
+    # happens off the response path
+    try:
+        logs_dir = Path(__file__).parent / "logs"
+        logs_dir.mkdir(exist_ok=True)
+
+        # session prefix + nanosecond clock: unique without the strftime
+        # formatting, and two jobs in the same second can't collide
+        log_filename = f"ai_response_{session_id[:8]}_{time.time_ns()}.tex"
+
+        _debug_log_queue.put((logs_dir / log_filename, latex_code))
+
+    except Exception as log_error:
+        logger.warning(f"[AI LOG WARNING] Failed to queue AI response log: {log_error}")
+    
+    # Validate the document class declaration (on raw code) before
+    # spending time on preprocessing; the regex also covers the plain
+    # missing-\documentclass case
+    if not _DOCCLASS_RE.search(latex_code):
+        logger.error("[VALIDATION ERROR] Malformed or missing document class in LaTeX code")
+        raise Exception("LaTeX code has malformed or missing document class declaration")
+
+    # Preprocess inline: this helper already runs on a process_executor
+    # worker, so submitting preprocessing back to the same pool would
+    # deadlock once all workers are busy jobs awaiting nested futures
+    processed_latex_code = None
+    try:
+        processed_latex_code = preprocess_latex(latex_code)
+        logger.info("[PREPROCESS] LaTeX preprocessing completed successfully - Length: %d characters", len(processed_latex_code))
+    except Exception as e:
+        logger.warning(f"[PREPROCESS WARNING] LaTeX preprocessing failed: {e} - Will return raw response")
+        # Continue without processed version if preprocessing fails
+
+    return processed_latex_code
+
+
+def _process_error_response(provider: str, model: str, error: Exception):
+    """Map a processing failure to the standard error response"""
+    if isinstance(error, ValueError):
+        logger.error(f"Validation error in process endpoint: {error}")
+        return create_error_response('validation_error', str(error), status_code=400)
+    
+    error_message = str(error)
+    
+    # Check for specific error types
+    if 'Authentication Error' in error_message:
+        logger.error(f"[AI ERROR] Authentication failed for {provider}/{model}: {error_message}")
+        return create_error_response('api_error', error_message, field='apiKey', status_code=401)
+    elif 'Rate Limit Error' in error_message:
+        logger.error(f"[AI ERROR] Rate limit exceeded for {provider}/{model}: {error_message}")
+        return create_error_response('api_error', error_message, status_code=429)
+    else:
+        logger.error(f"[AI ERROR] Processing failed for {provider}/{model}: {error_message}")
+        return create_error_response('processing_error', error_message, status_code=500)
+
+
 @app.route('/api/process', methods=['POST'])
 def process_resume():
-    """Process resume with selected template and AI model"""
+    """Submit a resume for background processing, returning a job id"""
     try:
         data = request.get_json()
         
         # Validate required fields
         required_fields = ['sessionId', 'provider', 'model', 'apiKey', 'templateId']
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return create_error_response('validation_error', f'Missing required field: {field}', field=field)
+        missing = [field for field in required_fields if not data.get(field)]
+        if missing:
+            return create_error_response('validation_error', f'Missing required field: {missing[0]}', field=missing[0])
         
         session_id = data['sessionId']
         provider = data['provider']
@@ -957,133 +1453,267 @@ def process_resume():
         if not is_complete:
             return create_error_response('config_error', validation_message, status_code=400)
         
-        # Retrieve file from memory
+        # Retrieve (and remove) file from memory - each upload is
+        # processed once, so consuming it frees the buffer immediately
         try:
-            file_data = get_file_from_memory(session_id)
+            file_data = file_storage.consume(session_id)
         except KeyError:
             return create_error_response('validation_error', 'Session expired or invalid', field='sessionId')
         
-        # Track total processing time
-        total_start_time = time.time()
+        # Submit the pipeline to the processing pool and return right
+        # away; the client polls /api/process/<job_id> for the result
+        job_id = str(uuid.uuid4())
+        process_jobs[job_id] = {
+            'future': process_executor.submit(
+                _run_process_job, session_id, provider, model, api_key,
+                template_id, file_data),
+            'timestamp': time.time(),
+            'provider': provider,
+            'model': model
+        }
+        
+        return jsonify({
+            'jobId': job_id,
+            'message': 'Resume processing started'
+        }), 202
+        
+    except Exception as e:
+        logger.error(f"Error in process endpoint: {e}")
+        return create_error_response('api_error', f"Processing request failed: {str(e)}", status_code=500)
+
+
+@app.route('/api/process/<job_id>', methods=['GET'])
+def get_process_result(job_id: str):
+    """Poll a processing job; returns the result JSON once it is done"""
+    try:
+        job = process_jobs.get(job_id)
+        
+        if job is None:
+            return create_error_response('validation_error', 'Unknown or expired processing job', field='jobId', status_code=404)
         
-        # Log AI request initiation with detailed info
-        logger.info(f"[AI REQUEST] Processing resume - Provider: {provider}, Model: {model}, Template: {template_id}, Session: {session_id[:8]}..., File: {file_data['filename']} ({file_data['size']} bytes)")
+        future = job['future']
+        if not future.done():
+            return jsonify({'status': 'pending'}), 202
         
-        # Create temporary file for upload_handler
-        temp_file_path = backend_dir / 'temp' / f'{session_id}_{file_data["filename"]}'
-        temp_file_path.parent.mkdir(exist_ok=True)
+        # Job finished: hand out the result exactly once
+        del process_jobs[job_id]
         
-        with open(temp_file_path, 'wb') as f:
-            f.write(file_data['data'])
+        try:
+            result = future.result()
+        except Exception as e:
+            return _process_error_response(job['provider'], job['model'], e)
         
+        return jsonify(result)
+        
+    except Exception as e:
+        logger.error(f"Error in process result endpoint: {e}")
+        return create_error_response('api_error', f"Processing result request failed: {str(e)}", status_code=500)
+
+
+@app.route('/api/process-stream', methods=['POST'])
+def process_resume_stream():
+    """Process a resume, streaming LaTeX chunks back over SSE"""
+    # Guard the pre-stream phase like the sibling endpoints do: a
+    # missing or null JSON body must produce the JSON error envelope,
+    # not werkzeug's HTML error page
+    try:
+        data = request.get_json()
+
+        # Validate required fields
+        required_fields = ['sessionId', 'provider', 'model', 'apiKey', 'templateId']
+        missing = [field for field in required_fields if not data.get(field)]
+        if missing:
+            return create_error_response('validation_error', f'Missing required field: {missing[0]}', field=missing[0])
+
+        session_id = data['sessionId']
+        provider = data['provider']
+        model = data['model']
+        api_key = data['apiKey']
+        template_id = data['templateId']
+
+        # Validate configuration completeness
+        config = {'provider': provider, 'model': model, 'apiKey': api_key}
+        is_complete, validation_message = validate_config_complete(config)
+        if not is_complete:
+            return create_error_response('config_error', validation_message, status_code=400)
+
+        # Retrieve (and remove) file from memory
+        try:
+            file_data = file_storage.consume(session_id)
+        except KeyError:
+            return create_error_response('validation_error', 'Session expired or invalid', field='sessionId')
+
+    except Exception as e:
+        logger.error(f"Error in process-stream endpoint: {e}")
+        return create_error_response('api_error', f"Streaming request failed: {str(e)}", status_code=500)
+
+    def generate():
+        """Relay provider chunks as SSE; terminal event carries the result"""
         try:
-            # Extract text from file
-            logger.info(f"Extracting text from: {file_data['filename']}")
-            extracted_text = upload_handler.extract_text_from_file(str(temp_file_path))
-            logger.info(f"[AI REQUEST] Text extraction completed - {len(extracted_text)} characters extracted from resume")
+            logger.info(f"[AI REQUEST] Streaming resume processing - Provider: {provider}, Model: {model}, Template: {template_id}, Session: {session_id[:8]}...")
             
-            # Load system prompt and template
+            extracted_text = upload_handler.extract_text_from_bytes(file_data['data'], file_data['filename'])
             system_prompt = load_system_prompt()
             latex_template = load_latex_template(template_id)
-            
-            # Get provider module and format resume
             provider_module = get_provider_module(provider)
-            logger.info(f"[AI REQUEST] Calling {provider} API with model {model}")
             
-            # Track AI request timing
-            ai_start_time = time.time()
-            latex_code = provider_module.format_resume(
+            # Relay each token chunk as it arrives while accumulating the
+            # full response for the finalize step
+            chunks = []
+            for chunk in provider_module.format_resume_stream(
                 api_key=api_key,
                 model_name=model,
                 system_prompt=system_prompt,
                 latex_format=latex_template,
                 extracted_text=extracted_text
-            )
-            ai_duration = time.time() - ai_start_time
-            
-            # Log successful AI response with timing
-            logger.info(f"[AI RESPONSE] Successfully received LaTeX code from {provider}/{model} - Length: {len(latex_code)} characters - Duration: {ai_duration:.2f}s")
-            
-            # Save AI response to log file for debugging
-            try:
-                from datetime import datetime
-                logs_dir = Path(__file__).parent / "logs"
-                logs_dir.mkdir(exist_ok=True)
-                
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                log_filename = f"ai_response_{timestamp}.tex"
-                log_file_path = logs_dir / log_filename
-                
-                with open(log_file_path, 'w', encoding='utf-8') as f:
-                    f.write(latex_code)
-                
-                logger.info(f"[AI LOG] Saved AI response to: {log_file_path}")
-                
-            except Exception as log_error:
-                logger.warning(f"[AI LOG WARNING] Failed to save AI response log: {log_error}")
-            
-            # Store raw AI response
-            raw_latex_code = latex_code
-            
-            # Preprocess the AI-generated LaTeX code
-            processed_latex_code = None
-            try:
-                from Output.latex_preprocessor import preprocess_latex
-                processed_latex_code = preprocess_latex(latex_code)
-                logger.info(f"[PREPROCESS] LaTeX preprocessing completed successfully - Length: {len(processed_latex_code)} characters")
-            except Exception as e:
-                logger.warning(f"[PREPROCESS WARNING] LaTeX preprocessing failed: {e} - Will return raw response")
-                # Continue without processed version if preprocessing fails
-            
-            # Additional validation for document class issues (on raw code)
-            if r'\documentclass' not in raw_latex_code:
-                logger.error("[VALIDATION ERROR] No document class found in LaTeX code")
-                raise Exception("LaTeX code is missing document class declaration")
-            
-            # Check for malformed document class
-            import re
-            docclass_match = re.search(r'\\documentclass(?:\[[^\]]*\])?\{[^}]+\}', raw_latex_code)
-            if not docclass_match:
-                logger.error("[VALIDATION ERROR] Malformed document class in LaTeX code")
-                raise Exception("LaTeX code has malformed document class declaration")
+            ):
+                chunks.append(chunk)
+                yield f"data: {json.dumps({'chunk': chunk})}\n\n"
             
-            # Clean up temporary file
-            temp_file_path.unlink()
-            
-            # Log final success summary
-            total_duration = time.time() - total_start_time
-            logger.info(f"[AI RESPONSE] Resume processing completed successfully - Total time: {total_duration:.2f}s")
-            logger.info("Resume processed successfully")
-            return jsonify({
+            raw_latex_code = ''.join(chunks)
+
+            # Two-phase finish: hand the raw code over the moment
+            # generation ends, so the UI can render it while the
+            # log/preprocess/validate step still runs
+            yield f"event: raw\ndata: {json.dumps({'rawLatexCode': raw_latex_code})}\n\n"
+
+            processed_latex_code = _finalize_ai_response(raw_latex_code, session_id)
+
+            payload = {
                 'rawLatexCode': raw_latex_code,
                 'processedLatexCode': processed_latex_code,
                 'message': 'Resume processed successfully'
-            })
+            }
+            yield f"event: done\ndata: {json.dumps(payload)}\n\n"
             
         except Exception as e:
-            # Clean up temporary file on error
-            if temp_file_path.exists():
-                temp_file_path.unlink()
-            raise e
-        
-    except ValueError as e:
-        logger.error(f"Validation error in process endpoint: {e}")
-        return create_error_response('validation_error', str(e), status_code=400)
+            logger.error(f"[AI ERROR] Streaming processing failed for {provider}/{model}: {e}")
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
     
+    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+
+
+@app.route('/api/process-batch', methods=['POST'])
+def process_resume_batch():
+    """Submit several uploaded resumes for processing in one request"""
+    try:
+        data = request.get_json()
+        
+        # Validate required fields
+        required_fields = ['provider', 'model', 'apiKey', 'items']
+        missing = [field for field in required_fields if not data.get(field)]
+        if missing:
+            return create_error_response('validation_error', f'Missing required field: {missing[0]}', field=missing[0])
+        
+        provider = data['provider']
+        model = data['model']
+        api_key = data['apiKey']
+        items = data['items']
+        
+        if not isinstance(items, list) or not items:
+            return create_error_response('validation_error', 'items must be a non-empty list', field='items')
+        
+        # Validate configuration completeness
+        config = {'provider': provider, 'model': model, 'apiKey': api_key}
+        is_complete, validation_message = validate_config_complete(config)
+        if not is_complete:
+            return create_error_response('config_error', validation_message, status_code=400)
+        
+        # Validate every item before consuming anything: consume() pops
+        # the upload, so rejecting mid-loop would destroy the earlier
+        # items' files and orphan their already-submitted jobs
+        for item in items:
+            if not item.get('sessionId') or not item.get('templateId'):
+                return create_error_response('validation_error', 'Each item needs sessionId and templateId', field='items')
+
+        # Fan the items out over the processing pool; each keeps its own
+        # future so one failed resume never sinks the rest
+        batch_items = {}
+        for item in items:
+            session_id = item['sessionId']
+            template_id = item['templateId']
+
+            try:
+                file_data = file_storage.consume(session_id)
+            except KeyError:
+                batch_items[session_id] = {'future': None, 'error': 'Session expired or invalid'}
+                continue
+
+            batch_items[session_id] = {
+                'future': process_executor.submit(
+                    _run_process_job, session_id, provider, model, api_key,
+                    template_id, file_data),
+                'error': None
+            }
+        
+        batch_id = str(uuid.uuid4())
+        batch_jobs[batch_id] = {
+            'items': batch_items,
+            'timestamp': time.time(),
+            'provider': provider,
+            'model': model
+        }
+        
+        logger.info(f"[AI REQUEST] Batch processing started - {len(batch_items)} resumes, Provider: {provider}, Model: {model}")
+        return jsonify({
+            'batchId': batch_id,
+            'count': len(batch_items),
+            'message': 'Batch processing started'
+        }), 202
+        
     except Exception as e:
-        logger.error(f"Error in process endpoint: {e}")
-        error_message = str(e)
-        
-        # Check for specific error types
-        if 'Authentication Error' in error_message:
-            logger.error(f"[AI ERROR] Authentication failed for {provider}/{model}: {error_message}")
-            return create_error_response('api_error', error_message, field='apiKey', status_code=401)
-        elif 'Rate Limit Error' in error_message:
-            logger.error(f"[AI ERROR] Rate limit exceeded for {provider}/{model}: {error_message}")
-            return create_error_response('api_error', error_message, status_code=429)
-        else:
-            logger.error(f"[AI ERROR] Processing failed for {provider}/{model}: {error_message}")
-            return create_error_response('processing_error', error_message, status_code=500)
+        logger.error(f"Error in process-batch endpoint: {e}")
+        return create_error_response('api_error', f"Batch processing request failed: {str(e)}", status_code=500)
+
+
+@app.route('/api/process-batch/<batch_id>', methods=['GET'])
+def get_batch_results(batch_id: str):
+    """Poll a batch; per-resume results are keyed by session id"""
+    try:
+        batch = batch_jobs.get(batch_id)
+        
+        if batch is None:
+            return create_error_response('validation_error', 'Unknown or expired batch job', field='batchId', status_code=404)
+        
+        results = {}
+        all_done = True
+        for session_id, item in batch['items'].items():
+            future = item['future']
+            if future is None:
+                results[session_id] = {'status': 'error', 'error': item['error']}
+            elif not future.done():
+                results[session_id] = {'status': 'pending'}
+                all_done = False
+            else:
+                try:
+                    results[session_id] = {'status': 'done', 'result': future.result()}
+                except Exception as e:
+                    results[session_id] = {'status': 'error', 'error': str(e)}
+        
+        if all_done:
+            # Every result delivered in this response - drop the batch
+            del batch_jobs[batch_id]
+        
+        return jsonify({
+            'batchId': batch_id,
+            'complete': all_done,
+            'results': results
+        }), (200 if all_done else 202)
+        
+    except Exception as e:
+        logger.error(f"Error in process-batch result endpoint: {e}")
+        return create_error_response('api_error', f"Batch result request failed: {str(e)}", status_code=500)
+
+
+@app.errorhandler(RequestEntityTooLarge)
+def request_too_large(error):
+    """Handle uploads rejected by MAX_CONTENT_LENGTH"""
+    return create_error_response(
+        'validation_error',
+        'File size exceeds 20MB limit. Please upload a smaller file',
+        field='file',
+        status_code=413
+    )
 
 
 @app.errorhandler(404)
@@ -1098,7 +1728,22 @@ def internal_error(error):
     return create_error_response('api_error', 'Internal server error', status_code=500)
 
 
-if __name__ == '__main__':
+_workers_started = False
+_workers_lock = threading.Lock()
+
+def start_background_workers() -> None:
+    """Start the cleanup and cache-prewarm threads (idempotent).
+    
+    Called from __main__ on direct launch and from wsgi.py when an
+    external WSGI server imports the app, so the job tables and temp
+    directory get pruned either way.
+    """
+    global _workers_started
+    with _workers_lock:
+        if _workers_started:
+            return
+        _workers_started = True
+    
     # Create temp directory if it doesn't exist
     temp_dir = backend_dir / 'temp'
     temp_dir.mkdir(exist_ok=True)
@@ -1108,6 +1753,15 @@ if __name__ == '__main__':
     cleanup_thread.start()
     logger.info("Started cleanup worker thread")
     
+    # Warm the prompt/template caches off the startup path so the first
+    # AI request doesn't pay the disk reads
+    prewarm_thread = threading.Thread(target=_prewarm_caches, daemon=True)
+    prewarm_thread.start()
+
+
+if __name__ == '__main__':
+    start_background_workers()
+    
     # Print startup banner
     print("\n" + "="*80)
     print("RESUMAX BACKEND SERVER STARTING")
@@ -1124,13 +1778,27 @@ if __name__ == '__main__':
     logger.info("Server will run on http://localhost:54782")
     
     try:
-        app.run(
-            host='localhost',
-            port=54782,
-            debug=False,  # Set to False for production
-            threaded=True,
-            use_reloader=False  # Disable reloader to prevent multiple processes
-        )
+        # Prefer waitress when available: a real threaded WSGI server, so
+        # concurrent requests (preconnects, /api/providers + /api/init,
+        # polling during a long compile) don't serialize behind each
+        # other. The Flask dev server with threaded=True stays as the
+        # fallback for environments without waitress
+        try:
+            from waitress import serve
+        except ImportError:
+            serve = None
+        
+        if serve is not None:
+            logger.info("Serving with waitress (16 threads)")
+            serve(app, host='localhost', port=54782, threads=16)
+        else:
+            app.run(
+                host='localhost',
+                port=54782,
+                debug=False,  # Set to False for production
+                threaded=True,
+                use_reloader=False  # Disable reloader to prevent multiple processes
+            )
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt, shutting down...")
     except Exception as e:
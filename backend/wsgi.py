@@ -0,0 +1,21 @@
+"""
+WSGI entry point for Resumax Backend Server
+
+Exposes the Flask application for external WSGI servers, e.g.:
+
+    waitress-serve --listen=localhost:54782 wsgi:application
+    gunicorn -w 1 --threads 16 -b localhost:54782 wsgi:application
+
+Running main.py directly remains the normal path for the packaged app
+(it serves with waitress itself); this module exists for deployments
+that want to pick their own server. Keep workers at 1: the upload
+store, job tables and caches are in-process, so multiple worker
+processes would not share state.
+"""
+
+from main import app as application, start_background_workers
+
+# main.py only starts its maintenance threads under __main__, so an
+# external server importing the app would never prune the job tables
+# or temp files; start them here (the call is idempotent)
+start_background_workers()